@@ -0,0 +1,110 @@
+import hashlib
+import os
+import pickle
+import zlib
+from pathlib import Path
+from typing import Any
+
+from app.model import TableSpec, load_specs_pickle
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ddl2excel"
+)
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_SUFFIX = ".bin"
+# 파일 해시 계산 시 한 번에 읽는 크기 (--stream 메모리 상한 유지)
+HASH_CHUNK_SIZE = 1 << 20
+
+
+class ParseCache:
+    """
+    파싱 결과 디스크 캐시. 키: 파일 내용 해시 + 파서 버전 + 파싱 옵션.
+    값은 pickle + zlib 압축, 크기 초과 시 최근 사용(mtime) 오래된 순으로 삭제 (LRU).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _digest(**options: Any):
+        # 파서 모듈(정규식 컴파일)은 실제로 파싱/캐시 조회할 때만 import
+        from app.parser import PARSER_VERSION
+
+        digest = hashlib.sha256()
+        digest.update(f"{PARSER_VERSION}|{sorted(options.items())}|".encode())
+        return digest
+
+    def make_key(self, content: bytes, **options: Any) -> str:
+        digest = self._digest(**options)
+        digest.update(content)
+        return digest.hexdigest()
+
+    def file_key(self, file_path: Path, **options: Any) -> str:
+        """make_key(파일 내용) 과 같은 키 (파일 전체를 메모리에 읽지 않고 청크 단위 해시)"""
+        digest = self._digest(**options)
+        with file_path.open("rb") as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> list | None:
+        entry_path = self._entry_path(key)
+        try:
+            data = entry_path.read_bytes()
+            tables = load_specs_pickle(zlib.decompress(data))
+            if not isinstance(tables, list) or not all(
+                isinstance(table_spec, TableSpec) for table_spec in tables
+            ):
+                return None
+            entry_path.touch()  # LRU: 사용 시각 갱신
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 손상된 캐시 / 모델 클래스 외 객체가 든 캐시는 무시하고 다시 파싱
+            return None
+        return tables
+
+    def put(self, key: str, tables: list):
+        entry_path = self._entry_path(key)
+        data = zlib.compress(pickle.dumps(tables, protocol=pickle.HIGHEST_PROTOCOL))
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(entry_path)
+        except OSError:
+            # 캐시 저장 실패는 변환 결과에 영향 없음
+            return
+
+    def evict(self):
+        """전체 크기가 max_bytes 를 넘으면 오래된 항목부터 삭제"""
+        if not self.cache_dir.is_dir():
+            return
+        entries = []
+        total = 0
+        for entry_path in self.cache_dir.glob(f"*/*{CACHE_SUFFIX}"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _mtime, size, entry_path in sorted(entries):
+            try:
+                entry_path.unlink(missing_ok=True)
+            except OSError:
+                # 동시 실행 / 읽기 전용 캐시 디렉토리 등: 캐시는 선택 사항이므로 건너뜀
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
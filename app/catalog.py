@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+
+from app.model import ColumnSpec, TableSpec
+from app.parser import qualified_key
+
+# serial 계열은 참조하는 쪽에서 정수 타입으로 씀 (타입 비교용)
+SERIAL_TYPES = {"smallserial": "smallint", "serial": "integer", "bigserial": "bigint"}
+
+
+def normalized_type(type_str: str) -> str:
+    """참조 컬럼과 타입 비교용 (대소문자/공백 무시, serial → 정수 타입)"""
+    normalized = " ".join(type_str.lower().split())
+    return SERIAL_TYPES.get(normalized, normalized)
+
+
+@dataclass(slots=True, frozen=True)
+class DanglingReference:
+    """참조 대상 테이블 또는 컬럼을 어느 입력 파일에서도 찾지 못한 FK"""
+
+    source: str
+    table_name: str
+    column_name: str
+    ref_table: str
+    ref_column: str | None
+
+    def __str__(self) -> str:
+        target = self.ref_table + (f".{self.ref_column}" if self.ref_column else "")
+        return f"{self.source}: {self.table_name}.{self.column_name} → {target}"
+
+
+class SchemaCatalog:
+    """
+    전체 입력 파일의 테이블/컬럼 해시 인덱스 (파싱 후 한 번 생성).
+    테이블은 스키마.테이블, 컬럼은 (스키마.테이블, 컬럼) 키로 O(1) 조회.
+    파일을 넘나드는 FK 참조 확인, 참조 컬럼 생략(REFERENCES users) 시 PK 컬럼 결정,
+    엑셀 작성 시 참조 컬럼 타입 표시에 사용. 테이블 스펙은 수정하지 않음.
+    같은 테이블이 여러 번 정의되면 먼저 나온 정의 사용.
+    """
+
+    def __init__(self, table_spec_dict: dict[str, list[TableSpec]]):
+        self.tables: dict[str, TableSpec] = {}
+        self.sources: dict[str, str] = {}
+        self.columns: dict[tuple[str, str], ColumnSpec] = {}
+        # 단일 컬럼 PK (참조 컬럼을 생략한 FK 의 대상)
+        self.primary_keys: dict[str, ColumnSpec] = {}
+        for source, table_list in table_spec_dict.items():
+            for table_spec in table_list:
+                key = qualified_key(table_spec.table_name)
+                if key in self.tables:
+                    continue
+                self.tables[key] = table_spec
+                self.sources[key] = source
+                pk_columns = []
+                for column_spec in table_spec.columns:
+                    self.columns[key, column_spec.column_name.lower()] = column_spec
+                    if column_spec.pk:
+                        pk_columns.append(column_spec)
+                if len(pk_columns) == 1:
+                    self.primary_keys[key] = pk_columns[0]
+
+    def table(self, table_name: str) -> TableSpec | None:
+        return self.tables.get(qualified_key(table_name))
+
+    def column(self, table_name: str, column_name: str) -> ColumnSpec | None:
+        return self.columns.get((qualified_key(table_name), column_name.lower()))
+
+    def referenced_column(self, column_spec: ColumnSpec) -> ColumnSpec | None:
+        """FK 컬럼이 참조하는 컬럼 (참조 컬럼 생략 시 대상 테이블의 단일 컬럼 PK)"""
+        if not column_spec.ref_table:
+            return None
+        key = qualified_key(column_spec.ref_table)
+        if column_spec.ref_column is None:
+            return self.primary_keys.get(key)
+        return self.columns.get((key, column_spec.ref_column.lower()))
+
+    def is_dangling(self, column_spec: ColumnSpec) -> bool:
+        """
+        참조 대상을 찾지 못한 FK 인지 여부.
+        참조 컬럼 생략 + 대상 PK 가 복합 키인 경우는 테이블만 있으면 정상으로 봄
+        """
+        if not column_spec.ref_table:
+            return False
+        key = qualified_key(column_spec.ref_table)
+        if key not in self.tables:
+            return True
+        if column_spec.ref_column is None:
+            return False
+        return (key, column_spec.ref_column.lower()) not in self.columns
+
+    def dangling_references(self) -> list[DanglingReference]:
+        """전체 FK 중 참조 대상이 없는 것 (입력 순서)"""
+        dangling = []
+        for key, table_spec in self.tables.items():
+            for column_spec in table_spec.columns:
+                if self.is_dangling(column_spec):
+                    dangling.append(
+                        DanglingReference(
+                            self.sources[key],
+                            table_spec.table_name,
+                            column_spec.column_name,
+                            column_spec.ref_table,
+                            column_spec.ref_column,
+                        )
+                    )
+        return dangling
+
+    def subset(self, table_specs: list[TableSpec]) -> "SchemaCatalog":
+        """
+        table_specs 의 FK 참조 표시에 필요한 항목만 담은 카탈로그 (--shard-size 워커 전달용,
+        샤드마다 전체 카탈로그를 pickle 하지 않도록). 참조 대상 테이블은 이름만 보관하므로
+        referenced_column / is_dangling 만 전체 카탈로그와 같은 결과
+        """
+        sub = SchemaCatalog({})
+        for table_spec in table_specs:
+            for column_spec in table_spec.columns:
+                if not column_spec.ref_table:
+                    continue
+                key = qualified_key(column_spec.ref_table)
+                target_table = self.tables.get(key)
+                if target_table is None:
+                    continue
+                if key not in sub.tables:
+                    sub.tables[key] = TableSpec(table_name=target_table.table_name)
+                    sub.sources[key] = self.sources[key]
+                    if key in self.primary_keys:
+                        sub.primary_keys[key] = self.primary_keys[key]
+                if column_spec.ref_column is not None:
+                    column_key = (key, column_spec.ref_column.lower())
+                    if column_key in self.columns:
+                        sub.columns[column_key] = self.columns[column_key]
+        return sub
+
+    def reference_state(self, table_specs: list[TableSpec]) -> list:
+        """
+        시트에 표시되는 참조 정보 (증분 빌드 해시용): FK 컬럼마다
+        [컬럼, 참조 컬럼명, 참조 컬럼 타입 (대상이 없으면 None), 참조 대상 없음 여부].
+        다른 시트의 참조 대상 컬럼이 바뀌면 이 시트도 다시 작성되도록 함
+        """
+        state = []
+        for table_spec in table_specs:
+            for column_spec in table_spec.columns:
+                if not column_spec.ref_table:
+                    continue
+                target = self.referenced_column(column_spec)
+                state.append(
+                    [
+                        column_spec.column_name,
+                        target.column_name if target else None,
+                        target.type if target else None,
+                        self.is_dangling(column_spec),
+                    ]
+                )
+        return state
+
+
+class ReferenceIndex:
+    """
+    --pipeline 용 참조 확인: 테이블 스펙을 보관하지 않고 테이블/컬럼 키와 FK 만 모아
+    모든 테이블이 지나간 뒤 참조 대상이 없는 FK 확인 (SchemaCatalog 와 같은 기준)
+    """
+
+    def __init__(self):
+        self.table_keys: set[str] = set()
+        self.column_keys: set[tuple[str, str]] = set()
+        self.references: list[DanglingReference] = []
+
+    def add(self, source: str, table_spec: TableSpec):
+        key = qualified_key(table_spec.table_name)
+        if key in self.table_keys:
+            return
+        self.table_keys.add(key)
+        for column_spec in table_spec.columns:
+            self.column_keys.add((key, column_spec.column_name.lower()))
+            if column_spec.ref_table:
+                self.references.append(
+                    DanglingReference(
+                        source,
+                        table_spec.table_name,
+                        column_spec.column_name,
+                        column_spec.ref_table,
+                        column_spec.ref_column,
+                    )
+                )
+
+    def dangling_references(self) -> list[DanglingReference]:
+        dangling = []
+        for reference in self.references:
+            key = qualified_key(reference.ref_table)
+            if key not in self.table_keys or (
+                reference.ref_column is not None
+                and (key, reference.ref_column.lower()) not in self.column_keys
+            ):
+                dangling.append(reference)
+        return dangling
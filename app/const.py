@@ -1,24 +1,73 @@
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-
 BASE_ROW = 4
 BASE_COL = 2
 
-FILL_YELLOW = PatternFill("solid", fgColor="FFF000")
-FILL_GRAY = PatternFill("solid", fgColor="E6E6E6")
-FILL_HEADER = PatternFill("solid", fgColor="C0C0C0")
-FILL_WHITE = PatternFill("solid", fgColor="FFFFFF")
 
-BORDER_THIN = Border(
-    left=Side(style="thin"),
-    right=Side(style="thin"),
-    top=Side(style="thin"),
-    bottom=Side(style="thin"),
+def _build_styles() -> dict:
+    """
+    스타일 객체 (FILL_*, BORDER_THIN, *_ALIGN, *_FONT).
+    openpyxl import 가 무거워 --help / 인자 오류 / 입력 없음 경로에서는 만들지 않고
+    처음 접근할 때 (엑셀 작성 단계) 한 번만 생성.
+    """
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+    return {
+        "FILL_YELLOW": PatternFill("solid", fgColor="FFF000"),
+        "FILL_GRAY": PatternFill("solid", fgColor="E6E6E6"),
+        "FILL_HEADER": PatternFill("solid", fgColor="C0C0C0"),
+        "FILL_WHITE": PatternFill("solid", fgColor="FFFFFF"),
+        "BORDER_THIN": Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin"),
+        ),
+        "CENTER_ALIGN": Alignment(
+            horizontal="center", vertical="center", wrap_text=True
+        ),
+        "LEFT_ALIGN": Alignment(horizontal="left", vertical="center", wrap_text=True),
+        "BOLD_FONT": Font(bold=True),
+        "BOLD_LARGE_FONT": Font(bold=True, size=13),
+        "LINK_FONT": Font(color="0563C1", underline="single"),
+    }
+
+
+_STYLE_NAMES = frozenset(
+    {
+        "FILL_YELLOW",
+        "FILL_GRAY",
+        "FILL_HEADER",
+        "FILL_WHITE",
+        "BORDER_THIN",
+        "CENTER_ALIGN",
+        "LEFT_ALIGN",
+        "BOLD_FONT",
+        "BOLD_LARGE_FONT",
+        "LINK_FONT",
+    }
 )
 
-CENTER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
-LEFT_ALIGN = Alignment(horizontal="left", vertical="center", wrap_text=True)
-BOLD_FONT = Font(bold=True)
-BOLD_LARGE_FONT = Font(bold=True, size=13)
+
+def __getattr__(name: str):
+    """스타일 상수 지연 생성 (생성 후에는 모듈 전역에 저장되어 이후 접근은 일반 조회)"""
+    if name in _STYLE_NAMES:
+        globals().update(_build_styles())
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# sheet: 테이블마다 시트, file: 입력 파일마다 시트, single: 전체를 시트 하나에
+SHEET_LAYOUTS = ("sheet", "file", "single")
+WRITER_ENGINES = ("openpyxl", "stream")
+# --format: xlsx (스타일 적용 명세서) 또는 컬럼 표만 쓰는 가벼운 텍스트 형식
+OUTPUT_FORMATS = ("xlsx", "csv", "md", "html")
+# --format auto: 출력 파일 확장자 → 형식 (그 외 확장자는 xlsx)
+OUTPUT_FORMAT_SUFFIXES = {
+    ".csv": "csv",
+    ".md": "md",
+    ".markdown": "md",
+    ".html": "html",
+    ".htm": "html",
+}
 
 
 META_FIELDS_KO = [
@@ -129,3 +178,19 @@ DATA_PERIOD_HEADERS_EN = [
 
 TABLE_SPEC_TITLE_KO = "테이블 명세서"
 TABLE_SPEC_TITLE_EN = "Table Specification"
+
+# --layout file/single: 시트 상단 목차
+TOC_TITLE_KO = "목차"
+TOC_TITLE_EN = "Contents"
+TOC_HEADERS_KO = ["번호", "테이블명", "상세설명"]
+TOC_HEADERS_EN = ["no", "Table Name", "Description"]
+
+# 컬럼 비고: 참조 컬럼 타입이 다를 때 / 참조 대상을 찾지 못했을 때
+REF_TYPE_NOTE_KO = "참조 타입: {}"
+REF_TYPE_NOTE_EN = "Ref type: {}"
+REF_DANGLING_NOTE_KO = "참조 대상 없음"
+REF_DANGLING_NOTE_EN = "Unresolved reference"
+
+# --format csv: 테이블명 앞 입력 파일 열
+SOURCE_HEADER_KO = "파일"
+SOURCE_HEADER_EN = "File"
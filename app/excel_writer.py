@@ -1,10 +1,18 @@
-import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
 
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import Cell
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils import get_column_letter, quote_sheetname
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.worksheet.merge import MergedCellRange
+from openpyxl.worksheet.worksheet import Worksheet
 
+from app.catalog import SchemaCatalog
 from app.const import (
     BASE_COL,
     BASE_ROW,
@@ -23,18 +31,31 @@ from app.const import (
     INDEX_HEADERS_EN,
     INDEX_HEADERS_KO,
     LEFT_ALIGN,
+    LINK_FONT,
     META_FIELDS_EN,
     META_FIELDS_KO,
+    SHEET_LAYOUTS,
     TABLE_SPEC_TITLE_EN,
     TABLE_SPEC_TITLE_KO,
+    TOC_HEADERS_EN,
+    TOC_HEADERS_KO,
+    TOC_TITLE_EN,
+    TOC_TITLE_KO,
+    WRITER_ENGINES,
 )
-from app.utils import merge_and_style, set_row_style
-
-
-def extract_length_from_type(type_str: str) -> str:
-    """타입 문자열에서 길이 추출"""
-    match = re.search(r"\((\d+)\)", type_str)
-    return match.group(1) if match else "-"
+from app.manifest import (
+    load_manifest,
+    save_manifest,
+    save_shard_manifest,
+    sheet_hash,
+    sheet_key,
+)
+from app.model import TableSpec
+from app.profiling import PROFILER, count, phase
+from app.sheet_names import SheetNameAllocator, add_sheet
+from app.spec_rows import column_row, index_rows
+from app.stream_writer import StreamingSheet
+from app.utils import get_style_registry, merge_and_style, merge_cells, set_row_style
 
 
 def write_title(ws, row_idx, lang):
@@ -58,8 +79,8 @@ def write_meta(ws, table_spec, row_idx, lang, meta_field_values):
     """2. 상단 메타정보 영역 작성"""
     meta_fields = META_FIELDS_KO if lang == "ko" else META_FIELDS_EN
     meta_values = meta_field_values + [
-        table_spec["table_name"],
-        table_spec["table_comment"],
+        table_spec.table_name,
+        table_spec.table_comment,
     ]
     for meta_idx, (meta_field, meta_value) in enumerate(
         zip(meta_fields, meta_values, strict=False)
@@ -204,7 +225,8 @@ def write_column_headers(ws, row_idx, lang):
     """4. 컬럼 스펙 테이블 헤더 (설명 병합)"""
     column_headers = COLUMN_HEADERS_KO if lang == "ko" else COLUMN_HEADERS_EN
     ws.append([""] * (BASE_COL - 1) + column_headers)
-    ws.merge_cells(
+    merge_cells(
+        ws,
         start_row=row_idx,
         start_column=BASE_COL + 7,
         end_row=row_idx,
@@ -225,71 +247,58 @@ def write_column_headers(ws, row_idx, lang):
     return row_idx + 1
 
 
-def write_columns(ws, table_spec, row_idx):
-    """5. 컬럼 데이터 (정의/설명 3칸 병합)"""
-    for col_idx, column_spec in enumerate(table_spec["columns"], 1):
-        ws.cell(row_idx, BASE_COL + 0, col_idx)
-        ws.cell(row_idx, BASE_COL + 1, column_spec["column_name"])
-        ws.cell(row_idx, BASE_COL + 2, column_spec["type"].upper())
-        ws.cell(row_idx, BASE_COL + 3, extract_length_from_type(column_spec["type"]))
-        ws.cell(row_idx, BASE_COL + 4, "Y" if column_spec.get("pk") else "N")
-        ws.cell(row_idx, BASE_COL + 5, "Y" if column_spec.get("nn") else "N")
-        ws.cell(row_idx, BASE_COL + 6, column_spec.get("default") or "-")
-        ws.merge_cells(
+def write_columns(ws, table_spec, row_idx, lang="ko", catalog=None):
+    """5. 컬럼 데이터 (정의/설명 3칸 병합), catalog: 참조 컬럼 확인용 SchemaCatalog"""
+    registry = get_style_registry(ws.parent)
+    for col_idx, column_spec in enumerate(table_spec.columns, 1):
+        values = column_row(col_idx, column_spec, lang, catalog)
+        for offset, value in enumerate(values[:7]):
+            ws.cell(row_idx, BASE_COL + offset, value)
+        merge_cells(
+            ws,
             start_row=row_idx,
             start_column=BASE_COL + 7,
             end_row=row_idx,
             end_column=BASE_COL + 9,
         )
-        ws.cell(row_idx, BASE_COL + 7, column_spec.get("comment", ""))
-        ref_info = "-"
-        if column_spec.get("ref_table") and column_spec.get("ref_column"):
-            ref_info = f"{column_spec['ref_table']}.{column_spec['ref_column']}"
-        ws.cell(row_idx, BASE_COL + 10, ref_info)
-        ws.cell(row_idx, BASE_COL + 11, "-")
+        ws.cell(row_idx, BASE_COL + 7, values[7])
+        ws.cell(row_idx, BASE_COL + 10, values[8])
+        ws.cell(row_idx, BASE_COL + 11, values[9])
         for col_num in range(BASE_COL, BASE_COL + 12):
-            ws.cell(row_idx, col_num).alignment = (
-                CENTER_ALIGN
+            registry.apply(
+                ws.cell(row_idx, col_num),
+                align=CENTER_ALIGN
                 if col_num in [BASE_COL, BASE_COL + 4, BASE_COL + 5]
-                else LEFT_ALIGN
+                else LEFT_ALIGN,
+                border=BORDER_THIN,
             )
-            ws.cell(row_idx, col_num).border = BORDER_THIN
         row_idx += 1
     return row_idx
 
 
-def write_index(ws, row_idx, lang):
-    """
-    6. Index 스펙 (헤더/PK 인덱스 예시)
-    - 인덱스 헤더 라인, PK 인덱스(예시) 데이터, 병합 및 스타일 적용
-    """
+# 인덱스 영역 열 범위: 번호 / 인덱스 이름 / 인덱스 타입 / 유니크 / 구성 컬럼
+INDEX_COLUMN_RANGES = [
+    (BASE_COL, BASE_COL),
+    (BASE_COL + 1, BASE_COL + 3),
+    (BASE_COL + 4, BASE_COL + 6),
+    (BASE_COL + 7, BASE_COL + 9),
+    (BASE_COL + 10, BASE_COL + 11),
+]
+
+
+def write_index_headers(ws, row_idx, lang):
+    """6. Index 헤더 라인 (병합 및 스타일 적용)"""
     index_headers = INDEX_HEADERS_KO if lang == "ko" else INDEX_HEADERS_EN
     ws.append([""] * (BASE_COL - 1) + index_headers)
-    # 헤더 병합
-    ws.merge_cells(
-        start_row=row_idx,
-        start_column=BASE_COL + 1,
-        end_row=row_idx,
-        end_column=BASE_COL + 3,
-    )  # Index name
-    ws.merge_cells(
-        start_row=row_idx,
-        start_column=BASE_COL + 4,
-        end_row=row_idx,
-        end_column=BASE_COL + 6,
-    )  # Index type
-    ws.merge_cells(
-        start_row=row_idx,
-        start_column=BASE_COL + 7,
-        end_row=row_idx,
-        end_column=BASE_COL + 9,
-    )  # Unique
-    ws.merge_cells(
-        start_row=row_idx,
-        start_column=BASE_COL + 10,
-        end_row=row_idx,
-        end_column=BASE_COL + 11,
-    )  # 구성 컬럼
+    for col_from, col_to in INDEX_COLUMN_RANGES:
+        if col_from != col_to:
+            merge_cells(
+                ws,
+                start_row=row_idx,
+                start_column=col_from,
+                end_row=row_idx,
+                end_column=col_to,
+            )
     set_row_style(
         ws,
         row_idx,
@@ -300,83 +309,694 @@ def write_index(ws, row_idx, lang):
         col_from=BASE_COL,
         col_to=BASE_COL + 11,
     )
-    row_idx += 1
+    return row_idx + 1
 
-    # PK 인덱스 데이터 예시
-    index_data = [1, "-", "", "", "-", "", "", "-", "", "", "", "-", ""]
-    ws.append([""] * (BASE_COL - 1) + index_data)
-    ws.merge_cells(
-        start_row=row_idx,
-        start_column=BASE_COL + 1,
-        end_row=row_idx,
-        end_column=BASE_COL + 3,
-    )
-    ws.merge_cells(
-        start_row=row_idx,
-        start_column=BASE_COL + 4,
-        end_row=row_idx,
-        end_column=BASE_COL + 6,
-    )
-    ws.merge_cells(
-        start_row=row_idx,
-        start_column=BASE_COL + 7,
-        end_row=row_idx,
-        end_column=BASE_COL + 9,
-    )
-    ws.merge_cells(
-        start_row=row_idx,
-        start_column=BASE_COL + 10,
-        end_row=row_idx,
-        end_column=BASE_COL + 11,
-    )
-    set_row_style(
-        ws,
-        row_idx,
-        align=CENTER_ALIGN,
-        border=BORDER_THIN,
-        col_from=BASE_COL,
-        col_to=BASE_COL + 11,
-    )
-    row_idx += 1
+
+def index_row_count(table_spec) -> int:
+    """인덱스 데이터 행 수 (인덱스가 없으면 '-' 행 하나)"""
+    return max(1, len(table_spec.indexes))
+
+
+def write_index_rows(ws, table_spec, row_idx):
+    """
+    7. Index 데이터 (PK / UNIQUE 제약 인덱스, CREATE INDEX).
+    인덱스가 없으면 '-' 한 줄
+    """
+    registry = get_style_registry(ws.parent)
+    for values in index_rows(table_spec):
+        for (col_from, col_to), value in zip(INDEX_COLUMN_RANGES, values, strict=True):
+            if col_from != col_to:
+                merge_cells(
+                    ws,
+                    start_row=row_idx,
+                    start_column=col_from,
+                    end_row=row_idx,
+                    end_column=col_to,
+                )
+            ws.cell(row_idx, col_from, value)
+        for col_num in range(BASE_COL, BASE_COL + 12):
+            registry.apply(
+                ws.cell(row_idx, col_num),
+                align=LEFT_ALIGN
+                if col_num in (BASE_COL + 1, BASE_COL + 10)
+                else CENTER_ALIGN,
+                border=BORDER_THIN,
+            )
+        row_idx += 1
     return row_idx
 
 
+def write_index(ws, table_spec, row_idx, lang):
+    """6~7. Index 스펙 (헤더 + 인덱스 데이터)"""
+    row_idx = write_index_headers(ws, row_idx, lang)
+    return write_index_rows(ws, table_spec, row_idx)
+
+
 def set_column_widths(ws):
     """엑셀 시트 열 너비 조정"""
     for col_num, width in enumerate(COLUMN_WIDTHS, BASE_COL):
         ws.column_dimensions[get_column_letter(col_num)].width = width
 
 
-def write_table_sheet(ws, table_spec, lang, meta_field_values):
+class _Slot(str):
+    """
+    템플릿에서 테이블마다 바뀌는 값 자리 (값은 TableSpec 속성 이름).
+    같은 문자열의 메타 값과 구별되도록 내용이 아닌 타입으로 판별해 좌표를 기록.
+    """
+
+
+class _RecordingSheet:
+    """
+    템플릿 렌더링용 임시 시트: 블록 함수가 쓴 셀(값/스타일)과 병합 범위만 기록.
+    셀 스타일 ID 가 워크북 기준이므로 parent 는 실제 워크북.
+    slots: _Slot 값이 쓰인 셀 좌표 → 슬롯
+    """
+
+    def __init__(self, wb):
+        self.parent = wb
+        self.cells: dict[tuple[int, int], Cell] = {}
+        self.merges: list[tuple[int, int, int, int]] = []
+        self.slots: dict[tuple[int, int], _Slot] = {}
+        self._current_row = 0
+
+    def cell(self, row, column, value=None):
+        cell = self.cells.get((row, column))
+        if cell is None:
+            cell = self.cells[row, column] = Cell(self, row=row, column=column)
+        if value is not None:
+            if isinstance(value, _Slot):
+                self.slots[row, column] = value
+            cell.value = value
+        self._current_row = max(self._current_row, row)
+        return cell
+
+    def append(self, values):
+        row = self._current_row + 1
+        for col, value in enumerate(values, 1):
+            self.cell(row, col, value)
+
+    def merge_cells(self, start_row, start_column, end_row, end_column):
+        self.cell(start_row, start_column)
+        for row in range(start_row, end_row + 1):
+            for col in range(start_column, end_column + 1):
+                if (row, col) != (start_row, start_column):
+                    self.cells[row, col] = Cell(self, row=row, column=col)
+        self.merges.append((start_row, start_column, end_row, end_column))
+
+
+class SheetTemplate:
     """
-    테이블 단위 시트 작성 (모든 블록 호출)
+    테이블마다 같은 고정 레이아웃을 한 번만 렌더링해 두고 시트마다 복제.
+    - header: 타이틀 / 메타 / 데이터 건수 / 컬럼 헤더 (BASE_ROW 기준 절대 행)
+    - index: 인덱스 헤더 (1행 기준 상대 행)
+    테이블별로 다른 셀(테이블명, 테이블 코멘트)과 컬럼/인덱스 행만 따로 작성.
     """
-    row = BASE_ROW
-    row = write_title(ws, row, lang)
+
+    TABLE_NAME_SLOT = _Slot("table_name")
+    TABLE_COMMENT_SLOT = _Slot("table_comment")
+
+    def __init__(self, wb, lang, meta_field_values):
+        header = _RecordingSheet(wb)
+        row = write_title(header, BASE_ROW, lang)
+        row = write_meta(
+            header,
+            TableSpec(
+                table_name=self.TABLE_NAME_SLOT,
+                table_comment=self.TABLE_COMMENT_SLOT,
+            ),
+            row,
+            lang,
+            meta_field_values,
+        )
+        row = write_data_period(header, row, lang)
+        self.header_end_row = write_column_headers(header, row, lang)
+        self.header = self._freeze(header)
+        self.header_slots = header.slots
+
+        index = _RecordingSheet(wb)
+        self.index_header_rows = write_index_headers(index, 1, lang) - 1
+        self.index = self._freeze(index)
+
+    @staticmethod
+    def _freeze(sheet: _RecordingSheet):
+        """행 순서대로 [(행, 병합 범위 목록, 셀 목록)] (스트리밍 시트는 위 행부터 작성)"""
+        rows: dict[int, tuple[list, list]] = {}
+        for merge in sheet.merges:
+            rows.setdefault(merge[0], ([], []))[0].append(merge)
+        for (row, col), cell in sheet.cells.items():
+            style = StyleArray(cell._style) if cell._style else None
+            rows.setdefault(row, ([], []))[1].append((col, cell._value, style))
+        return [(row, *rows[row]) for row in sorted(rows)]
+
+    @staticmethod
+    def _paste(ws, fragment, row_offset, slot_values=None):
+        """
+        fragment 를 row_offset 만큼 내려 붙여넣기
+        slot_values: 템플릿 셀 좌표 (행, 열) → 그 자리에 쓸 실제 값
+        """
+        is_worksheet = isinstance(ws, Worksheet)
+        for template_row, merges, cells in fragment:
+            row = template_row + row_offset
+            for _start_row, start_column, end_row, end_column in merges:
+                if is_worksheet:
+                    # 병합 셀도 템플릿 스타일(테두리)을 그대로 붙여넣으므로
+                    # MergedCell 교체/재포맷 없이 범위만 추가
+                    cell_range = CellRange(
+                        min_col=start_column,
+                        min_row=row,
+                        max_col=end_column,
+                        max_row=end_row + row_offset,
+                    )
+                    ws.merged_cells.ranges.add(MergedCellRange(ws, cell_range.coord))
+                else:
+                    merge_cells(
+                        ws,
+                        start_row=row,
+                        start_column=start_column,
+                        end_row=end_row + row_offset,
+                        end_column=end_column,
+                    )
+            for col, value, style in cells:
+                cell = ws.cell(row, col)
+                if slot_values and (template_row, col) in slot_values:
+                    value = slot_values[template_row, col]
+                if value is not None:
+                    cell.value = value
+                if style is not None:
+                    cell._style = StyleArray(style)
+
+    def write_header(self, ws, table_spec, row_idx=BASE_ROW):
+        """고정 헤더 영역 복제 + 테이블명/코멘트 기록, 컬럼 데이터 시작 행 반환"""
+        row_offset = row_idx - BASE_ROW
+        self._paste(
+            ws,
+            self.header,
+            row_offset,
+            {
+                coord: getattr(table_spec, slot)
+                for coord, slot in self.header_slots.items()
+            },
+        )
+        return self.header_end_row + row_offset
+
+    def write_index(self, ws, table_spec, row_idx):
+        """인덱스 헤더 복제 + 인덱스 데이터 행 작성, 다음 행 번호 반환"""
+        self._paste(ws, self.index, row_idx - 1)
+        return write_index_rows(ws, table_spec, row_idx + self.index_header_rows)
+
+    def block_height(self, table_spec) -> int:
+        """테이블 블록 하나의 행 수 (시트 하나에 여러 테이블을 쌓을 때 위치 계산용)"""
+        return (
+            self.header_end_row
+            - BASE_ROW
+            + len(table_spec.columns)
+            + self.index_header_rows
+            + index_row_count(table_spec)
+        )
+
+
+def write_table_block(
+    ws,
+    table_spec,
+    lang,
+    meta_field_values,
+    template=None,
+    row_idx=BASE_ROW,
+    catalog=None,
+):
+    """
+    테이블 하나의 블록 작성 (모든 블록 호출), 다음 행 번호 반환
+    template 이 있으면 고정 영역은 템플릿 복제, 컬럼/인덱스 행만 직접 작성
+    """
+    if template is not None:
+        row = template.write_header(ws, table_spec, row_idx)
+        row = write_columns(ws, table_spec, row, lang, catalog)
+        return template.write_index(ws, table_spec, row)
+    row = write_title(ws, row_idx, lang)
     row = write_meta(ws, table_spec, row, lang, meta_field_values)
     row = write_data_period(ws, row, lang)
     row = write_column_headers(ws, row, lang)
-    row = write_columns(ws, table_spec, row)
-    row = write_index(ws, row, lang)
+    row = write_columns(ws, table_spec, row, lang, catalog)
+    return write_index(ws, table_spec, row, lang)
+
+
+def write_table_sheet(
+    ws, table_spec, lang, meta_field_values, template=None, catalog=None
+):
+    """테이블 단위 시트 작성"""
+    set_column_widths(ws)
+    write_table_block(
+        ws, table_spec, lang, meta_field_values, template, catalog=catalog
+    )
+
+
+# --layout file/single: 테이블 블록 사이 빈 행 수
+BLOCK_GAP_ROWS = 2
+# 목차 열 범위: 번호 / 테이블명 / 상세설명
+TOC_COLUMN_RANGES = [
+    (BASE_COL, BASE_COL),
+    (BASE_COL + 1, BASE_COL + 4),
+    (BASE_COL + 5, BASE_COL + 11),
+]
+
+
+def _write_toc_cell(ws, row_idx, col_range, value, **style):
+    """목차 한 칸 (열 범위가 둘 이상이면 병합)"""
+    col_from, col_to = col_range
+    if col_from == col_to:
+        return get_style_registry(ws.parent).apply(
+            ws.cell(row_idx, col_from, value), **style
+        )
+    return merge_and_style(ws, row_idx, col_from, col_to, value, **style)
+
+
+def write_toc(ws, entries, row_idx, lang):
+    """
+    목차: [(테이블 스펙, 시트 이름, 블록 시작 행)] 을 한 줄씩, 테이블명은 블록으로 링크
+    """
+    title = TOC_TITLE_KO if lang == "ko" else TOC_TITLE_EN
+    headers = TOC_HEADERS_KO if lang == "ko" else TOC_HEADERS_EN
+    merge_and_style(
+        ws,
+        row_idx,
+        BASE_COL,
+        BASE_COL + 11,
+        title,
+        font=BOLD_LARGE_FONT,
+        fill=FILL_HEADER,
+        align=CENTER_ALIGN,
+        border=BORDER_THIN,
+    )
+    row_idx += 1
+    for col_range, header in zip(TOC_COLUMN_RANGES, headers, strict=True):
+        _write_toc_cell(
+            ws,
+            row_idx,
+            col_range,
+            header,
+            font=BOLD_FONT,
+            fill=FILL_HEADER,
+            align=CENTER_ALIGN,
+            border=BORDER_THIN,
+        )
+    row_idx += 1
+    no_range, name_range, desc_range = TOC_COLUMN_RANGES
+    for toc_idx, (table_spec, title, block_row) in enumerate(entries, 1):
+        _write_toc_cell(
+            ws, row_idx, no_range, toc_idx, align=CENTER_ALIGN, border=BORDER_THIN
+        )
+        name_cell = _write_toc_cell(
+            ws,
+            row_idx,
+            name_range,
+            table_spec.table_name,
+            font=LINK_FONT,
+            align=LEFT_ALIGN,
+            border=BORDER_THIN,
+        )
+        name_cell.hyperlink = Hyperlink(
+            ref="",
+            location=f"{quote_sheetname(title)}!{get_column_letter(BASE_COL)}{block_row}",
+        )
+        _write_toc_cell(
+            ws,
+            row_idx,
+            desc_range,
+            table_spec.table_comment,
+            align=LEFT_ALIGN,
+            border=BORDER_THIN,
+        )
+        row_idx += 1
+    return row_idx
+
+
+def stacked_block_rows(table_specs, template) -> list[int]:
+    """한 시트에 쌓는 테이블 블록들의 시작 행 (상단 목차 + 블록 사이 빈 행 반영)"""
+    block_row = BASE_ROW + 2 + len(table_specs) + BLOCK_GAP_ROWS
+    rows = []
+    for table_spec in table_specs:
+        rows.append(block_row)
+        block_row += template.block_height(table_spec) + BLOCK_GAP_ROWS
+    return rows
+
+
+def write_tables_sheet(
+    ws, table_specs, lang, meta_field_values, template, block_meta=None, catalog=None
+):
+    """
+    여러 테이블 블록을 한 시트에 이어서 작성 (--layout file/single).
+    블록 위치는 미리 계산해 목차를 먼저 쓰고, 블록은 누적 행 오프셋으로 배치.
+    block_meta: 테이블별 (메타 값, 템플릿) 목록 (입력 파일마다 메타가 다를 때)
+    """
     set_column_widths(ws)
+    block_rows = stacked_block_rows(table_specs, template)
+    write_toc(
+        ws,
+        [
+            (table_spec, ws.title, row_idx)
+            for table_spec, row_idx in zip(table_specs, block_rows, strict=True)
+        ],
+        BASE_ROW,
+        lang,
+    )
+    if block_meta is None:
+        block_meta = [(meta_field_values, template)] * len(table_specs)
+    for table_spec, row_idx, (block_meta_values, block_template) in zip(
+        table_specs, block_rows, block_meta, strict=True
+    ):
+        write_table_block(
+            ws,
+            table_spec,
+            lang,
+            block_meta_values,
+            block_template,
+            row_idx=row_idx,
+            catalog=catalog,
+        )
+
+
+def _count_workbook(wb, streaming: bool):
+    """--profile 카운터: 시트/셀/병합/스타일 수 (스트리밍 셀 수는 시트 작성 중 집계)"""
+    count("sheets", len(wb.worksheets))
+    for ws in wb.worksheets:
+        if not streaming:
+            count("cells", len(ws._cells))
+        count("merges", len(ws.merged_cells.ranges))
+    count("styles", get_style_registry(wb).style_count)
+
+
+def iter_source_tables(
+    table_spec_dict: dict[str, list[TableSpec]],
+) -> Iterator[tuple[str, TableSpec]]:
+    """{입력 파일명: 테이블 목록} → (입력 파일명, 테이블) 입력 순서대로"""
+    for sheet_name, table_list in table_spec_dict.items():
+        for table_spec in table_list:
+            yield sheet_name, table_spec
+
+
+def _iter_sheet_units(table_spec_dict, layout, lang):
+    """
+    layout 에 따른 (시트 키, 시트에 들어갈 테이블 목록, 테이블별 입력 파일명).
+    table_spec_dict 가 dict 가 아니면 (입력 파일명, 테이블) 이터러블 (layout sheet 전용)
+    """
+    if not isinstance(table_spec_dict, dict):
+        source_tables = table_spec_dict
+    elif layout == "sheet":
+        source_tables = iter_source_tables(table_spec_dict)
+    if layout == "single":
+        yield (
+            TABLE_SPEC_TITLE_KO if lang == "ko" else TABLE_SPEC_TITLE_EN,
+            [spec for table_list in table_spec_dict.values() for spec in table_list],
+            [
+                sheet_name
+                for sheet_name, table_list in table_spec_dict.items()
+                for _ in table_list
+            ],
+        )
+        return
+    if layout == "file":
+        for sheet_name, table_list in table_spec_dict.items():
+            if table_list:
+                yield sheet_name, table_list, [sheet_name] * len(table_list)
+        return
+    taken = set()
+    for sheet_name, table_spec in source_tables:
+        key = sheet_key(sheet_name, table_spec, taken=taken)
+        taken.add(key)
+        yield key, [table_spec], [sheet_name]
+
+
+def _unit_meta(metas: list[list], meta_field_values: list):
+    """
+    시트 해시용 메타 값: 시트 안 테이블의 메타가 모두 같으면 그 목록 하나
+    (파일별 메타가 없을 때 기존 매니페스트 해시와 같음), 다르면 테이블별 목록
+    """
+    if not metas:
+        return meta_field_values
+    if all(meta == metas[0] for meta in metas):
+        return metas[0]
+    return metas
 
 
 def write_excel_spec(
-    table_spec_dict: dict[str, Any],
+    table_spec_dict: dict[str, list[TableSpec]] | Iterable[tuple[str, TableSpec]],
     output_excel_path: Path,
     lang: str,
     meta_field_values: list,
+    incremental: bool = False,
+    engine: str = "openpyxl",
+    layout: str = "sheet",
+    index_sheet: bool = False,
+    file_meta: dict[str, list] | None = None,
+    catalog: SchemaCatalog | None = None,
 ):
     """
     메인: 전체 엑셀 파일 생성, 각 시트 작성
+    table_spec_dict: {입력 파일명: 테이블 목록} 또는 layout sheet 일 때
+            (입력 파일명, 테이블) 이터러블 (파싱과 동시에 도착하는 순서대로 작성, --pipeline)
+    incremental: 기존 엑셀 + 매니페스트를 읽어 내용이 바뀐 시트만 다시 작성
+    engine: "openpyxl" (일반 모드) 또는 "stream" (시트를 다 쓰는 즉시 XML 로 내보냄,
+            시트 수가 늘어도 메모리 일정. incremental 과 함께 사용 불가)
+    layout: "sheet" (테이블마다 시트), "file" (입력 파일마다 시트),
+            "single" (전체 테이블을 시트 하나에). file/single 은 상단에 목차
+    index_sheet: 맨 앞에 전체 테이블 목차 시트 추가 (incremental 과 함께 사용 불가)
+    file_meta: {입력 파일명: 메타 값} (해당 파일 테이블만 meta_field_values 대신 사용)
+    catalog: 전체 입력의 SchemaCatalog (참조 컬럼 확인, 다른 파일 테이블 참조 포함)
+    반환: {시트 키: 시트 이름} (시트 키는 manifest.sheet_key)
     """
-    wb = Workbook()
-    wb.remove(wb.active)
+    if engine not in WRITER_ENGINES:
+        raise ValueError(f"Unknown writer engine: {engine}")
+    if layout not in SHEET_LAYOUTS:
+        raise ValueError(f"Unknown sheet layout: {layout}")
+    if layout != "sheet" and not isinstance(table_spec_dict, dict):
+        raise ValueError("Only the sheet layout can be written from a table stream")
+    streaming = engine == "stream"
+    if streaming and incremental:
+        raise ValueError("The stream engine cannot be used with incremental mode")
+    if index_sheet and incremental:
+        raise ValueError("The index sheet cannot be used with incremental mode")
+    previous_sheets = load_manifest(output_excel_path) if incremental else {}
+    if previous_sheets:
+        with phase("load"):
+            wb = load_workbook(output_excel_path)
+    elif streaming:
+        wb = Workbook(write_only=True)
+    else:
+        wb = Workbook()
+        wb.remove(wb.active)
+
+    existing_sheets = {ws.title: ws for ws in wb.worksheets}
+    allocator = SheetNameAllocator(reserved=existing_sheets)
+    with phase("template"):
+        template = SheetTemplate(wb, lang, meta_field_values)
+    # 메타 값이 다른 파일은 메타 값별로 템플릿 하나씩
+    templates = {tuple(meta_field_values): template}
+
+    def template_for(meta):
+        key = tuple(meta)
+        if key not in templates:
+            templates[key] = SheetTemplate(wb, lang, meta)
+        return templates[key]
+
+    file_meta = file_meta or {}
+    sheets: dict[str, dict[str, str]] = {}
+    with phase("sheets"):
+        toc_entries = []
+        if index_sheet:
+            index_ws = add_sheet(
+                wb, allocator.allocate(TOC_TITLE_KO if lang == "ko" else TOC_TITLE_EN)
+            )
+        for key, table_specs, sources in _iter_sheet_units(
+            table_spec_dict, layout, lang
+        ):
+            metas = [file_meta.get(source, meta_field_values) for source in sources]
+            digest = sheet_hash(
+                table_specs,
+                lang,
+                _unit_meta(metas, meta_field_values),
+                layout,
+                catalog.reference_state(table_specs) if catalog else None,
+            )
+            previous = previous_sheets.get(key)
+            previous_ws = existing_sheets.get(previous["title"]) if previous else None
+            if previous_ws is not None:
+                # 기존 시트 이름 유지 (바뀐 시트는 같은 이름으로 다시 작성)
+                allocator.assign(key, previous["title"])
+                if previous["hash"] == digest:
+                    sheets[key] = previous
+                    continue
+                wb.remove(previous_ws)
+            ws = add_sheet(wb, allocator.allocate(key))
+            ws.sheet_view.zoomScale = 85
+            sheet = StreamingSheet(ws) if streaming else ws
+            if layout == "sheet":
+                write_table_sheet(
+                    sheet,
+                    table_specs[0],
+                    lang=lang,
+                    meta_field_values=metas[0],
+                    template=template_for(metas[0]),
+                    catalog=catalog,
+                )
+            else:
+                write_tables_sheet(
+                    sheet,
+                    table_specs,
+                    lang=lang,
+                    meta_field_values=meta_field_values,
+                    template=template,
+                    block_meta=[(meta, template_for(meta)) for meta in metas],
+                    catalog=catalog,
+                )
+            if streaming:
+                sheet.close()
+                count("cells", sheet.written_cells)
+            sheets[key] = {"title": ws.title, "hash": digest}
+            if index_sheet:
+                block_rows = (
+                    [BASE_ROW]
+                    if layout == "sheet"
+                    else stacked_block_rows(table_specs, template)
+                )
+                toc_entries.extend(
+                    (table_spec, ws.title, row_idx)
+                    for table_spec, row_idx in zip(table_specs, block_rows, strict=True)
+                )
+
+        if index_sheet:
+            index_ws.sheet_view.zoomScale = 85
+            sheet = StreamingSheet(index_ws) if streaming else index_ws
+            set_column_widths(sheet)
+            write_toc(sheet, toc_entries, BASE_ROW, lang)
+            if streaming:
+                sheet.close()
+                count("cells", sheet.written_cells)
+    if PROFILER.enabled:
+        _count_workbook(wb, streaming)
+
+    if previous_sheets:
+        # 사라진 시트 삭제 후 입력 순서대로 정렬
+        titles = [sheet["title"] for sheet in sheets.values()]
+        kept = set(titles)
+        for ws in list(wb.worksheets):
+            if ws.title not in kept:
+                wb.remove(ws)
+        order = {title: idx for idx, title in enumerate(titles)}
+        wb._sheets.sort(key=lambda ws: order[ws.title])
+        wb.active = 0
+    with phase("save"):
+        wb.save(output_excel_path)
+    if incremental:
+        save_manifest(output_excel_path, sheets)
+    return allocator.names
+
+
+def split_table_specs(
+    table_spec_dict: dict[str, list[TableSpec]], shard_size: int
+) -> list[dict[str, list[TableSpec]]]:
+    """입력 순서를 유지한 채 테이블 shard_size 개씩 나눈 table_spec_dict 목록"""
+    shards, current, count = [], {}, 0
     for sheet_name, table_list in table_spec_dict.items():
         for table_spec in table_list:
-            ws = wb.create_sheet(title=f"{sheet_name}_{table_spec['table_name']}"[:31])
-            ws.sheet_view.zoomScale = 85
-            write_table_sheet(
-                ws, table_spec, lang=lang, meta_field_values=meta_field_values
+            if count == shard_size:
+                shards.append(current)
+                current, count = {}, 0
+            current.setdefault(sheet_name, []).append(table_spec)
+            count += 1
+    if current or not shards:
+        shards.append(current)
+    return shards
+
+
+def shard_output_path(output_excel_path: Path, shard_idx: int) -> Path:
+    """output.xlsx → output_001.xlsx"""
+    return output_excel_path.with_name(
+        f"{output_excel_path.stem}_{shard_idx:03d}{output_excel_path.suffix}"
+    )
+
+
+def _write_shard(
+    table_spec_dict: dict[str, list[TableSpec]],
+    output_excel_path: Path,
+    catalog: SchemaCatalog | None,
+    **options,
+) -> dict:
+    """샤드 하나 작성 (프로세스 풀 워커, catalog: 이 샤드의 부분 카탈로그)"""
+    return write_excel_spec(
+        table_spec_dict, output_excel_path, catalog=catalog, **options
+    )
+
+
+def write_excel_shards(
+    table_spec_dict: dict[str, list[TableSpec]],
+    output_excel_path: Path,
+    lang: str,
+    meta_field_values: list,
+    shard_size: int,
+    jobs: int = 1,
+    engine: str = "openpyxl",
+    layout: str = "sheet",
+    file_meta: dict[str, list] | None = None,
+    catalog: SchemaCatalog | None = None,
+) -> list[Path]:
+    """
+    테이블을 shard_size 개씩 나눠 output_001.xlsx, output_002.xlsx ... 로 저장.
+    샤드마다 맨 앞에 목차 시트, jobs > 1 이면 샤드를 프로세스 풀에서 동시에 작성.
+    어떤 테이블이 어느 파일에 있는지는 <output>.shards.json 에 기록. 반환: 샤드 경로
+    catalog: 전체 입력 기준 SchemaCatalog (다른 샤드의 테이블을 참조해도 확인 가능).
+    샤드에는 그 샤드 테이블의 참조 대상만 담은 부분 카탈로그를 넘김 (작업마다 전체 스키마 pickle 방지)
+    """
+    shard_dicts = split_table_specs(table_spec_dict, shard_size)
+    shard_paths = [
+        shard_output_path(output_excel_path, shard_idx)
+        for shard_idx in range(1, len(shard_dicts) + 1)
+    ]
+    write_shard = partial(
+        _write_shard,
+        lang=lang,
+        meta_field_values=meta_field_values,
+        engine=engine,
+        layout=layout,
+        index_sheet=True,
+        file_meta=file_meta,
+    )
+    shard_catalogs = [
+        catalog.subset(
+            [
+                table_spec
+                for table_list in shard_dict.values()
+                for table_spec in table_list
+            ]
+        )
+        if catalog
+        else None
+        for shard_dict in shard_dicts
+    ]
+    if jobs > 1 and len(shard_dicts) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(shard_dicts))) as executor:
+            sheet_name_maps = list(
+                executor.map(write_shard, shard_dicts, shard_paths, shard_catalogs)
             )
-    wb.save(output_excel_path)
+    else:
+        sheet_name_maps = list(
+            map(write_shard, shard_dicts, shard_paths, shard_catalogs)
+        )
+
+    save_shard_manifest(
+        output_excel_path,
+        [
+            {
+                "file": shard_path.name,
+                "tables": [
+                    {"source": sheet_name, "table": table_spec.table_name}
+                    for sheet_name, table_list in shard_dict.items()
+                    for table_spec in table_list
+                ],
+                "sheets": sheet_names,
+            }
+            for shard_path, shard_dict, sheet_names in zip(
+                shard_paths, shard_dicts, sheet_name_maps, strict=True
+            )
+        ],
+    )
+    return shard_paths
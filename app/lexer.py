@@ -0,0 +1,271 @@
+import re
+from collections.abc import Generator, Iterator
+
+# 한 문장을 정규식 한 번으로 매칭 (소유 수량자로 백트래킹 없이 선형 시간)
+# - 앞쪽 공백/주석은 body 에서 제외, ';' 는 semicolon 그룹
+# - 중첩 블록 주석(/* /* */ */)은 매칭 실패 → _scan_statement 로 처리
+_STATEMENT_REGEX = re.compile(
+    r"""
+    (?:\s++|--[^\n]*+|/\*(?:[^*/]++|\*(?!/)|/(?!\*))*+\*/)*+
+    (?P<body>(?:
+        [^;'"$/eE\-]++
+      | (?<![\w$])[eE]'(?:[^'\\]++|\\.|'')*+(?:'|\\?\Z)  # E'...' (백슬래시 이스케이프, 끝의 \ 는 미완성)
+      | [eE]
+      | '(?:[^']++|'')*+(?:'|\Z)
+      | "(?:[^"]++|"")*+(?:"|\Z)
+      | --[^\n]*+
+      | /\*(?:[^*/]++|\*(?!/)|/(?!\*))*+\*/
+      | (?<![\w$])\$(?P<tag>(?:[^\W\d]\w*)?)\$(?:.*?\$(?P=tag)\$|.*+)
+      | \$
+      | -
+      | /(?!\*)
+    )*+)
+    (?:(?P<semicolon>;)|\Z)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# 문장 첫 키워드 판별 (앞쪽 공백/주석 건너뛴 위치에서 match)
+_LEADING_REGEX = re.compile(r"(?:\s++|--[^\n]*+|/\*(?:[^*/]++|\*(?!/)|/(?!\*))*+\*/)*+")
+_DDL_KEYWORD_REGEX = re.compile(r"(?:create|alter|comment|drop)\b", re.IGNORECASE)
+_COPY_KEYWORD_REGEX = re.compile(r"copy\b", re.IGNORECASE)
+_FROM_STDIN_REGEX = re.compile(r"\bfrom\s+stdin\b", re.IGNORECASE)
+
+# 문자 단위 보조 스캐너용 토큰 (나머지 문자는 한 번에 건너뜀)
+_SPECIAL_REGEX = re.compile(r"""[;'"]|--|/\*|(?<![\w$])\$(?:[^\W\d]\w*)?\$""")
+_NON_SPACE_REGEX = re.compile(r"\S")
+_BLOCK_COMMENT_REGEX = re.compile(r"/\*|\*/")
+_ESCAPE_STRING_REGEX = re.compile(r"\\.|'", re.DOTALL)
+_ESCAPE_PREFIX_REGEX = re.compile(r"(?<![\w$])[eE]'")
+
+
+def _is_escape_string_prefix(text: str, quote_pos: int) -> bool:
+    """따옴표 바로 앞이 단독 E/e 인지 (E'...' 문자열 여부)"""
+    if quote_pos < 1 or text[quote_pos - 1] not in "eE":
+        return False
+    before = quote_pos - 2
+    return before < 0 or not (text[before].isalnum() or text[before] in "_$")
+
+
+def _skip_block_comment(text: str, pos: int, end: int) -> int:
+    """/* ... */ 블록 주석 끝 위치 (PostgreSQL 은 중첩 주석 허용)"""
+    depth = 1
+    while depth:
+        m = _BLOCK_COMMENT_REGEX.search(text, pos, end)
+        if not m:
+            return end
+        depth += 1 if m.group() == "/*" else -1
+        pos = m.end()
+    return pos
+
+
+def _skip_quoted(text: str, pos: int, end: int, quote: str) -> int:
+    """'...' / "..." 리터럴 끝 위치 (연속 따옴표 '' 는 이스케이프)"""
+    while True:
+        close = text.find(quote, pos, end)
+        if close < 0:
+            return end
+        if close + 1 < end and text[close + 1] == quote:
+            pos = close + 2
+            continue
+        return close + 1
+
+
+def _skip_escape_string(text: str, pos: int, end: int) -> int:
+    """E'...' 리터럴 끝 위치 (\\' 와 '' 모두 이스케이프)"""
+    while True:
+        m = _ESCAPE_STRING_REGEX.search(text, pos, end)
+        if not m:
+            return end
+        pos = m.end()
+        if m.group() != "'":
+            continue
+        if pos < end and text[pos] == "'":
+            pos += 1
+            continue
+        return pos
+
+
+def _scan_statement(text: str, pos: int, end: int) -> tuple[int | None, int, int]:
+    """
+    문장 하나를 토큰 단위로 스캔 (중첩 주석, ';' 없는 마지막 문장 처리용)
+    반환: (문장 시작 | None, 문장 끝, 다음 스캔 위치)
+    """
+    stmt_start, stmt_end = None, pos
+    while pos < end:
+        m = _SPECIAL_REGEX.search(text, pos, end)
+        seg_end = m.start() if m else end
+        if seg_end > pos:
+            if stmt_start is None:
+                first = _NON_SPACE_REGEX.search(text, pos, seg_end)
+                if first:
+                    stmt_start, stmt_end = first.start(), seg_end
+            else:
+                stmt_end = seg_end
+        if not m:
+            pos = end
+            break
+        token = m.group()
+        if token == ";":
+            if stmt_start is not None:
+                return stmt_start, m.end(), m.end()
+            pos = m.end()
+            continue
+        if token == "--":
+            newline = text.find("\n", m.end(), end)
+            pos = end if newline < 0 else newline + 1
+            continue
+        if token == "/*":
+            pos = _skip_block_comment(text, m.end(), end)
+            continue
+        if stmt_start is None:
+            stmt_start = m.start()
+        if token == "'" and _is_escape_string_prefix(text, m.start()):
+            pos = _skip_escape_string(text, m.end(), end)
+        elif token in ("'", '"'):
+            pos = _skip_quoted(text, m.end(), end, token)
+        else:
+            close = text.find(token, m.end(), end)
+            pos = end if close < 0 else close + len(token)
+        stmt_end = pos
+
+    if stmt_start is not None:
+        while stmt_end > stmt_start and text[stmt_end - 1].isspace():
+            stmt_end -= 1
+    return stmt_start, stmt_end, pos
+
+
+def _skip_copy_data(text: str, pos: int, end: int) -> int | None:
+    """
+    COPY ... FROM stdin 데이터 블록을 '\\.' 종료 줄까지 건너뛴 위치 (없으면 None)
+    pos: 데이터 시작 직전 위치 (COPY 문장의 ';')
+    """
+    found = text.find("\n\\.", pos, end)
+    if found < 0:
+        return None
+    newline = text.find("\n", found + 3, end)
+    return end if newline < 0 else newline + 1
+
+
+def _skip_plain_statement(text: str, pos: int, end: int) -> int | None:
+    """
+    DDL 이 아닌 문장(INSERT 등)을 str.find/count 로 건너뛰고 ';' 다음 위치 반환.
+    '' 리터럴만 있는 단순한 경우만 처리 (주석/E''/""/$$ 가 보이면 None).
+    """
+    semicolon, quote_count = pos - 1, 0
+    while True:
+        search_from = semicolon + 1
+        semicolon = text.find(";", search_from, end)
+        if semicolon < 0:
+            return None
+        quote_count += text.count("'", search_from, semicolon)
+        if quote_count % 2 == 0:
+            break
+    for marker in ('"', "$", "--", "/*"):
+        if text.find(marker, pos, semicolon) >= 0:
+            return None
+    if _ESCAPE_PREFIX_REGEX.search(text, pos, semicolon):
+        return None
+    return semicolon + 1
+
+
+def _is_copy_from_stdin(text: str, start: int, end: int) -> bool:
+    return bool(
+        _COPY_KEYWORD_REGEX.match(text, start, end)
+        and _FROM_STDIN_REGEX.search(text, start, end)
+    )
+
+
+def _scan_spans(
+    text: str, start: int, end: int, ddl_only: bool, final: bool
+) -> Generator[tuple[int, int], None, tuple[int, bool]]:
+    """
+    문장 (start, end) 를 yield, 반환값은 (소비한 위치, COPY 데이터 블록 진행 중 여부).
+    final=False 이면 끝이 잘렸을 수 있는 마지막 문장은 반환하지 않고 그 앞에서 멈춤.
+    """
+    pos = start
+    while pos < end:
+        if ddl_only:
+            stmt_start = _LEADING_REGEX.match(text, pos, end).end()
+            if stmt_start >= end:
+                break
+            if text.startswith("/*", stmt_start):
+                next_pos = _skip_block_comment(text, stmt_start + 2, end)
+                if next_pos >= end and not final:
+                    return pos, False
+                pos = next_pos
+                continue
+            if not _DDL_KEYWORD_REGEX.match(text, stmt_start, end):
+                stmt_end = _skip_plain_statement(text, stmt_start, end)
+                if stmt_end is None:
+                    _, _, stmt_end = _scan_statement(text, stmt_start, end)
+                    if stmt_end >= end and not final:
+                        return pos, False
+                pos = stmt_end
+                if _is_copy_from_stdin(text, stmt_start, stmt_end):
+                    data_end = _skip_copy_data(text, stmt_end - 1, end)
+                    if data_end is None:
+                        return (end, False) if final else (max(pos, end - 2), True)
+                    pos = data_end
+                continue
+        m = _STATEMENT_REGEX.match(text, pos, end)
+        if m and m.group("semicolon"):
+            stmt_start, stmt_end = m.start("body"), m.end()
+            if stmt_end - 1 == stmt_start:
+                pos = stmt_end
+                continue
+        else:
+            stmt_start, stmt_end, next_pos = _scan_statement(text, pos, end)
+            if next_pos >= end and not final:
+                return pos, False
+            if stmt_start is None:
+                pos = next_pos
+                continue
+        yield stmt_start, stmt_end
+        pos = stmt_end
+        if _is_copy_from_stdin(text, stmt_start, stmt_end):
+            data_end = _skip_copy_data(text, stmt_end - 1, end)
+            if data_end is None:
+                return (end, False) if final else (max(pos, end - 2), True)
+            pos = data_end
+    return pos, False
+
+
+def iter_statement_spans(
+    text: str, start: int = 0, end: int | None = None, ddl_only: bool = False
+) -> Iterator[tuple[int, int]]:
+    """
+    SQL 텍스트를 한 번만 훑어 문장 단위 (start, end) 오프셋을 반환 (문자열 복사 없음).
+    - 문장 앞쪽 공백/주석은 제외, 끝은 ';' 포함
+    - '--' / '/* */' 주석, '' / E'' / "" / $$ 리터럴 안의 ';' 는 무시
+    - COPY ... FROM stdin 데이터 블록은 문장으로 보지 않고 건너뜀
+    - ddl_only: CREATE/ALTER/COMMENT/DROP 외 문장은 반환하지 않고 빠르게 건너뜀
+    """
+    yield from _scan_spans(
+        text, start, len(text) if end is None else end, ddl_only, final=True
+    )
+
+
+class StatementScanner:
+    """
+    청크 단위로 읽는 입력용 문장 스캐너 (청크 경계에 걸친 문장/COPY 데이터 상태 유지).
+    scan() 후 consumed 이전 텍스트는 버리고, 나머지에 다음 청크를 이어 붙여 다시 호출.
+    """
+
+    def __init__(self, ddl_only: bool = False):
+        self.ddl_only = ddl_only
+        self.consumed = 0
+        self.in_copy_data = False
+
+    def scan(self, text: str, final: bool = False) -> Iterator[tuple[int, int]]:
+        start = 0
+        if self.in_copy_data:
+            data_end = _skip_copy_data(text, 0, len(text))
+            if data_end is None:
+                self.consumed = len(text) if final else max(0, len(text) - 2)
+                self.in_copy_data = not final
+                return
+            start, self.in_copy_data = data_end, False
+        self.consumed, self.in_copy_data = yield from _scan_spans(
+            text, start, len(text), self.ddl_only, final
+        )
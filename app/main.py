@@ -1,10 +1,30 @@
+import time
+from functools import partial
 from pathlib import Path
 
 import typer
 
-from app.const import META_FIELDS_EN, META_FIELDS_KO
-from app.excel_writer import write_excel_spec
-from app.parser import parse_ddl_file
+from app.cache import DEFAULT_CACHE_DIR, ParseCache
+from app.const import (
+    META_FIELDS_EN,
+    META_FIELDS_KO,
+    OUTPUT_FORMAT_SUFFIXES,
+    OUTPUT_FORMATS,
+    SHEET_LAYOUTS,
+    WRITER_ENGINES,
+)
+from app.manifest import shard_manifest_path_for
+from app.meta_config import (
+    META_KEYS,
+    MetaConfigError,
+    load_meta_config,
+    meta_from_env,
+    read_front_matters,
+    resolve_meta,
+)
+from app.pipeline import DEFAULT_QUEUE_SIZE, PipelineParseError
+from app.profiling import PROFILER, phase
+from app.watch import DEFAULT_DEBOUNCE, file_state, iter_changes
 
 app = typer.Typer(
     help="DDL → Excel Table Specification Converter (DDL → 엑셀 테이블 스펙 변환기)"
@@ -25,7 +45,10 @@ def collect_sql_files(
         if not sql_directory.exists() or not sql_directory.is_dir():
             typer.echo(f"[ERROR] --dir: '{sql_directory}' is not a valid directory.")
             raise typer.Exit(1)
-        sql_file_list.extend([p for p in sql_directory.glob("*.sql") if p.is_file()])
+        # glob 순서는 파일 시스템마다 달라 정렬 (시트 순서 고정)
+        sql_file_list.extend(
+            sorted(p for p in sql_directory.glob("*.sql") if p.is_file())
+        )
 
     # 파일 인자 모드
     if ddl_file_paths:
@@ -44,6 +67,126 @@ def collect_sql_files(
     return sql_file_list
 
 
+def parse_sql_file(
+    sql_file_path: Path, prefilter: bool = False, stream: bool = False, jobs: int = 1
+) -> tuple[list | None, str | None]:
+    """
+    .sql 파일 하나 파싱 (프로세스 풀 워커에서도 호출).
+    jobs: 파일 내부 CREATE TABLE 병렬 파싱 프로세스 수 (스트리밍 모드는 순차 처리)
+    stream: 읽기만 청크 단위 (결과는 리스트로 모음, 작성까지 이어서 스트리밍하려면 --pipeline)
+    반환: (테이블 리스트, None) 또는 실패 시 (None, 에러 메시지)
+    """
+    from app.parser import iter_parse_ddl_file, parse_ddl_file
+
+    try:
+        if stream:
+            return list(iter_parse_ddl_file(sql_file_path, prefilter=prefilter)), None
+        return parse_ddl_file(sql_file_path, prefilter=prefilter, jobs=jobs), None
+    except Exception as e:
+        return None, str(e)
+
+
+def iter_parse_sql_file(sql_file_path: Path, prefilter: bool = False):
+    """--pipeline --stream: .sql 파일 하나를 테이블 단위로 스트리밍 파싱"""
+    from app.parser import iter_parse_ddl_file
+
+    yield from iter_parse_ddl_file(sql_file_path, prefilter=prefilter)
+
+
+def parse_sql_files(
+    sql_file_list: list[Path],
+    jobs: int = 1,
+    prefilter: bool = False,
+    stream: bool = False,
+    cache: ParseCache | None = None,
+) -> tuple[dict[str, list], list[tuple[Path, str]]]:
+    """
+    여러 .sql 파일 파싱 (jobs > 1 이면 프로세스 풀 사용, 파일이 하나면 파일 내부 병렬).
+    cache 가 있으면 내용이 같은 파일은 파싱하지 않고 캐시 결과 사용.
+    결과는 입력 순서대로 병합, 실패한 파일은 나머지를 모두 처리한 뒤 한꺼번에 반환.
+    """
+    results: dict[Path, tuple[list | None, str | None]] = {}
+    cache_keys: dict[Path, str] = {}
+    if cache:
+        with phase("cache"):
+            for sql_file_path in sql_file_list:
+                try:
+                    key = cache.file_key(
+                        sql_file_path, prefilter=prefilter, stream=stream
+                    )
+                except OSError as e:
+                    results[sql_file_path] = (None, str(e))
+                    continue
+                table_list = cache.get(key)
+                if table_list is None:
+                    cache_keys[sql_file_path] = key
+                else:
+                    results[sql_file_path] = (table_list, None)
+
+    pending = [p for p in sql_file_list if p not in results]
+    worker = partial(parse_sql_file, prefilter=prefilter, stream=stream)
+    if len(pending) == 1:
+        with phase("parse", file=pending[0].name):
+            parsed = [worker(pending[0], jobs=jobs)]
+    elif jobs > 1 and pending:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        chunksize = max(1, len(pending) // (jobs * 4))
+        parsed = []
+        # 워커 프로세스 안은 측정되지 않으므로 전체 시간만 기록
+        with (
+            phase("parse", file=f"{len(pending)} files, pool"),
+            ProcessPoolExecutor(max_workers=jobs) as executor,
+        ):
+            try:
+                for result in executor.map(worker, pending, chunksize=chunksize):
+                    parsed.append(result)
+            except BrokenProcessPool:
+                # 워커가 죽으면 (메모리 부족 강제 종료, segfault 등) 결과를 받지 못한
+                # 파일을 모두 파싱 실패로 보고
+                error = (
+                    "parser worker process terminated abruptly "
+                    "(out of memory or crash); retry with --jobs 1"
+                )
+                parsed.extend((None, error) for _ in pending[len(parsed) :])
+    else:
+        parsed = []
+        for sql_file_path in pending:
+            with phase("parse", file=sql_file_path.name):
+                parsed.append(worker(sql_file_path))
+    for sql_file_path, result in zip(pending, parsed, strict=True):
+        results[sql_file_path] = result
+    if cache and cache_keys:
+        with phase("cache"):
+            for sql_file_path, (table_list, error) in results.items():
+                if error is None and sql_file_path in cache_keys:
+                    cache.put(cache_keys[sql_file_path], table_list)
+            cache.evict()
+
+    table_spec_dict: dict[str, list] = {}
+    errors: list[tuple[Path, str]] = []
+    for sql_file_path in sql_file_list:
+        table_list, error = results[sql_file_path]
+        if error is not None:
+            errors.append((sql_file_path, error))
+            continue
+        table_spec_dict[sql_file_path.stem] = table_list
+    return table_spec_dict, errors
+
+
+def ask_meta_input() -> bool:
+    """메타 직접 입력 여부 질문 (stdin 이 닫혀 있으면 입력 안 함)"""
+    typer.echo(
+        "Would you like to input table meta fields interactively? [y/N]: ", nl=False
+    )
+    try:
+        return input().strip().lower() == "y"
+    except EOFError:
+        typer.echo("")
+        return False
+
+
 def prompt_meta_fields(lang: str):
     meta_fields = META_FIELDS_KO if lang == "ko" else META_FIELDS_EN
     meta_fields = meta_fields[:7]
@@ -54,6 +197,238 @@ def prompt_meta_fields(lang: str):
     return results
 
 
+def _write_output(
+    table_spec_dict,
+    output_excel_path: Path,
+    lang: str,
+    meta_field_values: list,
+    incremental: bool,
+    engine: str,
+    layout: str,
+    shard_size: int | None,
+    jobs: int,
+    file_meta: dict[str, list] | None = None,
+    output_format: str = "xlsx",
+):
+    """
+    엑셀 작성 (--shard-size 면 여러 파일로 나눠 작성) 후 완료 메시지 출력.
+    작성 전에 전체 입력 파일의 카탈로그를 만들어 참조 대상이 없는 FK 를 경고.
+    output_format 이 csv/md/html 이면 openpyxl 없이 컬럼 표만 텍스트로 작성
+    """
+    from app.catalog import SchemaCatalog
+
+    with phase("catalog"):
+        catalog = SchemaCatalog(table_spec_dict)
+        dangling = catalog.dangling_references()
+    PROFILER.count("dangling_references", len(dangling))
+    for reference in dangling:
+        typer.echo(f"[WARN] Unresolved foreign key reference: {reference}")
+
+    if output_format != "xlsx":
+        from app.text_writers import write_text_spec
+
+        write_text_spec(
+            table_spec_dict, output_excel_path, output_format, lang, catalog=catalog
+        )
+        typer.echo(
+            f"[+] Conversion complete → {output_excel_path} "
+            f"(Format: {output_format}, Language: {lang})"
+        )
+        return
+
+    # openpyxl 은 작성 단계에서만 import (--help, 인자 오류 등은 빠르게 종료)
+    from app.excel_writer import write_excel_shards, write_excel_spec
+
+    if shard_size:
+        shard_paths = write_excel_shards(
+            table_spec_dict,
+            output_excel_path,
+            lang=lang,
+            meta_field_values=meta_field_values,
+            shard_size=shard_size,
+            jobs=jobs,
+            engine=engine,
+            layout=layout,
+            file_meta=file_meta,
+            catalog=catalog,
+        )
+        for shard_path in shard_paths:
+            typer.echo(f"[+] {shard_path}")
+        typer.echo(
+            f"[+] Conversion complete → {len(shard_paths)} files, "
+            f"{shard_manifest_path_for(output_excel_path)} (Language: {lang})"
+        )
+        return
+    write_excel_spec(
+        table_spec_dict,
+        output_excel_path,
+        lang=lang,
+        meta_field_values=meta_field_values,
+        incremental=incremental,
+        engine=engine,
+        layout=layout,
+        file_meta=file_meta,
+        catalog=catalog,
+    )
+    typer.echo(f"[+] Conversion complete → {output_excel_path} (Language: {lang})")
+
+
+def _write_pipeline(
+    parse,
+    sql_file_list: list[Path],
+    output_excel_path: Path,
+    lang: str,
+    meta_field_values: list,
+    incremental: bool,
+    engine: str,
+    layout: str,
+    shard_size: int | None,
+    jobs: int,
+    file_meta: dict[str, list] | None = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    stream_parse=None,
+):
+    """
+    --pipeline: 파서 프로세스가 넘겨주는 테이블을 도착하는 대로 시트로 작성
+    (layout sheet 전용, 시트 순서는 입력 순서). 참조 대상이 없는 FK 는 작성 후 경고.
+    stream_parse: --stream 이면 파일 단위가 아닌 테이블 단위로 받음 (파싱 캐시 미사용)
+    파싱 실패 시 PipelineParseError (출력 파일은 저장하지 않음)
+    """
+    from app.catalog import ReferenceIndex
+    from app.excel_writer import write_excel_spec
+    from app.pipeline import iter_pipeline_tables
+
+    references = ReferenceIndex()
+
+    def source_tables():
+        for source, table_spec in iter_pipeline_tables(
+            parse, sql_file_list, queue_size, stream_parse
+        ):
+            references.add(source, table_spec)
+            PROFILER.count("tables")
+            PROFILER.count("columns", len(table_spec.columns))
+            yield source, table_spec
+
+    write_excel_spec(
+        source_tables(),
+        output_excel_path,
+        lang=lang,
+        meta_field_values=meta_field_values,
+        incremental=incremental,
+        engine=engine,
+        layout=layout,
+        file_meta=file_meta,
+    )
+    dangling = references.dangling_references()
+    PROFILER.count("dangling_references", len(dangling))
+    for reference in dangling:
+        typer.echo(f"[WARN] Unresolved foreign key reference: {reference}")
+    typer.echo(f"[+] Conversion complete → {output_excel_path} (Language: {lang})")
+
+
+def _echo_parse_errors(parse_errors: list[tuple[Path, str]]):
+    for sql_file_path, error in parse_errors:
+        typer.echo(f"[ERROR] Failed to parse file: {sql_file_path}\n{error}")
+
+
+def _read_front_matters(sql_file_list: list[Path]) -> dict[str, dict[str, str]]:
+    try:
+        return read_front_matters(sql_file_list)
+    except (MetaConfigError, OSError) as e:
+        typer.echo(f"[ERROR] Failed to read meta values\n{e}")
+        raise typer.Exit(1)
+
+
+def _resolve_meta_values(
+    front_matters: dict[str, dict[str, str]],
+    meta_base: dict[str, str],
+    meta_file_overrides: dict[str, dict[str, str]],
+    lang: str,
+    prompt: bool,
+) -> tuple[list[str], dict[str, list[str]]]:
+    """
+    메타 값: 설정 파일 공통 값 < 환경 변수 (또는 직접 입력) < files.<파일명> < front-matter
+    prompt: 직접 입력 여부를 물어봄 (--no-input / --meta-config 가 없을 때)
+    """
+    if prompt and ask_meta_input():
+        meta_base = dict(zip(META_KEYS, prompt_meta_fields(lang), strict=True))
+    return resolve_meta(front_matters, meta_base, meta_file_overrides)
+
+
+def watch_targets(
+    ddl_file_paths: list[Path] | None, sql_directory: Path | None
+) -> list[Path]:
+    """--watch 감시 대상 (collect_sql_files 와 같은 순서, 없는 파일도 오류 없이 포함)"""
+    sql_file_list = []
+    if sql_directory:
+        sql_file_list.extend(sorted(sql_directory.glob("*.sql")))
+    sql_file_list.extend(Path(file_path) for file_path in ddl_file_paths or [])
+    return sql_file_list
+
+
+def run_watch(
+    collect,
+    parse,
+    write,
+    meta_base: dict[str, str],
+    meta_file_overrides: dict[str, dict[str, str]],
+    debounce: float,
+):
+    """
+    --watch: 파싱 결과를 메모리에 유지하고, 바뀐 .sql 파일만 다시 파싱해 출력 재작성.
+    파싱/작성 오류는 출력만 하고 다음 변경을 기다림 (Ctrl+C 로 종료).
+    collect: 감시 대상 목록, parse: parse_sql_files, write: _write_output (옵션 고정)
+    """
+    parsed: dict[Path, list] = {}
+    state = file_state(collect())
+    changes = iter_changes(collect, state, debounce=debounce)
+    changed = set(state)
+    try:
+        while True:
+            started = time.perf_counter()
+            sql_file_list = [path for path in collect() if path.is_file()]
+            for path in parsed.keys() - set(sql_file_list):
+                del parsed[path]
+            # 바뀐 파일 + 이전에 파싱 실패한 파일만 다시 파싱
+            targets = [
+                path for path in sql_file_list if path in changed or path not in parsed
+            ]
+            table_spec_dict, parse_errors = parse(targets)
+            for path in targets:
+                if path.stem in table_spec_dict:
+                    parsed[path] = table_spec_dict[path.stem]
+            if parse_errors:
+                for sql_file_path, error in parse_errors:
+                    typer.echo(
+                        f"[ERROR] Failed to parse file: {sql_file_path}\n{error}"
+                    )
+            elif not sql_file_list:
+                typer.echo("[watch] No .sql files to convert.")
+            else:
+                try:
+                    meta_field_values, file_meta = resolve_meta(
+                        read_front_matters(sql_file_list),
+                        meta_base,
+                        meta_file_overrides,
+                    )
+                    write(
+                        {path.stem: parsed[path] for path in sql_file_list},
+                        meta_field_values=meta_field_values,
+                        file_meta=file_meta,
+                    )
+                except Exception as e:
+                    typer.echo(f"[ERROR] Failed to write Excel file\n{e}")
+                else:
+                    typer.echo(
+                        f"[watch] {len(targets)} file(s) parsed, "
+                        f"rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms"
+                    )
+            typer.echo("[watch] Waiting for changes... (Ctrl+C to stop)")
+            changed = next(changes)
+    except KeyboardInterrupt:
+        typer.echo("\n[watch] Stopped.")
+
+
 @app.command()
 def main(
     ddl_file_paths: list[Path] = typer.Argument(
@@ -77,6 +452,123 @@ def main(
         help="Excel header language: ko (Korean, 기본값), en (English) | 엑셀 시트 타이틀/헤더 언어 (ko: 한글, en: 영어)",
         show_default=True,
     ),
+    prefilter: bool = typer.Option(
+        False,
+        "--prefilter",
+        help="Skip COPY/INSERT data and non-DDL statements (full pg_dump input) | 데이터 포함 덤프에서 DDL 외 문장 건너뛰기",
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Read .sql files in chunks and parse one table at a time (bounds the reader; with --pipeline tables stream through to the writer) | 청크 단위 스트리밍 파싱 (대용량 파일, --pipeline 과 함께 쓰면 작성까지 스트리밍)",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of worker processes for parsing .sql files | 파싱 병렬 프로세스 수",
+        show_default=True,
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always re-parse .sql files without the parse cache | 파싱 캐시 사용 안 함",
+    ),
+    cache_dir: Path = typer.Option(
+        DEFAULT_CACHE_DIR,
+        "--cache-dir",
+        help="Parse cache directory | 파싱 캐시 디렉토리",
+        show_default=True,
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Rewrite only sheets whose table spec changed since the last --incremental run | 변경된 테이블 시트만 다시 작성",
+    ),
+    engine: str = typer.Option(
+        "openpyxl",
+        "--engine",
+        help="Excel writer engine: openpyxl (default), stream (flat memory, no --incremental) | 엑셀 작성 엔진",
+        show_default=True,
+    ),
+    layout: str = typer.Option(
+        "sheet",
+        "--layout",
+        help="Sheet layout: sheet (one per table), file (one per .sql file), single (one sheet) | 시트 구성 (테이블별/파일별/단일 시트)",
+        show_default=True,
+    ),
+    shard_size: int = typer.Option(
+        None,
+        "--shard-size",
+        min=1,
+        help="Max tables per workbook; writes OUTPUT_001.xlsx, OUTPUT_002.xlsx ... in parallel (--jobs) | 파일당 최대 테이블 수 (파일 분할)",
+    ),
+    meta_config: Path = typer.Option(
+        None,
+        "--meta-config",
+        help="TOML/YAML file with meta values (top level: all files, [files.NAME]: one .sql file); skips the prompt | 메타 값 설정 파일",
+    ),
+    no_input: bool = typer.Option(
+        False,
+        "--no-input",
+        help="Never prompt; take meta values from --meta-config, DDL2EXCEL_META_* env vars and '-- meta.KEY: value' comments | 입력 없이 실행 (배치용)",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help="Keep running and rebuild the output when input .sql files change (polling; only changed files are re-parsed) | 변경 감시 후 자동 재작성",
+    ),
+    watch_debounce: float = typer.Option(
+        DEFAULT_DEBOUNCE,
+        "--watch-debounce",
+        min=0,
+        help="Seconds without further changes before --watch rebuilds | 연속 저장 묶음 대기 시간(초)",
+        show_default=True,
+    ),
+    output_format: str = typer.Option(
+        "auto",
+        "--format",
+        help="Output format: auto (from the output file extension: .csv, .md, .html, otherwise xlsx), xlsx, csv, md, html. csv/md/html write only the column/index tables, without openpyxl | 출력 형식",
+        show_default=True,
+    ),
+    model_path: Path = typer.Option(
+        None,
+        "--model",
+        help="Read tables from a model file written by --dump-model (.json/.msgpack/.pickle) instead of parsing .sql files | .sql 대신 모델 파일 입력",
+    ),
+    dump_model_path: Path = typer.Option(
+        None,
+        "--dump-model",
+        help="Also write the parsed table model to this file (.json: readable, .msgpack/.pickle: fast to load) | 파싱 결과 모델 파일 저장",
+    ),
+    pipeline: bool = typer.Option(
+        False,
+        "--pipeline",
+        help="Parse in a separate process and write sheets as tables arrive (overlaps parsing and writing; bounded memory with --engine stream; --layout sheet only) | 파싱/작성 동시 진행",
+    ),
+    pipeline_queue: int = typer.Option(
+        DEFAULT_QUEUE_SIZE,
+        "--pipeline-queue",
+        min=1,
+        help="Max parsed tables waiting to be written in --pipeline mode | 작성 대기 테이블 최대 수",
+        show_default=True,
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Print wall/CPU time and peak memory per phase and file, plus table/column/cell/merge/style counts | 단계별 시간/메모리 측정 결과 출력",
+    ),
+    profile_json: Path = typer.Option(
+        None,
+        "--profile-json",
+        help="Write the --profile result as JSON (implies --profile) | 측정 결과 JSON 저장",
+    ),
+    profile_cprofile: Path = typer.Option(
+        None,
+        "--profile-cprofile",
+        help="Dump cProfile stats of parsing and writing (pstats format) | 파싱/작성 구간 cProfile 결과 저장",
+    ),
 ):
     """
     Convert multiple DDL(.sql) files to a single Excel file, each as a sheet.
@@ -96,43 +588,226 @@ def main(
         )
         raise typer.Exit(1)
 
-    sql_file_list = collect_sql_files(ddl_file_paths, sql_directory)
-    if not sql_file_list:
+    # --- 엑셀 작성 엔진 validation
+    if engine not in WRITER_ENGINES:
         typer.echo(
-            "Specify one or more .sql files, or use --dir to provide a folder.\n*.sql 파일을 지정하거나 --dir 옵션으로 폴더를 입력하세요."
+            f"[ERROR] --engine supports only {', '.join(WRITER_ENGINES)}. (입력값: {engine})"
+        )
+        raise typer.Exit(1)
+    if layout not in SHEET_LAYOUTS:
+        typer.echo(
+            f"[ERROR] --layout supports only {', '.join(SHEET_LAYOUTS)}. (입력값: {layout})"
+        )
+        raise typer.Exit(1)
+    if output_format == "auto":
+        output_format = OUTPUT_FORMAT_SUFFIXES.get(
+            output_excel_path.suffix.lower(), "xlsx"
+        )
+    if output_format not in OUTPUT_FORMATS:
+        typer.echo(
+            f"[ERROR] --format supports only auto, {', '.join(OUTPUT_FORMATS)}. (입력값: {output_format})"
+        )
+        raise typer.Exit(1)
+    if output_format != "xlsx" and (
+        incremental
+        or shard_size
+        or pipeline
+        or engine != "openpyxl"
+        or layout != "sheet"
+    ):
+        typer.echo(
+            f"[ERROR] --format {output_format} cannot be combined with --incremental, --shard-size, --pipeline, --engine or --layout.\n--format {output_format} 는 --incremental, --shard-size, --pipeline, --engine, --layout 과 함께 사용할 수 없습니다."
+        )
+        raise typer.Exit(1)
+    if shard_size and incremental:
+        typer.echo(
+            "[ERROR] --shard-size cannot be combined with --incremental.\n--shard-size 는 --incremental 과 함께 사용할 수 없습니다."
+        )
+        raise typer.Exit(1)
+    if engine == "stream" and incremental:
+        typer.echo(
+            "[ERROR] --engine stream cannot be combined with --incremental.\n--engine stream 은 --incremental 과 함께 사용할 수 없습니다."
         )
         raise typer.Exit(1)
 
-    table_spec_dict: dict[str, list] = {}
-    for sql_file_path in sql_file_list:
+    if model_path and (ddl_file_paths or sql_directory or watch or pipeline):
+        typer.echo(
+            "[ERROR] --model cannot be combined with .sql files, --dir, --watch or --pipeline.\n--model 은 .sql 파일, --dir, --watch, --pipeline 과 함께 사용할 수 없습니다."
+        )
+        raise typer.Exit(1)
+    if dump_model_path and (watch or pipeline):
+        typer.echo(
+            "[ERROR] --dump-model cannot be combined with --watch or --pipeline.\n--dump-model 은 --watch, --pipeline 과 함께 사용할 수 없습니다."
+        )
+        raise typer.Exit(1)
+    if dump_model_path:
+        from app.model_io import ModelFileError, model_format
+
         try:
-            table_list = parse_ddl_file(sql_file_path)
-        except Exception as e:
-            typer.echo(f"[ERROR] Failed to parse file: {sql_file_path}\n{e}")
+            model_format(dump_model_path)
+        except ModelFileError as e:
+            typer.echo(f"[ERROR] --dump-model: {e}")
             raise typer.Exit(1)
-        sheet_name = sql_file_path.stem
-        table_spec_dict[sheet_name] = table_list
 
-    typer.echo(
-        "Would you like to input table meta fields interactively? [y/N]: ", nl=False
+    if pipeline and (layout != "sheet" or shard_size or watch):
+        typer.echo(
+            "[ERROR] --pipeline supports only --layout sheet and cannot be combined with --shard-size or --watch.\n--pipeline 은 --layout sheet 만 지원하며 --shard-size, --watch 와 함께 사용할 수 없습니다."
+        )
+        raise typer.Exit(1)
+
+    if watch and (profile or profile_json or profile_cprofile):
+        typer.echo(
+            "[ERROR] --watch cannot be combined with --profile options.\n--watch 는 --profile 옵션과 함께 사용할 수 없습니다."
+        )
+        raise typer.Exit(1)
+
+    try:
+        meta_base, meta_file_overrides = (
+            load_meta_config(meta_config) if meta_config else ({}, {})
+        )
+    except MetaConfigError as e:
+        typer.echo(f"[ERROR] --meta-config: {e}")
+        raise typer.Exit(1)
+
+    if profile or profile_json:
+        PROFILER.start()
+    cprofiler = None
+    if profile_cprofile:
+        import cProfile
+
+        cprofiler = cProfile.Profile()
+
+    if model_path:
+        from app.model_io import ModelFileError, load_model
+
+        try:
+            with phase("load model"):
+                table_spec_dict, front_matters = load_model(model_path)
+        except ModelFileError as e:
+            typer.echo(f"[ERROR] --model: {e}")
+            raise typer.Exit(1)
+        sql_file_list = []
+    else:
+        with phase("collect"):
+            sql_file_list = collect_sql_files(ddl_file_paths, sql_directory)
+    if not (model_path or sql_file_list):
+        typer.echo(
+            "Specify one or more .sql files, or use --dir to provide a folder.\n*.sql 파일을 지정하거나 --dir 옵션으로 폴더를 입력하세요."
+        )
+        raise typer.Exit(1)
+
+    parse = partial(
+        parse_sql_files,
+        jobs=jobs,
+        prefilter=prefilter,
+        stream=stream,
+        cache=None if no_cache else ParseCache(cache_dir),
     )
-    if input().strip().lower() == "y":
-        meta_field_values = prompt_meta_fields(lang)
+    meta_base = {**meta_base, **meta_from_env()}
+    # csv/md/html 에는 메타 값을 쓰지 않으므로 입력 여부를 묻지 않음
+    prompt_meta = not (no_input or meta_config) and output_format == "xlsx"
+    if watch:
+        if prompt_meta and ask_meta_input():
+            meta_base = dict(zip(META_KEYS, prompt_meta_fields(lang), strict=True))
+        run_watch(
+            partial(watch_targets, ddl_file_paths, sql_directory),
+            parse,
+            partial(
+                _write_output,
+                output_excel_path=output_excel_path,
+                lang=lang,
+                incremental=incremental,
+                engine=engine,
+                layout=layout,
+                shard_size=shard_size,
+                jobs=jobs,
+                output_format=output_format,
+            ),
+            meta_base,
+            meta_file_overrides,
+            debounce=watch_debounce,
+        )
+        return
+
+    if pipeline:
+        # 파싱과 작성을 동시에 진행하므로 메타 값을 먼저 결정
+        meta_field_values, file_meta = _resolve_meta_values(
+            _read_front_matters(sql_file_list),
+            meta_base,
+            meta_file_overrides,
+            lang,
+            prompt_meta,
+        )
+        write = partial(
+            _write_pipeline,
+            parse,
+            sql_file_list,
+            queue_size=pipeline_queue,
+            stream_parse=(
+                partial(iter_parse_sql_file, prefilter=prefilter) if stream else None
+            ),
+        )
     else:
-        meta_field_values = [""] * 7
+        if not model_path:
+            if cprofiler:
+                cprofiler.enable()
+            table_spec_dict, parse_errors = parse(sql_file_list)
+            if cprofiler:
+                cprofiler.disable()
+            if parse_errors:
+                _echo_parse_errors(parse_errors)
+                raise typer.Exit(1)
+            front_matters = _read_front_matters(sql_file_list)
+        if dump_model_path:
+            from app.model_io import ModelFileError, dump_model
 
-    try:
-        write_excel_spec(
-            table_spec_dict,
-            output_excel_path,
-            lang=lang,
-            meta_field_values=meta_field_values,
+            try:
+                with phase("dump model"):
+                    dump_model(table_spec_dict, dump_model_path, front_matters)
+            except (ModelFileError, OSError) as e:
+                typer.echo(f"[ERROR] --dump-model: {e}")
+                raise typer.Exit(1)
+            typer.echo(f"[+] Model written → {dump_model_path}")
+        meta_field_values, file_meta = _resolve_meta_values(
+            front_matters, meta_base, meta_file_overrides, lang, prompt_meta
         )
+        if PROFILER.enabled:
+            for table_list in table_spec_dict.values():
+                PROFILER.count("tables", len(table_list))
+                PROFILER.count("columns", sum(len(spec.columns) for spec in table_list))
+        write = partial(_write_output, table_spec_dict, output_format=output_format)
+
+    if cprofiler:
+        cprofiler.enable()
+    try:
+        with phase("write"):
+            write(
+                output_excel_path,
+                lang,
+                meta_field_values,
+                incremental=incremental,
+                engine=engine,
+                layout=layout,
+                shard_size=shard_size,
+                jobs=jobs,
+                file_meta=file_meta,
+            )
+    except PipelineParseError as e:
+        _echo_parse_errors(e.errors)
+        raise typer.Exit(1)
     except Exception as e:
         typer.echo(f"[ERROR] Failed to write Excel file: {output_excel_path}\n{e}")
         raise typer.Exit(1)
+    finally:
+        if cprofiler:
+            cprofiler.disable()
+            cprofiler.dump_stats(profile_cprofile)
 
-    typer.echo(f"[+] Conversion complete → {output_excel_path} (Language: {lang})")
+    if PROFILER.enabled:
+        typer.echo(PROFILER.format_table())
+        if profile_json:
+            PROFILER.write_json(profile_json)
+        PROFILER.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+import hashlib
+import json
+from pathlib import Path
+
+from app.model import TableSpec
+
+# 시트 레이아웃(엑셀 작성 방식)이 바뀌면 올림 (증분 빌드 시 전체 재작성)
+SHEET_LAYOUT_VERSION = 4
+MANIFEST_SUFFIX = ".manifest.json"
+SHARD_MANIFEST_SUFFIX = ".shards.json"
+SHARD_MANIFEST_VERSION = 1
+
+
+def manifest_path_for(output_excel_path: Path) -> Path:
+    return output_excel_path.with_name(output_excel_path.name + MANIFEST_SUFFIX)
+
+
+def sheet_key(
+    sheet_name: str, table_spec: TableSpec, taken: dict | set | None = None
+) -> str:
+    """
+    매니페스트 키: 잘리기 전 시트 이름 ({파일명}_{테이블명}).
+    같은 테이블이 두 번 정의된 경우 taken 에 없는 키가 되도록 #2, #3 ... 을 붙임
+    """
+    key = base_key = f"{sheet_name}_{table_spec.table_name}"
+    suffix = 1
+    while taken and key in taken:
+        suffix += 1
+        key = f"{base_key}#{suffix}"
+    return key
+
+
+def sheet_hash(
+    table_specs: list[TableSpec],
+    lang: str,
+    meta_field_values: list,
+    layout: str,
+    references: list | None = None,
+) -> str:
+    """
+    시트 내용을 결정하는 값(시트에 들어가는 테이블 스펙, 메타 값, 언어, 레이아웃,
+    다른 테이블에서 가져온 참조 정보)의 해시
+    """
+    payload = json.dumps(
+        [
+            SHEET_LAYOUT_VERSION,
+            layout,
+            lang,
+            meta_field_values,
+            [table_spec.to_dict() for table_spec in table_specs],
+            references,
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest(output_excel_path: Path) -> dict[str, dict[str, str]]:
+    """
+    {시트 키: {"title": 실제 시트 이름, "hash": 내용 해시}} 반환.
+    매니페스트나 엑셀 파일이 없거나 버전이 다르면 빈 dict (전체 재작성).
+    """
+    manifest_path = manifest_path_for(output_excel_path)
+    if not output_excel_path.is_file() or not manifest_path.is_file():
+        return {}
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != SHEET_LAYOUT_VERSION:
+        return {}
+    return manifest.get("sheets", {})
+
+
+def save_manifest(output_excel_path: Path, sheets: dict[str, dict[str, str]]):
+    manifest_path_for(output_excel_path).write_text(
+        json.dumps(
+            {"version": SHEET_LAYOUT_VERSION, "sheets": sheets},
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+
+def shard_manifest_path_for(output_excel_path: Path) -> Path:
+    return output_excel_path.with_name(output_excel_path.name + SHARD_MANIFEST_SUFFIX)
+
+
+def save_shard_manifest(output_excel_path: Path, shards: list[dict]):
+    """
+    --shard-size 결과 목록: [{"file": 샤드 파일명, "tables": [{"source", "table"}],
+    "sheets": {시트 키: 시트 이름}}]
+    """
+    shard_manifest_path_for(output_excel_path).write_text(
+        json.dumps(
+            {"version": SHARD_MANIFEST_VERSION, "shards": shards},
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
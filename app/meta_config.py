@@ -0,0 +1,143 @@
+import os
+from pathlib import Path
+
+# 입력받는 메타 항목 7개 (META_FIELDS_KO/EN 앞 7개와 같은 순서, 테이블명/상세설명은 DDL 에서)
+META_KEYS = ("system", "author", "date", "project", "dbms", "db_name", "schema")
+# 환경 변수: DDL2EXCEL_META_AUTHOR=홍길동
+META_ENV_PREFIX = "DDL2EXCEL_META_"
+# .sql 파일 맨 앞 주석: -- meta.author: 홍길동
+FRONT_MATTER_PREFIX = "meta."
+
+
+class MetaConfigError(ValueError):
+    """메타 설정 파일 / 환경 변수 / front-matter 형식 오류"""
+
+
+def _normalize_key(key: str, source: str) -> str:
+    normalized = key.strip().lower().replace("-", "_")
+    if normalized not in META_KEYS:
+        raise MetaConfigError(
+            f"{source}: unknown meta key '{key}' (allowed: {', '.join(META_KEYS)})"
+        )
+    return normalized
+
+
+def _meta_values(data, source: str) -> dict[str, str]:
+    """{키: 값} 검증 (키 정규화, 값은 문자열로 변환: TOML 날짜 → 2024-01-31)"""
+    if not isinstance(data, dict):
+        raise MetaConfigError(f"{source}: expected a table of meta values")
+    values = {}
+    for key, value in data.items():
+        if isinstance(value, dict | list):
+            raise MetaConfigError(f"{source}: '{key}' must be a single value")
+        values[_normalize_key(key, source)] = "" if value is None else str(value)
+    return values
+
+
+def _load_yaml(text: str, path: Path):
+    try:
+        import yaml
+    except ImportError:
+        raise MetaConfigError(
+            f"{path}: reading YAML requires PyYAML (pip install pyyaml); use TOML instead"
+        )
+    try:
+        return yaml.safe_load(text) or {}
+    except yaml.YAMLError as e:
+        raise MetaConfigError(f"{path}: {e}")
+
+
+def load_meta_config(path: Path) -> tuple[dict[str, str], dict[str, dict[str, str]]]:
+    """
+    --meta-config 파일 (.toml 또는 .yaml/.yml) 읽기.
+    최상위 키는 모든 파일 공통 값, files.<파일명(확장자 제외)> 은 해당 .sql 파일 전용 값.
+    반환: (공통 값, {파일명: 파일별 값})
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise MetaConfigError(f"{path}: {e}")
+    if path.suffix.lower() in {".yaml", ".yml"}:
+        data = _load_yaml(text, path)
+    else:
+        import tomllib
+
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError as e:
+            raise MetaConfigError(f"{path}: {e}")
+    if not isinstance(data, dict):
+        raise MetaConfigError(f"{path}: expected a table of meta values")
+    data = dict(data)
+    files = data.pop("files", None) or {}
+    if not isinstance(files, dict):
+        raise MetaConfigError(f"{path}: 'files' must be a table keyed by file name")
+    return _meta_values(data, str(path)), {
+        str(name): _meta_values(values, f"{path} [files.{name}]")
+        for name, values in files.items()
+    }
+
+
+def meta_from_env(environ=None) -> dict[str, str]:
+    """DDL2EXCEL_META_<KEY> 환경 변수 값 (설정된 것만)"""
+    environ = os.environ if environ is None else environ
+    return {
+        key: environ[META_ENV_PREFIX + key.upper()]
+        for key in META_KEYS
+        if META_ENV_PREFIX + key.upper() in environ
+    }
+
+
+def read_front_matter(sql_file_path: Path) -> dict[str, str]:
+    """
+    .sql 파일 맨 앞 주석 블록의 '-- meta.<키>: 값' 줄 (첫 SQL 문 이전까지만 읽음).
+    pg_dump 머리말 같은 다른 주석 줄은 무시.
+    """
+    values = {}
+    with sql_file_path.open(encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith("--"):
+                break
+            comment = line[2:].strip()
+            if not comment.startswith(FRONT_MATTER_PREFIX) or ":" not in comment:
+                continue
+            key, value = comment[len(FRONT_MATTER_PREFIX) :].split(":", 1)
+            values[_normalize_key(key, str(sql_file_path))] = value.strip()
+    return values
+
+
+def meta_list(values: dict[str, str]) -> list[str]:
+    """{키: 값} → write_excel_spec 의 meta_field_values 순서 목록"""
+    return [values.get(key, "") for key in META_KEYS]
+
+
+def read_front_matters(sql_file_list: list[Path]) -> dict[str, dict[str, str]]:
+    """{파일명(확장자 제외): front-matter 값} (입력 순서)"""
+    return {
+        sql_file_path.stem: read_front_matter(sql_file_path)
+        for sql_file_path in sql_file_list
+    }
+
+
+def resolve_meta(
+    front_matters: dict[str, dict[str, str]],
+    base: dict[str, str],
+    file_overrides: dict[str, dict[str, str]] | None = None,
+) -> tuple[list[str], dict[str, list[str]]]:
+    """
+    파일별 메타 값 결정. 우선순위 (뒤가 우선):
+    base (설정 파일 공통 값 + 환경 변수 또는 직접 입력) → 설정 파일 files.<파일명> → front-matter
+    front_matters: read_front_matters 결과 (--model 입력이면 모델 파일에 저장된 값)
+    반환: (공통 메타 목록, {파일명: 공통과 다른 파일의 메타 목록})
+    """
+    file_overrides = file_overrides or {}
+    default = meta_list(base)
+    file_meta = {}
+    for stem, front_matter in front_matters.items():
+        values = {**base, **file_overrides.get(stem, {}), **front_matter}
+        if meta_list(values) != default:
+            file_meta[stem] = meta_list(values)
+    return default, file_meta
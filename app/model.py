@@ -0,0 +1,131 @@
+import io
+import pickle
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class ColumnSpec:
+    """컬럼 정의 한 줄 (__slots__ 로 인스턴스 dict 없이 보관)"""
+
+    column_name: str
+    type: str
+    pk: bool = False
+    nn: bool = False
+    default: str | None = None
+    ref_table: str | None = None
+    ref_column: str | None = None
+    comment: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "column_name": self.column_name,
+            "type": self.type,
+            "pk": self.pk,
+            "nn": self.nn,
+            "default": self.default,
+            "ref_table": self.ref_table,
+            "ref_column": self.ref_column,
+            "comment": self.comment,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ColumnSpec":
+        return cls(
+            column_name=intern_name(data["column_name"]),
+            type=intern_name(data["type"]),
+            pk=bool(data.get("pk")),
+            nn=bool(data.get("nn")),
+            default=data.get("default"),
+            ref_table=intern_name(data.get("ref_table")),
+            ref_column=intern_name(data.get("ref_column")),
+            comment=data.get("comment", ""),
+        )
+
+
+@dataclass(slots=True)
+class IndexSpec:
+    """인덱스 한 줄 (CREATE INDEX, PK / UNIQUE 제약이 만드는 인덱스 포함)"""
+
+    index_name: str
+    columns: list[str]
+    method: str = "btree"
+    unique: bool = False
+    primary: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index_name": self.index_name,
+            "columns": list(self.columns),
+            "method": self.method,
+            "unique": self.unique,
+            "primary": self.primary,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "IndexSpec":
+        return cls(
+            index_name=intern_name(data["index_name"]),
+            columns=[intern_name(column) for column in data["columns"]],
+            method=intern_name(data.get("method", "btree")),
+            unique=bool(data.get("unique")),
+            primary=bool(data.get("primary")),
+        )
+
+
+@dataclass(slots=True)
+class TableSpec:
+    """테이블 정의 (CREATE TABLE + COMMENT ON 결합 결과)"""
+
+    table_name: str
+    columns: list[ColumnSpec] = field(default_factory=list)
+    table_comment: str = ""
+    indexes: list[IndexSpec] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """기존 dict 형식 (매니페스트 해시 등 직렬화용)"""
+        return {
+            "table_name": self.table_name,
+            "columns": [column.to_dict() for column in self.columns],
+            "table_comment": self.table_comment,
+            "indexes": [index.to_dict() for index in self.indexes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TableSpec":
+        return cls(
+            table_name=intern_name(data["table_name"]),
+            columns=[ColumnSpec.from_dict(column) for column in data["columns"]],
+            table_comment=data.get("table_comment", ""),
+            indexes=[IndexSpec.from_dict(index) for index in data.get("indexes", [])],
+        )
+
+
+def intern_name(name: str | None) -> str | None:
+    """
+    테이블명/컬럼명/타입명은 반복이 많으므로 intern 으로 같은 문자열 객체 공유
+    (FK 의 ref_table 과 테이블명, 'bigint' 같은 타입명 등)
+    """
+    return None if name is None else sys.intern(name)
+
+
+class SpecUnpickler(pickle.Unpickler):
+    """
+    모델 클래스만 허용하는 unpickler (파싱 캐시 / pickle 모델 파일은 사용자가 지정한
+    디렉토리에서 읽으므로 pickle 로 임의 코드가 실행되지 않도록)
+    """
+
+    ALLOWED_CLASSES = {
+        ("app.model", cls.__name__): cls for cls in (TableSpec, ColumnSpec, IndexSpec)
+    }
+
+    def find_class(self, module: str, name: str):
+        try:
+            return self.ALLOWED_CLASSES[module, name]
+        except KeyError:
+            raise pickle.UnpicklingError(f"class {module}.{name} is not allowed")
+
+
+def load_specs_pickle(data: bytes) -> Any:
+    return SpecUnpickler(io.BytesIO(data)).load()
@@ -0,0 +1,150 @@
+import json
+import pickle
+from pathlib import Path
+from typing import Any
+
+from app.meta_config import META_KEYS
+from app.model import TableSpec, load_specs_pickle
+
+# 모델 파일 형식이 바뀌면 올림 (다른 버전 파일은 읽지 않음)
+MODEL_FORMAT = "ddl2excel-model"
+MODEL_VERSION = 1
+# 확장자 → 형식. json: 사람이 읽는 용도, msgpack / pickle: 빠른 읽기용 바이너리
+MODEL_SUFFIXES = {
+    ".json": "json",
+    ".msgpack": "msgpack",
+    ".mpk": "msgpack",
+    ".pickle": "pickle",
+    ".pkl": "pickle",
+}
+PICKLE_PROTOCOL = 5
+
+
+class ModelFileError(ValueError):
+    """모델 파일 형식 / 버전 오류"""
+
+
+def model_format(path: Path) -> str:
+    try:
+        return MODEL_SUFFIXES[path.suffix.lower()]
+    except KeyError:
+        raise ModelFileError(
+            f"{path}: unknown model file type (use {', '.join(sorted(MODEL_SUFFIXES))})"
+        )
+
+
+def _msgpack(path: Path):
+    try:
+        import msgpack
+    except ImportError:
+        raise ModelFileError(
+            f"{path}: msgpack model files require msgpack (pip install msgpack); "
+            "use .json or .pickle instead"
+        )
+    return msgpack
+
+
+def dump_model(
+    table_spec_dict: dict[str, list[TableSpec]],
+    path: Path,
+    front_matters: dict[str, dict[str, str]] | None = None,
+):
+    """
+    파싱 결과를 모델 파일로 저장 (형식은 확장자로 결정).
+    front_matters: {파일명: front-matter 메타 값} (--model 로 다시 읽을 때 .sql 대신 사용)
+    pickle 은 TableSpec 객체를 그대로 저장 (읽기가 가장 빠름, 같은 파서 버전에서만 읽음)
+    """
+    from app.parser import PARSER_VERSION
+
+    fmt = model_format(path)
+    front_matters = front_matters or {}
+    document = {
+        "format": MODEL_FORMAT,
+        "version": MODEL_VERSION,
+        "parser_version": PARSER_VERSION,
+        "files": [
+            {
+                "source": source,
+                "meta": front_matters.get(source, {}),
+                "tables": table_list
+                if fmt == "pickle"
+                else [table_spec.to_dict() for table_spec in table_list],
+            }
+            for source, table_list in table_spec_dict.items()
+        ],
+    }
+    if fmt == "json":
+        data = json.dumps(document, ensure_ascii=False, indent=2).encode("utf-8")
+    elif fmt == "msgpack":
+        data = _msgpack(path).packb(document, use_bin_type=True)
+    else:
+        data = pickle.dumps(document, protocol=PICKLE_PROTOCOL)
+    path.write_bytes(data)
+
+
+def _decode(path: Path, fmt: str) -> Any:
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        raise ModelFileError(f"{path}: {e}")
+    try:
+        if fmt == "json":
+            return json.loads(data)
+        if fmt == "msgpack":
+            return _msgpack(path).unpackb(data, raw=False)
+        return load_specs_pickle(data)
+    except ModelFileError:
+        raise
+    except Exception as e:
+        raise ModelFileError(f"{path}: not a valid {fmt} model file ({e})")
+
+
+def _front_matter(values: Any, path: Path, source: str) -> dict[str, str]:
+    if not isinstance(values, dict) or not all(
+        key in META_KEYS and isinstance(value, str) for key, value in values.items()
+    ):
+        raise ModelFileError(f"{path}: invalid meta values for '{source}'")
+    return values
+
+
+def load_model(
+    path: Path,
+) -> tuple[dict[str, list[TableSpec]], dict[str, dict[str, str]]]:
+    """
+    dump_model 로 저장한 모델 파일 읽기.
+    반환: ({파일명: 테이블 목록}, {파일명: front-matter 메타 값})
+    """
+    from app.parser import PARSER_VERSION
+
+    fmt = model_format(path)
+    document = _decode(path, fmt)
+    if not isinstance(document, dict) or document.get("format") != MODEL_FORMAT:
+        raise ModelFileError(f"{path}: not a ddl2excel model file")
+    if document.get("version") != MODEL_VERSION:
+        raise ModelFileError(
+            f"{path}: model version {document.get('version')} is not supported "
+            f"(expected {MODEL_VERSION}); export it again with --dump-model"
+        )
+    if fmt == "pickle" and document.get("parser_version") != PARSER_VERSION:
+        raise ModelFileError(
+            f"{path}: pickle model was written by parser version "
+            f"{document.get('parser_version')} (current {PARSER_VERSION}); "
+            "export it again or use the .json form"
+        )
+    table_spec_dict, front_matters = {}, {}
+    try:
+        for entry in document["files"]:
+            source = str(entry["source"])
+            if fmt == "pickle":
+                table_list = entry["tables"]
+                if not all(isinstance(spec, TableSpec) for spec in table_list):
+                    raise TypeError("unexpected table object")
+            else:
+                table_list = [TableSpec.from_dict(data) for data in entry["tables"]]
+            table_spec_dict[source] = table_list
+            front_matters[source] = _front_matter(entry.get("meta", {}), path, source)
+    except ModelFileError:
+        raise
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        raise ModelFileError(f"{path}: malformed model file ({e!r})")
+    return table_spec_dict, front_matters
@@ -1,6 +1,368 @@
 import re
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+
+from app.lexer import StatementScanner, iter_statement_spans
+from app.model import ColumnSpec, IndexSpec, TableSpec, intern_name
+from app.profiling import phase
+
+# 파싱 결과 형식이 바뀌면 올림 (파싱 캐시 무효화)
+PARSER_VERSION = "6"
+# 스키마 없이 쓴 테이블명은 기본 search_path 의 public 스키마로 간주
+DEFAULT_SCHEMA = "public"
+
+IDENTIFIER = r'[a-zA-Z0-9_"\.]+'
+# CREATE TABLE 안의 테이블 제약 (이름 있는 CONSTRAINT 포함, 여는 괄호까지)
+TABLE_CONSTRAINT_REGEX = re.compile(
+    rf"(?:constraint\s+({IDENTIFIER})\s+)?"
+    r"(primary\s+key|unique(?:\s+nulls\s+(?:not\s+)?distinct)?|foreign\s+key"
+    r"|check|exclude(?:\s+using\s+\w+)?)\s*\(",
+    re.IGNORECASE,
+)
+REFERENCES_REGEX = re.compile(rf"\s*references\s+({IDENTIFIER})\s*", re.IGNORECASE)
+CREATE_TABLE_HEAD_REGEX = re.compile(
+    rf"create\s+table\s+(?:if\s+not\s+exists\s+)?({IDENTIFIER})\s*\(", re.IGNORECASE
+)
+
+# CREATE TABLE 본문 / 괄호 안 토큰 (소유 수량자로 백트래킹 없이 선형 시간).
+# 공백/주석은 건너뛰고, 닫히지 않은 리터럴/주석은 입력 끝까지 한 토큰.
+# 끝의 \Z 는 뒤쪽 공백에서 finditer 가 위치마다 다시 시도하지 않도록 빈 매치로 끝냄
+_TOKEN_REGEX = re.compile(
+    r"""
+    (?:\s++|--[^\n]*+|/\*(?:[^*]++|\*(?!/))*+(?:\*/|\Z))*+
+    (?:
+        (?P<string>(?<![\w$])[eE]'(?:[^'\\]++|\\.|'')*+(?:'|\Z)|'(?:[^']++|'')*+(?:'|\Z))
+      | (?P<dollar>(?<![\w$])\$(?P<tag>(?:[^\W\d]\w*+)?)\$(?:.*?\$(?P=tag)\$|.*+))
+      | (?P<word>(?:[\w$.\[\]]++|"(?:[^"]++|"")*+(?:"|\Z))++)
+      | (?P<open>\()
+      | (?P<close>\))
+      | (?P<comma>,)
+      | (?P<other>.)
+      | \Z
+    )
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+# DEFAULT NULL (pg_dump: DEFAULT NULL::character varying) 은 기본값 없음과 같으므로 None
+_NULL_DEFAULT_REGEX = re.compile(r"null(?:\s*+::[^'\"$]*+)?", re.IGNORECASE)
+# 컬럼 정의에서 타입 / DEFAULT 값이 끝나는 키워드 (컬럼 제약 시작)
+COLUMN_KEYWORDS = frozenset(
+    {
+        "constraint",
+        "not",
+        "null",
+        "default",
+        "check",
+        "unique",
+        "primary",
+        "references",
+        "generated",
+        "collate",
+    }
+)
+
+CONSTRAINT_STATEMENT_REGEX = re.compile(
+    r"(?:create\s+(?:unique\s+)?index|alter\s+table)\b", re.IGNORECASE
+)
+CREATE_INDEX_REGEX = re.compile(
+    r"create\s+(unique\s+)?index\s+(?:concurrently\s+)?(?:if\s+not\s+exists\s+)?"
+    rf"(?:({IDENTIFIER})\s+)?on\s+(?:only\s+)?({IDENTIFIER})\s*"
+    r"(?:using\s+(\w+)\s*)?\(",
+    re.IGNORECASE,
+)
+ALTER_TABLE_REGEX = re.compile(
+    rf"alter\s+table\s+(?:if\s+exists\s+)?(?:only\s+)?({IDENTIFIER})\s",
+    re.IGNORECASE,
+)
+ADD_CONSTRAINT_REGEX = re.compile(
+    rf"\badd\s+(?:constraint\s+({IDENTIFIER})\s+)?"
+    r"(primary\s+key|unique(?:\s+nulls\s+(?:not\s+)?distinct)?|foreign\s+key)\s*\(",
+    re.IGNORECASE,
+)
+
+
+def table_key(table_name: str) -> str:
+    """테이블 매칭용 정규화 이름 (따옴표 제거 + 소문자, PostgreSQL 식별자 규칙)"""
+    return table_name.replace('"', "").lower()
+
+
+def qualified_key(table_name: str) -> str:
+    """
+    테이블 매칭 키: 스키마.테이블 (따옴표 제거 + 소문자, 스키마 없으면 public).
+    CREATE TABLE users 와 ALTER TABLE public.users 를 같은 테이블로 봄
+    """
+    key = table_key(table_name)
+    return key if "." in key else f"{DEFAULT_SCHEMA}.{key}"
+
+
+def _bare_table_name(table_name: str) -> str:
+    """public.users → users (기본 제약/인덱스 이름용)"""
+    return table_name.replace('"', "").rsplit(".", 1)[-1]
+
+
+Token = tuple[str, int, int]
+
+
+def _split_tokens(
+    text: str, pos: int = 0, enclosed: bool = False
+) -> tuple[list[list[Token]], int] | None:
+    """
+    괄호 밖 쉼표 기준 분리 → (항목마다 (종류, 시작, 끝) 토큰 목록, 끝 위치).
+    괄호 묶음은 ("paren", '(' 위치, ')' 다음 위치) 토큰 하나 (닫히지 않은 괄호는 제외).
+    enclosed: text[pos] 의 '(' 안쪽만 분리, 끝 위치는 짝이 맞는 ')' 다음 (없으면 None)
+    """
+    parts, current, group_start = [], [], 0
+    depth = -1 if enclosed else 0
+    for m in _TOKEN_REGEX.finditer(text, pos):
+        kind = m.lastgroup
+        if kind == "open":
+            if not depth:
+                group_start = m.start(kind)
+            depth += 1
+        elif depth > 0:
+            if kind == "close":
+                depth -= 1
+                if not depth:
+                    current.append(("paren", group_start, m.end()))
+        elif kind == "comma":
+            if current:
+                parts.append(current)
+            current = []
+        elif kind == "close" and enclosed:
+            if current:
+                parts.append(current)
+            return parts, m.end()
+        elif kind:
+            current.append((kind, m.start(kind), m.end()))
+    if enclosed:
+        return None
+    if current:
+        parts.append(current)
+    return parts, len(text)
+
+
+def _split_top_level(text: str) -> list[str]:
+    """괄호 밖 쉼표 기준 분리 (앞뒤 공백/주석 제거, 빈 항목 제외)"""
+    return [text[tokens[0][1] : tokens[-1][2]] for tokens in _split_tokens(text)[0]]
+
+
+def _balanced_paren(text: str, open_pos: int) -> tuple[str, int] | None:
+    """
+    text[open_pos] 의 '(' 와 짝이 맞는 ')' 까지의 안쪽 문자열, ')' 다음 위치
+    (문자열 / 따옴표 식별자 / 주석 안의 괄호는 무시)
+    """
+    depth = 0
+    for m in _TOKEN_REGEX.finditer(text, open_pos):
+        kind = m.lastgroup
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+            if not depth:
+                return text[open_pos + 1 : m.start(kind)], m.end()
+    return None
+
+
+def _key_columns(text: str) -> list[str]:
+    """제약/인덱스 컬럼 목록 (따옴표 제거, 표현식은 공백만 정리)"""
+    return [
+        intern_name(" ".join(part.replace('"', "").split()))
+        for part in _split_top_level(text)
+    ]
+
+
+def _parse_foreign_key(text: str, pos: int):
+    """
+    FOREIGN KEY (컬럼) 의 여는 괄호 위치부터 REFERENCES 대상까지 파싱.
+    반환: (컬럼 목록, 참조 테이블, 참조 컬럼 목록) 또는 None
+    """
+    parsed = _balanced_paren(text, pos)
+    if parsed is None:
+        return None
+    inner, pos = parsed
+    m = REFERENCES_REGEX.match(text, pos)
+    if not m:
+        return None
+    ref_columns = []
+    if text.startswith("(", m.end()):
+        ref_parsed = _balanced_paren(text, m.end())
+        if ref_parsed:
+            ref_columns = _key_columns(ref_parsed[0])
+    return (
+        _key_columns(inner),
+        intern_name(m.group(1).replace('"', "")),
+        ref_columns,
+    )
+
+
+def _parse_column_definition(text: str, tokens: list[Token]):
+    """
+    컬럼 정의 토큰 → (ColumnSpec, UNIQUE 여부, 참조 (테이블, 컬럼 목록) 또는 None).
+    타입은 컬럼명 다음부터, DEFAULT 값은 DEFAULT 다음부터 첫 제약 키워드 전까지.
+    괄호 / 문자열 안의 키워드는 무시. 토큰을 한 번씩만 보므로 입력 길이에 선형
+    """
+    if len(tokens) < 2 or tokens[0][0] != "word":
+        return None
+    words = [
+        text[start:end].lower() if kind == "word" else None
+        for kind, start, end in tokens
+    ]
+    type_end = 1
+    while type_end < len(tokens) and words[type_end] not in COLUMN_KEYWORDS:
+        type_end += 1
+    if type_end == 1:
+        return None
+    column_type = " ".join(text[tokens[1][1] : tokens[type_end - 1][2]].split())
+    default_value, is_not_null, is_primary_key, is_unique = None, False, False, False
+    reference = None
+    idx = type_end
+    while idx < len(tokens):
+        word = words[idx]
+        next_word = words[idx + 1] if idx + 1 < len(tokens) else None
+        if word == "default" and idx + 1 < len(tokens):
+            value_end = idx + 2
+            while value_end < len(tokens) and words[value_end] not in COLUMN_KEYWORDS:
+                value_end += 1
+            default_value = text[tokens[idx + 1][1] : tokens[value_end - 1][2]]
+            default_value = default_value.replace("\n", " ")
+            if _NULL_DEFAULT_REGEX.fullmatch(default_value):
+                default_value = None
+            idx = value_end
+            continue
+        if word == "not" and next_word == "null":
+            is_not_null = True
+        elif word == "primary" and next_word == "key":
+            is_primary_key = True
+        elif word == "unique":
+            is_unique = True
+        elif word == "references" and idx + 1 < len(tokens):
+            kind, start, end = tokens[idx + 1]
+            if kind == "word":
+                ref_columns = []
+                if idx + 2 < len(tokens) and tokens[idx + 2][0] == "paren":
+                    _, paren_start, paren_end = tokens[idx + 2]
+                    key_columns = _key_columns(text[paren_start + 1 : paren_end - 1])
+                    if len(key_columns) == 1:
+                        ref_columns = key_columns
+                reference = (intern_name(text[start:end].replace('"', "")), ref_columns)
+        elif word == "constraint":
+            # 제약 이름 건너뜀
+            idx += 1
+        idx += 1
+    column_spec = ColumnSpec(
+        column_name=intern_name(text[tokens[0][1] : tokens[0][2]].replace('"', "")),
+        type=intern_name(column_type),
+        pk=is_primary_key,
+        nn=is_not_null,
+        default=default_value,
+    )
+    return column_spec, is_unique, reference
+
+
+def _set_references(columns: dict[str, ColumnSpec], foreign_key):
+    """FK 컬럼에 참조 테이블/컬럼 기록 (복합 FK 는 위치별로 짝지음)"""
+    fk_columns, ref_table, ref_columns = foreign_key
+    for idx, fk_col in enumerate(fk_columns):
+        column = columns.get(fk_col)
+        if column is not None:
+            column.ref_table = ref_table
+            column.ref_column = ref_columns[idx] if idx < len(ref_columns) else None
+
+
+class TableConstraintMap:
+    """
+    CREATE TABLE 밖에서 정의되는 인덱스 / 제약 (pg_dump 는 PK, UNIQUE, FK 를 모두
+    ALTER TABLE ... ADD CONSTRAINT 로, 인덱스는 CREATE INDEX 로 따로 출력).
+    문장을 한 번 순회하며 스키마를 포함한 테이블 키(qualified_key) 별로 모아 두고,
+    attach() 에서 테이블마다 dict 조회로 결합.
+    """
+
+    def __init__(self):
+        self.primary_keys: dict[str, IndexSpec] = {}
+        self.indexes: dict[str, list[IndexSpec]] = {}
+        self.foreign_keys: dict[str, list[tuple]] = {}
+
+    def add_statement(self, statement: str) -> str | None:
+        """CREATE INDEX / ALTER TABLE 문장이면 등록하고 대상 테이블 키 반환"""
+        m = CREATE_INDEX_REGEX.match(statement)
+        if m:
+            parsed = _balanced_paren(statement, m.end() - 1)
+            if parsed:
+                columns = _key_columns(parsed[0])
+                table_name = m.group(3)
+                index_name = m.group(2) or (
+                    f"{_bare_table_name(table_name)}_{'_'.join(columns)}_idx"
+                )
+                key = qualified_key(table_name)
+                self.indexes.setdefault(key, []).append(
+                    IndexSpec(
+                        index_name=intern_name(index_name.replace('"', "")),
+                        columns=columns,
+                        method=intern_name((m.group(4) or "btree").lower()),
+                        unique=bool(m.group(1)),
+                    )
+                )
+                return key
+            return None
+        m = ALTER_TABLE_REGEX.match(statement)
+        if not m:
+            return None
+        key, bare_name = qualified_key(m.group(1)), _bare_table_name(m.group(1))
+        for add in ADD_CONSTRAINT_REGEX.finditer(statement, m.end()):
+            constraint_name = add.group(1) and add.group(1).replace('"', "")
+            kind = add.group(2).lower()
+            if kind.startswith("foreign"):
+                foreign_key = _parse_foreign_key(statement, add.end() - 1)
+                if foreign_key:
+                    self.foreign_keys.setdefault(key, []).append(foreign_key)
+                continue
+            parsed = _balanced_paren(statement, add.end() - 1)
+            if parsed is None:
+                continue
+            columns = _key_columns(parsed[0])
+            if kind.startswith("primary"):
+                self.primary_keys[key] = IndexSpec(
+                    index_name=intern_name(constraint_name or f"{bare_name}_pkey"),
+                    columns=columns,
+                    unique=True,
+                    primary=True,
+                )
+            else:
+                self.indexes.setdefault(key, []).append(
+                    IndexSpec(
+                        index_name=intern_name(
+                            constraint_name or f"{bare_name}_{'_'.join(columns)}_key"
+                        ),
+                        columns=columns,
+                        unique=True,
+                    )
+                )
+        return key
+
+    def attach(self, table_spec: TableSpec):
+        """table_spec 에 해당하는 제약/인덱스를 결합하고 맵에서 제거 (다시 호출해도 안전)"""
+        key = qualified_key(table_spec.table_name)
+        primary = self.primary_keys.pop(key, None)
+        indexes = self.indexes.pop(key, None)
+        foreign_keys = self.foreign_keys.pop(key, None)
+        if primary is None and not indexes and not foreign_keys:
+            return
+        columns = {column.column_name: column for column in table_spec.columns}
+        if primary is not None:
+            for column_name in primary.columns:
+                column = columns.get(column_name)
+                if column is not None:
+                    column.pk = column.nn = True
+            table_spec.indexes = [primary] + [
+                index for index in table_spec.indexes if not index.primary
+            ]
+        if indexes:
+            names = {index.index_name for index in table_spec.indexes}
+            table_spec.indexes.extend(
+                index for index in indexes if index.index_name not in names
+            )
+        for foreign_key in foreign_keys or ():
+            _set_references(columns, foreign_key)
 
 
 class DDLParser:
@@ -16,35 +378,49 @@ class DDLParser:
         re.IGNORECASE,
     )
 
-    def __init__(self, ddl_text: str):
+    CREATE_TABLE_REGEX = re.compile(r"create\s+table\b", re.IGNORECASE)
+
+    def __init__(self, ddl_text: str, prefilter: bool = False):
+        """
+        prefilter: COPY/INSERT 등 DDL 이 아닌 문장을 문장 분리 단계에서 건너뛰고,
+        코멘트 정규식도 COMMENT 문장에만 적용 (데이터가 포함된 전체 pg_dump 용)
+        """
         self.ddl_text = ddl_text
-        self.table_comments = self._parse_table_comments()
-        self.column_comments = self._parse_column_comments()
-        self.statements = self._split_statements()
-
-    def _split_statements(self) -> list[str]:
-        """; 기준으로 쿼리를 분리, 문자열 리터럴('') 예외 처리"""
-        statements, current, in_quote = [], "", 0
-        for char in self.ddl_text:
-            current += char
-            if char == "'":
-                in_quote = 1 - in_quote
-            if char == ";" and not in_quote:
-                statements.append(current.strip())
-                current = ""
-        if current.strip():
-            statements.append(current.strip())
-        return [s for s in statements if s]
+        self.prefilter = prefilter
+        with phase("split"):
+            self.statement_spans = self._split_statement_spans()
+        with phase("comments"):
+            self.table_comments = self._parse_table_comments()
+            self.column_comments = self._parse_column_comments()
+        with phase("constraints"):
+            self.constraints = self._parse_constraints()
+
+    def _split_statement_spans(self) -> list[tuple[int, int]]:
+        """; 기준 문장 분리 결과를 원본 텍스트 오프셋 (start, end) 로 보관"""
+        return list(iter_statement_spans(self.ddl_text, ddl_only=self.prefilter))
+
+    def _iter_comment_matches(self, regex: re.Pattern) -> Iterator[re.Match]:
+        if not self.prefilter:
+            yield from regex.finditer(self.ddl_text)
+            return
+        for start, end in self.statement_spans:
+            m = regex.match(self.ddl_text, start, end)
+            if m:
+                yield m
+
+    @property
+    def statements(self) -> list[str]:
+        return [self.ddl_text[start:end] for start, end in self.statement_spans]
 
     def _parse_table_comments(self) -> dict[str, str]:
         return {
             m.group(1).replace('"', ""): m.group(2)
-            for m in self.TABLE_COMMENT_REGEX.finditer(self.ddl_text)
+            for m in self._iter_comment_matches(self.TABLE_COMMENT_REGEX)
         }
 
     def _parse_column_comments(self) -> dict[tuple, str]:
         out = {}
-        for m in self.COLUMN_COMMENT_REGEX.finditer(self.ddl_text):
+        for m in self._iter_comment_matches(self.COLUMN_COMMENT_REGEX):
             table, col, comment = (
                 m.group(1).replace('"', ""),
                 m.group(2).replace('"', ""),
@@ -53,143 +429,264 @@ class DDLParser:
             out[(table, col)] = comment
         return out
 
-    def parse_tables(self) -> list[dict[str, Any]]:
+    def _parse_constraints(self) -> TableConstraintMap:
+        """CREATE INDEX / ALTER TABLE ADD CONSTRAINT 를 한 번 순회로 테이블별 맵에 등록"""
+        constraints = TableConstraintMap()
+        for start, end in self.statement_spans:
+            if CONSTRAINT_STATEMENT_REGEX.match(self.ddl_text, start, end):
+                constraints.add_statement(self.ddl_text[start:end])
+        return constraints
+
+    # 병렬 파싱 시 워커당 청크 수 (청크 크기 불균형 완화)
+    CHUNKS_PER_JOB = 4
+
+    def _iter_create_table_statements(self) -> Iterator[str]:
+        for start, end in self.statement_spans:
+            if self.CREATE_TABLE_REGEX.match(self.ddl_text, start, end):
+                yield self.ddl_text[start:end]
+
+    def _parse_create_tables_parallel(self, jobs: int) -> list:
+        """CREATE TABLE 문장을 문장 경계 기준 청크로 나눠 프로세스 풀에서 파싱"""
+        from concurrent.futures import ProcessPoolExecutor
+
+        statements = list(self._iter_create_table_statements())
+        chunk_count = min(len(statements), jobs * self.CHUNKS_PER_JOB) or 1
+        chunk_size = -(-len(statements) // chunk_count)
+        chunks = [
+            statements[i : i + chunk_size]
+            for i in range(0, len(statements), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return [
+                parsed
+                for chunk_result in executor.map(_parse_create_table_chunk, chunks)
+                for parsed in chunk_result
+            ]
+
+    def parse_tables(self, jobs: int = 1) -> list[TableSpec]:
         """
         CREATE TABLE 구문 기준 테이블/컬럼 파싱 및 코멘트 매핑
+        jobs > 1 이면 컬럼 파싱만 프로세스 풀에서 수행하고 코멘트는 여기서 결합
         """
+        with phase("columns"):
+            return self._parse_tables(jobs)
+
+    def _parse_tables(self, jobs: int) -> list[TableSpec]:
+        if jobs > 1:
+            parsed_list = self._parse_create_tables_parallel(jobs)
+        else:
+            parsed_list = map(
+                self._parse_create_table, self._iter_create_table_statements()
+            )
         tables = []
-        for stmt in self.statements:
-            if not stmt.lower().startswith("create table"):
-                continue
-            parsed = self._parse_create_table(stmt)
+        for parsed in parsed_list:
             if parsed:
-                table_name, columns = parsed
+                table_name, columns, indexes = parsed
                 # 컬럼별 코멘트 할당
                 for col in columns:
-                    col["comment"] = self.column_comments.get(
-                        (table_name, col["column_name"]), ""
+                    col.comment = self.column_comments.get(
+                        (table_name, col.column_name), ""
                     )
-                tables.append(
-                    {
-                        "table_name": table_name,
-                        "columns": columns,
-                        "table_comment": self.table_comments.get(table_name, ""),
-                    }
+                table_spec = TableSpec(
+                    table_name=table_name,
+                    columns=columns,
+                    table_comment=self.table_comments.get(table_name, ""),
+                    indexes=indexes,
                 )
+                self.constraints.attach(table_spec)
+                tables.append(table_spec)
         return tables
 
-    def _parse_create_table(self, statement: str):
+    @staticmethod
+    def _parse_create_table(statement: str):
         """
-        CREATE TABLE 구문에서 테이블명, 컬럼 스펙 추출 (기존 파싱 코드)
+        CREATE TABLE 구문에서 테이블명, 컬럼 스펙, 인라인 PK/UNIQUE 인덱스 추출
+        반환: (테이블명, 컬럼 목록, 인덱스 목록) 또는 None
         """
-        table_match = re.match(
-            r"create\s+table\s+(?:if\s+not\s+exists\s+)?([a-zA-Z0-9_\"\.]+)\s*\((.+)\)",
-            statement,
-            re.IGNORECASE | re.DOTALL,
-        )
+        table_match = CREATE_TABLE_HEAD_REGEX.match(statement)
         if not table_match:
             return None
-        table_name = table_match.group(1).replace('"', "")
-        table_body = table_match.group(2)
-
-        column_block_list, current_block, paren_depth = [], "", 0
-        for char in table_body:
-            if char == "(":
-                paren_depth += 1
-            elif char == ")" and paren_depth > 0:
-                paren_depth -= 1
-            if char == "," and paren_depth == 0:
-                if current_block.strip():
-                    column_block_list.append(current_block.strip())
-                current_block = ""
-            else:
-                current_block += char
-        if current_block.strip():
-            column_block_list.append(current_block.strip())
-
-        columns, primary_key_columns, foreign_key_columns = [], set(), set()
-        for column_def in column_block_list:
-            column_def = column_def.replace("\n", " ").strip()
-            pk_match = re.match(
-                r"primary key\s*\((.+?)\)\s*$", column_def, re.IGNORECASE
-            )
-            if pk_match:
-                for pk_col in pk_match.group(1).split(","):
-                    primary_key_columns.add(pk_col.strip().replace('"', ""))
-                continue
-            if column_def.lower().startswith(("unique", "check")):
-                continue
-            column_match = re.match(r"^([a-zA-Z0-9_\"\.]+)\s+(.+)$", column_def)
-            if not column_match:
-                continue
-            column_name, rest = column_match.group(1), column_match.group(2)
-            type_match = re.match(
-                r"([a-zA-Z0-9_\[\]\"\.]+(\s*\(\s*\d+(?:\s*,\s*\d+)?\s*\))?(\[\])?)",
-                rest,
-            )
-            if not type_match:
+        parsed_body = _split_tokens(statement, table_match.end() - 1, enclosed=True)
+        if parsed_body is None:
+            return None
+        table_name = intern_name(table_match.group(1).replace('"', ""))
+        bare_name = _bare_table_name(table_name)
+
+        columns, primary_key_columns, foreign_keys = [], set(), []
+        primary_index, indexes = None, []
+        for tokens in parsed_body[0]:
+            column_def = statement[tokens[0][1] : tokens[-1][2]]
+            constraint_match = TABLE_CONSTRAINT_REGEX.match(column_def)
+            if constraint_match:
+                constraint_name = constraint_match.group(1)
+                if constraint_name:
+                    constraint_name = intern_name(constraint_name.replace('"', ""))
+                kind = constraint_match.group(2).lower()
+                if kind.startswith("foreign"):
+                    foreign_key = _parse_foreign_key(
+                        column_def, constraint_match.end() - 1
+                    )
+                    if foreign_key:
+                        foreign_keys.append(foreign_key)
+                    continue
+                parsed = _balanced_paren(column_def, constraint_match.end() - 1)
+                if parsed is None or not kind.startswith(("primary", "unique")):
+                    continue
+                key_columns = _key_columns(parsed[0])
+                if kind.startswith("primary"):
+                    primary_key_columns.update(key_columns)
+                    primary_index = IndexSpec(
+                        index_name=constraint_name or f"{bare_name}_pkey",
+                        columns=key_columns,
+                        unique=True,
+                        primary=True,
+                    )
+                else:
+                    indexes.append(
+                        IndexSpec(
+                            index_name=constraint_name
+                            or f"{bare_name}_{'_'.join(key_columns)}_key",
+                            columns=key_columns,
+                            unique=True,
+                        )
+                    )
                 continue
-            column_type = type_match.group(1)
-            rest_attrs = rest[type_match.end() :].strip()
-            default_value = None
-            default_match = re.search(
-                r"default\s+(.+?)(?=\s+(not\s+null|null|constraint|,|$))",
-                rest_attrs,
-                re.IGNORECASE,
-            )
-            if default_match:
-                default_value = default_match.group(1).strip()
-            is_not_null = bool(re.search(r"\bnot\s+null\b", rest_attrs, re.IGNORECASE))
-            is_primary_key = bool(
-                re.search(r"\bprimary\s+key\b", rest_attrs, re.IGNORECASE)
-            )
-            fk_constraint_match = re.match(
-                r'constraint\s+[a-zA-Z0-9_"]*\s*foreign\s+key\s*\(([^)]+)\)\s*references\s+([a-zA-Z0-9_"]+)\s*\(([^)]+)\)',
-                column_def,
-                re.IGNORECASE,
-            )
-            if fk_constraint_match:
-                fk_columns = [
-                    c.strip().replace('"', "")
-                    for c in fk_constraint_match.group(1).split(",")
-                ]
-                ref_table = fk_constraint_match.group(2).replace('"', "")
-                ref_columns = [
-                    c.strip().replace('"', "")
-                    for c in fk_constraint_match.group(3).split(",")
-                ]
-                for fk_col, ref_col in zip(fk_columns, ref_columns, strict=False):
-                    foreign_key_columns.add((fk_col, ref_table, ref_col))
+            parsed_column = _parse_column_definition(statement, tokens)
+            if parsed_column is None:
                 continue
+            column_spec, is_unique, reference = parsed_column
+            column_name = column_spec.column_name
+            columns.append(column_spec)
+            if column_spec.pk and primary_index is None:
+                primary_index = IndexSpec(
+                    index_name=f"{bare_name}_pkey",
+                    columns=[column_name],
+                    unique=True,
+                    primary=True,
+                )
+            if is_unique:
+                indexes.append(
+                    IndexSpec(
+                        index_name=f"{bare_name}_{column_name}_key",
+                        columns=[column_name],
+                        unique=True,
+                    )
+                )
+            if reference:
+                foreign_keys.append(([column_name], *reference))
 
-            ref_table = ref_column = None
-            columns.append(
-                {
-                    "column_name": column_name,
-                    "type": column_type,
-                    "pk": is_primary_key,
-                    "nn": is_not_null,
-                    "default": default_value,
-                    "attrs": rest_attrs,
-                    "ref_table": ref_table,
-                    "ref_column": ref_column,
-                }
-            )
-
-        for fk_col, ref_table, ref_col in foreign_key_columns:
-            for col in columns:
-                if col["column_name"] == fk_col:
-                    col["ref_table"] = ref_table
-                    col["ref_column"] = ref_col
+        columns_by_name = {col.column_name: col for col in columns}
+        for foreign_key in foreign_keys:
+            _set_references(columns_by_name, foreign_key)
 
         for col in columns:
-            if col["column_name"] in primary_key_columns:
-                col["pk"] = True
-            if col["pk"]:
-                col["nn"] = True
-        return table_name, columns
+            if col.column_name in primary_key_columns:
+                col.pk = True
+            if col.pk:
+                col.nn = True
+        if primary_index is not None:
+            indexes.insert(0, primary_index)
+        return table_name, columns, indexes
+
+
+def _parse_create_table_chunk(statements: list[str]) -> list:
+    """프로세스 풀 워커: CREATE TABLE 문장 청크 파싱"""
+    return [DDLParser._parse_create_table(statement) for statement in statements]
+
+
+def parse_ddl_file(ddl_file_path: Path, prefilter: bool = False, jobs: int = 1):
+    with phase("read"):
+        ddl_text = ddl_file_path.read_text(encoding="utf-8")
+    parser = DDLParser(ddl_text, prefilter=prefilter)
+    return parser.parse_tables(jobs=jobs)
+
 
+STREAM_CHUNK_SIZE = 1 << 20
 
-def parse_ddl_file(ddl_file_path: Path):
-    parser = DDLParser(ddl_file_path.read_text(encoding="utf-8"))
-    return parser.parse_tables()
+
+def iter_ddl_file_statements(
+    ddl_file_path: Path, prefilter: bool = False, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    파일을 청크 단위로 읽으며 문장을 하나씩 반환.
+    메모리는 청크 크기 + 가장 긴 문장 하나 수준으로 유지.
+    """
+    scanner = StatementScanner(ddl_only=prefilter)
+    buffer = ""
+    read_size = chunk_size
+    with ddl_file_path.open(encoding="utf-8") as fp:
+        while True:
+            chunk = fp.read(read_size)
+            final = not chunk
+            buffer += chunk
+            for start, end in scanner.scan(buffer, final=final):
+                yield buffer[start:end]
+            if final:
+                return
+            # 청크보다 긴 문장은 다시 스캔하지 않도록 읽기 크기를 늘림
+            read_size = chunk_size if scanner.consumed else read_size * 2
+            buffer = buffer[scanner.consumed :]
+
+
+def _collect_constraints(
+    ddl_file_path: Path, chunk_size: int = STREAM_CHUNK_SIZE
+) -> TableConstraintMap:
+    """스트리밍 1차 패스: CREATE INDEX / ALTER TABLE 제약만 모음 (테이블은 버림)"""
+    constraints = TableConstraintMap()
+    for stmt in iter_ddl_file_statements(ddl_file_path, True, chunk_size):
+        if CONSTRAINT_STATEMENT_REGEX.match(stmt):
+            constraints.add_statement(stmt)
+    return constraints
+
+
+def iter_parse_ddl_file(
+    ddl_file_path: Path, prefilter: bool = False, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[TableSpec]:
+    """
+    스트리밍 파싱: 테이블을 하나씩 반환 (parse_ddl_file 과 같은 결과 형식).
+    COMMENT ON 은 pg_dump 순서처럼 대상 테이블 뒤 ~ 다음 CREATE TABLE 전에 오거나
+    테이블보다 먼저 나와야 반영됨 (이미 반환된 테이블의 코멘트는 무시).
+    CREATE INDEX / ALTER TABLE 제약은 pg_dump 처럼 모든 테이블 뒤에 나오므로
+    먼저 파일을 한 번 훑어 제약만 모아 두고, 두 번째 패스에서 결합한 뒤 반환
+    (반환한 테이블은 이후 바뀌지 않음, 메모리는 테이블이 아닌 제약 수에 비례).
+    """
+    constraints = _collect_constraints(ddl_file_path, chunk_size)
+    table_comments: dict[str, str] = {}
+    column_comments: dict[tuple, str] = {}
+    pending, pending_columns = None, {}
+    for stmt in iter_ddl_file_statements(ddl_file_path, prefilter, chunk_size):
+        if DDLParser.CREATE_TABLE_REGEX.match(stmt):
+            parsed = DDLParser._parse_create_table(stmt)
+            if not parsed:
+                continue
+            if pending:
+                yield pending
+            table_name, columns, indexes = parsed
+            for col in columns:
+                col.comment = column_comments.pop((table_name, col.column_name), "")
+            pending = TableSpec(
+                table_name=table_name,
+                columns=columns,
+                table_comment=table_comments.pop(table_name, ""),
+                indexes=indexes,
+            )
+            constraints.attach(pending)
+            pending_columns = {col.column_name: col for col in columns}
+            continue
+        m = DDLParser.TABLE_COMMENT_REGEX.match(stmt)
+        if m:
+            table = m.group(1).replace('"', "")
+            if pending and pending.table_name == table:
+                pending.table_comment = m.group(2)
+            else:
+                table_comments[table] = m.group(2)
+            continue
+        m = DDLParser.COLUMN_COMMENT_REGEX.match(stmt)
+        if m:
+            table, col = m.group(1).replace('"', ""), m.group(2).replace('"', "")
+            if pending and pending.table_name == table and col in pending_columns:
+                pending_columns[col].comment = m.group(3)
+            else:
+                column_comments[(table, col)] = m.group(3)
+    if pending:
+        yield pending
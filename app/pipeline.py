@@ -0,0 +1,111 @@
+import queue
+import signal
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from app.model import TableSpec
+
+# --pipeline: 파서 프로세스와 엑셀 작성 사이 큐에 쌓일 수 있는 최대 테이블 수
+DEFAULT_QUEUE_SIZE = 64
+# 큐 대기 중 파서 프로세스 생존 확인 간격 (초)
+PRODUCER_CHECK_INTERVAL = 1.0
+
+ParseFunc = Callable[[list[Path]], tuple[dict[str, list], list[tuple[Path, str]]]]
+StreamParseFunc = Callable[[Path], Iterator[TableSpec]]
+
+
+class PipelineParseError(Exception):
+    """파서 프로세스에서 파싱에 실패한 파일 [(경로, 에러 메시지)]"""
+
+    def __init__(self, errors: list[tuple[Path, str]]):
+        super().__init__(f"{len(errors)} file(s) failed to parse")
+        self.errors = errors
+
+
+def _produce(
+    parse: ParseFunc,
+    sql_file_list: list[Path],
+    table_queue,
+    stream_parse: StreamParseFunc | None = None,
+):
+    """
+    파서 프로세스: 파일을 입력 순서대로 하나씩 파싱해 테이블을 큐에 넣음 (큐가 차면 대기).
+    ALTER TABLE / CREATE INDEX 가 파일 끝에 모이는 pg_dump 때문에 파일 단위로 파싱을 마친 뒤 넣음
+    stream_parse 가 있으면 (--stream) 제약이 이미 결합된 테이블을 파싱되는 대로 넣음
+    Ctrl+C 는 작성 쪽(부모 프로세스)이 받아 이 프로세스를 종료함
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        for sql_file_path in sql_file_list:
+            if stream_parse is not None:
+                try:
+                    for table_spec in stream_parse(sql_file_path):
+                        table_queue.put(("table", sql_file_path.stem, table_spec))
+                except Exception as e:
+                    table_queue.put(("error", sql_file_path, str(e)))
+                continue
+            try:
+                table_spec_dict, errors = parse([sql_file_path])
+            except Exception as e:
+                table_spec_dict, errors = {}, [(sql_file_path, str(e))]
+            for path, error in errors:
+                table_queue.put(("error", path, error))
+            for table_spec in table_spec_dict.get(sql_file_path.stem, ()):
+                table_queue.put(("table", sql_file_path.stem, table_spec))
+    finally:
+        table_queue.put(None)
+
+
+def _get(table_queue, producer):
+    """큐에서 하나 꺼냄 (파서 프로세스가 끝 표시 없이 죽었으면 RuntimeError)"""
+    while True:
+        try:
+            return table_queue.get(timeout=PRODUCER_CHECK_INTERVAL)
+        except queue.Empty:
+            if producer.is_alive():
+                continue
+            try:
+                return table_queue.get(timeout=PRODUCER_CHECK_INTERVAL)
+            except queue.Empty:
+                raise RuntimeError(
+                    f"parser process exited unexpectedly (exit code {producer.exitcode})"
+                )
+
+
+def iter_pipeline_tables(
+    parse: ParseFunc,
+    sql_file_list: list[Path],
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    stream_parse: StreamParseFunc | None = None,
+) -> Iterator[tuple[str, TableSpec]]:
+    """
+    --pipeline: 별도 프로세스에서 파싱하면서 (입력 파일명, 테이블) 을 입력 순서대로 yield.
+    작성이 느리면 큐가 차서 파싱이 멈추므로 메모리에는 파싱 중인 파일 하나의 결과와
+    큐의 테이블 최대 queue_size 개만 있음 (전체 스키마를 모으지 않음).
+    stream_parse (--stream) 를 주면 파일 하나의 결과도 모으지 않고 테이블 단위로 넘김.
+    파싱에 실패한 파일이 있으면 나머지를 모두 받은 뒤 PipelineParseError
+    (작성 쪽은 저장 전에 중단되므로 파싱 오류 시 출력 파일이 생기지 않음)
+    """
+    import multiprocessing
+
+    table_queue = multiprocessing.Queue(maxsize=queue_size)
+    producer = multiprocessing.Process(
+        target=_produce, args=(parse, sql_file_list, table_queue, stream_parse)
+    )
+    producer.start()
+    errors = []
+    finished = False
+    try:
+        while (item := _get(table_queue, producer)) is not None:
+            kind, source, value = item
+            if kind == "error":
+                errors.append((source, value))
+                continue
+            yield source, value
+        finished = True
+    finally:
+        if not finished:
+            producer.terminate()
+        producer.join()
+    if errors:
+        raise PipelineParseError(errors)
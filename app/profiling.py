@@ -0,0 +1,151 @@
+import json
+import platform
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+PROFILE_VERSION = 2
+
+
+@dataclass(slots=True)
+class PhaseRecord:
+    """
+    단계 하나(같은 부모 단계 아래 같은 이름 + 파일)의 누적 측정값.
+    path: 부모 단계부터 이어진 경로 ("parse [a.sql]/read"), parent: 부모 단계 path
+    file: 지정하지 않으면 부모 단계의 파일 (파일별 파싱 안의 read/split 등)
+    """
+
+    name: str
+    file: str | None
+    depth: int
+    path: str
+    parent: str | None
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_bytes: int = 0
+
+
+class Profiler:
+    """
+    --profile: 단계별 wall/CPU 시간과 tracemalloc 최대 메모리, 개수 카운터 기록.
+    비활성 상태에서는 phase() / count() 가 아무 일도 하지 않음.
+    단계는 중첩 가능 (부모 단계의 최대 메모리는 자식 단계 구간을 포함).
+    프로세스 풀 워커 안의 단계(--jobs > 1 파싱, --shard-size 작성)는 측정되지 않고
+    부모 프로세스의 바깥 단계 시간에만 포함됨.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records: dict[str, PhaseRecord] = {}
+        self.counters: dict[str, int] = {}
+        self._peaks: list[list[int]] = []
+        self._stack: list[PhaseRecord] = []
+
+    def start(self):
+        self.enabled = True
+        tracemalloc.start()
+
+    def stop(self):
+        self.enabled = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str, file: str | None = None) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        if self._peaks:
+            # 부모 단계의 지금까지 최대값 보존 후 자식 구간 측정 시작
+            parent = self._peaks[-1]
+            parent[0] = max(parent[0], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        parent = self._stack[-1] if self._stack else None
+        segment = f"{name} [{file}]" if file else name
+        path = f"{parent.path}/{segment}" if parent else segment
+        # 시작 시점에 등록해 표에서 부모 단계가 자식보다 먼저 나오도록 함
+        record = self.records.get(path)
+        if record is None:
+            record = self.records[path] = PhaseRecord(
+                name,
+                file if file or parent is None else parent.file,
+                len(self._stack),
+                path,
+                parent.path if parent else None,
+            )
+        peak = [0]
+        self._peaks.append(peak)
+        self._stack.append(record)
+        wall_started, cpu_started = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_started
+            cpu = time.process_time() - cpu_started
+            self._peaks.pop()
+            self._stack.pop()
+            peak_bytes = max(peak[0], tracemalloc.get_traced_memory()[1])
+            if self._peaks:
+                self._peaks[-1][0] = max(self._peaks[-1][0], peak_bytes)
+            record.calls += 1
+            record.wall_seconds += wall
+            record.cpu_seconds += cpu
+            record.peak_bytes = max(record.peak_bytes, peak_bytes)
+
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def format_table(self) -> str:
+        """단계별 측정값 표 + 카운터"""
+        lines = [
+            f"{'phase':<32} {'wall ms':>10} {'cpu ms':>10} {'peak MB':>9} {'calls':>6}"
+        ]
+        for record in self.records.values():
+            label = "  " * record.depth + record.name
+            parent = self.records.get(record.parent) if record.parent else None
+            # 부모 단계와 같은 파일이면 파일명 생략 (들여쓰기로 구분)
+            if record.file and (parent is None or parent.file != record.file):
+                label += f" [{record.file}]"
+            lines.append(
+                f"{label:<32} {record.wall_seconds * 1000:10.1f} "
+                f"{record.cpu_seconds * 1000:10.1f} "
+                f"{record.peak_bytes / 1e6:9.2f} {record.calls:6d}"
+            )
+        if self.counters:
+            lines.append("")
+            lines.extend(
+                f"{name:<32} {value:>10,d}" for name, value in self.counters.items()
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": PROFILE_VERSION,
+            "python": platform.python_version(),
+            "phases": [asdict(record) for record in self.records.values()],
+            "counters": self.counters,
+        }
+
+    def write_json(self, path: Path):
+        path.write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+
+# 프로세스 전역 프로파일러 (main 에서 --profile 일 때만 start)
+PROFILER = Profiler()
+
+
+def phase(name: str, file: str | None = None):
+    """with phase("parse", file=...): 형태로 단계 측정 (비활성 시 비용 거의 없음)"""
+    return PROFILER.phase(name, file)
+
+
+def count(name: str, amount: int = 1):
+    PROFILER.count(name, amount)
@@ -0,0 +1,76 @@
+import hashlib
+
+from openpyxl.workbook.child import INVALID_TITLE_REGEX
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.worksheet.worksheet import Worksheet
+
+# 엑셀 시트 이름 제약: 31자, 대소문자 무시 중복 불가, []:*?/\ 사용 불가
+MAX_SHEET_TITLE_LENGTH = 31
+HASH_SUFFIX_LENGTH = 6
+HASH_SEPARATOR = "~"
+
+
+class SheetNameAllocator:
+    """
+    시트 키({파일명}_{테이블명}) → 시트 이름 할당 (이름 인덱스로 시트당 O(1)).
+    31자를 넘거나 이미 쓰인 이름은 앞부분 + '~' + 키 해시 6자리로 줄여
+    실행 순서와 무관하게 같은 키는 같은 이름이 되도록 함.
+    names: {시트 키: 시트 이름} (목차/하이퍼링크에서 참조)
+    """
+
+    def __init__(self, reserved=()):
+        self.names: dict[str, str] = {}
+        self._taken: set[str] = set()
+        for title in reserved:
+            self.reserve(title)
+
+    def reserve(self, title: str):
+        """이미 워크북에 있는 시트 이름 등록 (할당 대상에서 제외)"""
+        self._taken.add(title.casefold())
+
+    def assign(self, key: str, title: str):
+        """기존 시트 이름을 그대로 유지하는 키 등록 (증분 모드)"""
+        self.reserve(title)
+        self.names[key] = title
+
+    def allocate(self, key: str) -> str:
+        title = self.names.get(key)
+        if title is not None:
+            return title
+        title = INVALID_TITLE_REGEX.sub("_", key).strip("'") or "_"
+        if len(title) > MAX_SHEET_TITLE_LENGTH or title.casefold() in self._taken:
+            title = self._hashed_title(key, title)
+        self.assign(key, title)
+        return title
+
+    def _hashed_title(self, key: str, title: str) -> str:
+        prefix = title[: MAX_SHEET_TITLE_LENGTH - HASH_SUFFIX_LENGTH - 1]
+        attempt = 0
+        while True:
+            seed = key if attempt == 0 else f"{key}#{attempt}"
+            digest = hashlib.sha1(seed.encode("utf-8")).hexdigest()
+            candidate = f"{prefix}{HASH_SEPARATOR}{digest[:HASH_SUFFIX_LENGTH]}"
+            if candidate.casefold() not in self._taken:
+                return candidate
+            attempt += 1
+
+
+def add_sheet(wb, title: str):
+    """
+    SheetNameAllocator 로 받은 이름으로 시트 추가.
+    wb.create_sheet 는 제목 지정 시마다 전체 시트 이름을 훑어 중복을 검사하므로 (O(n))
+    부모 없이 생성한 뒤 제목/부모를 직접 연결 (openpyxl 내부 속성 사용, 3.1.x 고정).
+    내부 구조가 달라 제목이 그대로 들어가지 않으면 wb.create_sheet 로 대신 추가
+    (할당된 이름은 이미 중복이 없으므로 결과는 같고 느리기만 함).
+    """
+    sheet_class = WriteOnlyWorksheet if wb.write_only else Worksheet
+    ws = sheet_class(parent=None, title=None)
+    try:
+        ws._parent = wb
+        ws._WorkbookChild__title = title
+        if ws.title != title or ws.parent is not wb:
+            raise AttributeError("_WorkbookChild title")
+        wb._add_sheet(ws)
+    except (AttributeError, TypeError):
+        return wb.create_sheet(title)
+    return ws
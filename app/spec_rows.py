@@ -0,0 +1,102 @@
+import re
+
+from app.catalog import normalized_type
+from app.const import (
+    COLUMN_HEADERS_EN,
+    COLUMN_HEADERS_KO,
+    INDEX_HEADERS_EN,
+    INDEX_HEADERS_KO,
+    REF_DANGLING_NOTE_EN,
+    REF_DANGLING_NOTE_KO,
+    REF_TYPE_NOTE_EN,
+    REF_TYPE_NOTE_KO,
+)
+from app.model import ColumnSpec, TableSpec
+
+LENGTH_REGEX = re.compile(r"\((\d+)\)")
+
+
+def extract_length_from_type(type_str: str) -> str:
+    """타입 문자열에서 길이 추출"""
+    match = LENGTH_REGEX.search(type_str)
+    return match.group(1) if match else "-"
+
+
+def column_reference(column_spec, lang="ko", catalog=None) -> tuple[str, str]:
+    """
+    참조테이블 / 비고 칸 값 (참조 컬럼을 모르면 테이블명만).
+    catalog 가 있으면 참조 컬럼을 생략한 FK 는 대상 PK 컬럼으로 표시하고, 비고에
+    참조 대상 없음 또는 (타입이 다를 때) 참조 컬럼 타입 표시
+    """
+    ref_info, note = "-", "-"
+    if not column_spec.ref_table:
+        return ref_info, note
+    target = catalog.referenced_column(column_spec) if catalog else None
+    ref_info = column_spec.ref_table
+    ref_column = column_spec.ref_column or (target.column_name if target else None)
+    if ref_column:
+        ref_info = f"{column_spec.ref_table}.{ref_column}"
+    if catalog is None:
+        return ref_info, note
+    if catalog.is_dangling(column_spec):
+        note = REF_DANGLING_NOTE_KO if lang == "ko" else REF_DANGLING_NOTE_EN
+    elif target and normalized_type(target.type) != normalized_type(column_spec.type):
+        note = (REF_TYPE_NOTE_KO if lang == "ko" else REF_TYPE_NOTE_EN).format(
+            normalized_type(target.type).upper()
+        )
+    return ref_info, note
+
+
+def column_headers(lang: str) -> list[str]:
+    """컬럼 표 헤더 (엑셀 병합용 빈 칸 제외, 10개)"""
+    return [
+        header
+        for header in (COLUMN_HEADERS_KO if lang == "ko" else COLUMN_HEADERS_EN)
+        if header
+    ]
+
+
+def column_row(col_idx: int, column_spec: ColumnSpec, lang="ko", catalog=None) -> list:
+    """
+    컬럼 한 줄 값 (column_headers 순서): 번호, 컬럼명, 타입, 길이, 기본키, Null 불가,
+    기본값, 정의/설명, 참조테이블, 비고
+    """
+    ref_info, note = column_reference(column_spec, lang, catalog)
+    return [
+        col_idx,
+        column_spec.column_name,
+        column_spec.type.upper(),
+        extract_length_from_type(column_spec.type),
+        "Y" if column_spec.pk else "N",
+        "Y" if column_spec.nn else "N",
+        column_spec.default or "-",
+        column_spec.comment,
+        ref_info,
+        note,
+    ]
+
+
+def index_headers(lang: str) -> list[str]:
+    """인덱스 표 헤더 (엑셀 병합용 빈 칸 제외, 5개)"""
+    return [
+        header
+        for header in (INDEX_HEADERS_KO if lang == "ko" else INDEX_HEADERS_EN)
+        if header
+    ]
+
+
+def index_rows(table_spec: TableSpec) -> list[tuple]:
+    """
+    인덱스 값 (index_headers 순서): 번호, 이름, 타입(PK 또는 method), 유니크, 구성 컬럼.
+    인덱스가 없으면 '-' 한 줄
+    """
+    return [
+        (
+            index_idx,
+            index_spec.index_name,
+            "PK" if index_spec.primary else index_spec.method.upper(),
+            "Y" if index_spec.unique else "N",
+            ", ".join(index_spec.columns),
+        )
+        for index_idx, index_spec in enumerate(table_spec.indexes, 1)
+    ] or [(1, "-", "-", "-", "-")]
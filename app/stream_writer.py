@@ -0,0 +1,80 @@
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.worksheet.cell_range import CellRange
+
+
+class StreamingSheet:
+    """
+    openpyxl write-only 시트를 일반 시트처럼 쓰기 위한 어댑터.
+    excel_writer 의 블록 함수가 쓰는 ws.cell / ws.merge_cells / ws.append 만 지원.
+    행은 위에서 아래 순서로만 작성 가능하며, 더 아래 행을 건드리는 순간
+    위쪽 행은 XML 스트림으로 내보내고 메모리에서 제거한다.
+    열 너비(column_dimensions)와 sheet_view 는 첫 행 작성 전에 설정해야 함.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.parent = ws.parent
+        self.column_dimensions = ws.column_dimensions
+        self.sheet_view = ws.sheet_view
+        self._rows: dict[int, dict[int, WriteOnlyCell]] = {}
+        self._flushed_row = 0
+        self._current_row = 0
+        self.written_cells = 0
+
+    @property
+    def title(self):
+        return self.ws.title
+
+    def _flush_until(self, row: int):
+        """row 이전 행을 모두 스트림으로 내보냄"""
+        while self._flushed_row < row - 1:
+            self._flushed_row += 1
+            cells = self._rows.pop(self._flushed_row, None)
+            if not cells:
+                self.ws.append([])
+                continue
+            self.written_cells += len(cells)
+            self.ws.append([cells.get(col) for col in range(1, max(cells) + 1)])
+
+    def cell(self, row: int, column: int, value=None):
+        if row <= self._flushed_row:
+            raise ValueError(f"Row {row} has already been written")
+        if row > self._current_row:
+            self._flush_until(row)
+            self._current_row = row
+        cells = self._rows.setdefault(row, {})
+        cell = cells.get(column)
+        if cell is None:
+            cell = cells[column] = WriteOnlyCell(self.ws)
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def append(self, values):
+        row = self._current_row + 1
+        for col, value in enumerate(values, 1):
+            self.cell(row, col, value)
+        self._current_row = row
+
+    def merge_cells(self, start_row, start_column, end_row, end_column):
+        """병합 범위의 왼쪽 위 셀 외에는 값/스타일 초기화 (일반 시트 병합과 동일)"""
+        self.cell(start_row, start_column)
+        for row in range(start_row, end_row + 1):
+            cells = self._rows.setdefault(row, {})
+            for col in range(start_column, end_column + 1):
+                if (row, col) != (start_row, start_column):
+                    cells[col] = WriteOnlyCell(self.ws)
+        # 겹침 검사 없이 추가 (app.utils.merge_cells 참고)
+        self.ws.merged_cells.ranges.add(
+            CellRange(
+                min_col=start_column,
+                min_row=start_row,
+                max_col=end_column,
+                max_row=end_row,
+            )
+        )
+
+    def close(self):
+        """남은 행과 시트 꼬리(병합 정보 등)를 기록하고 시트 XML 을 닫음"""
+        self._flush_until(self._current_row + 1)
+        self.ws.close()
@@ -0,0 +1,184 @@
+import csv
+import html
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TextIO
+
+from app.catalog import SchemaCatalog
+from app.const import (
+    SOURCE_HEADER_EN,
+    SOURCE_HEADER_KO,
+    TABLE_SPEC_TITLE_EN,
+    TABLE_SPEC_TITLE_KO,
+    TOC_HEADERS_EN,
+    TOC_HEADERS_KO,
+    TOC_TITLE_EN,
+    TOC_TITLE_KO,
+)
+from app.model import TableSpec
+from app.spec_rows import column_headers, column_row, index_headers, index_rows
+
+# --format html: 외부 파일 없이 열리도록 문서 안에 넣는 스타일
+HTML_STYLE = """
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; margin: 0.5em 0 1.5em; font-size: 0.9em; }
+th, td { border: 1px solid #999; padding: 0.2em 0.5em; text-align: left; }
+th { background: #dde7f0; }
+"""
+
+
+def _title(lang: str) -> str:
+    return TABLE_SPEC_TITLE_KO if lang == "ko" else TABLE_SPEC_TITLE_EN
+
+
+def write_csv_spec(
+    table_spec_dict: dict[str, list[TableSpec]],
+    output_path: Path,
+    lang: str,
+    catalog: SchemaCatalog | None = None,
+):
+    """
+    전체 테이블의 컬럼 표를 CSV 하나로 (입력 파일, 테이블명, 컬럼 표 헤더 순서).
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함
+    """
+    table_header = (TOC_HEADERS_KO if lang == "ko" else TOC_HEADERS_EN)[1]
+    source_header = SOURCE_HEADER_KO if lang == "ko" else SOURCE_HEADER_EN
+    with output_path.open("w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([source_header, table_header, *column_headers(lang)])
+        for source, table_list in table_spec_dict.items():
+            for table_spec in table_list:
+                writer.writerows(
+                    [
+                        source,
+                        table_spec.table_name,
+                        *column_row(idx, col, lang, catalog),
+                    ]
+                    for idx, col in enumerate(table_spec.columns, 1)
+                )
+
+
+def _markdown_cell(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("|", "\\|").replace("\n", "<br>")
+
+
+def _write_markdown_table(f: TextIO, headers: list[str], rows: Iterable[Iterable]):
+    f.write("| " + " | ".join(headers) + " |\n")
+    f.write("|" + " --- |" * len(headers) + "\n")
+    for row in rows:
+        f.write("| " + " | ".join(map(_markdown_cell, row)) + " |\n")
+
+
+def write_markdown_spec(
+    table_spec_dict: dict[str, list[TableSpec]],
+    output_path: Path,
+    lang: str,
+    catalog: SchemaCatalog | None = None,
+):
+    """입력 파일별 ## 제목, 테이블별 ### 제목 + 설명 + 컬럼 표 + 인덱스 표"""
+    headers = column_headers(lang)
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write(f"# {_title(lang)}\n")
+        for source, table_list in table_spec_dict.items():
+            f.write(f"\n## {_markdown_cell(source)}\n")
+            for table_spec in table_list:
+                f.write(f"\n### {_markdown_cell(table_spec.table_name)}\n\n")
+                if table_spec.table_comment:
+                    f.write(f"{_markdown_cell(table_spec.table_comment)}\n\n")
+                _write_markdown_table(
+                    f,
+                    headers,
+                    (
+                        column_row(idx, col, lang, catalog)
+                        for idx, col in enumerate(table_spec.columns, 1)
+                    ),
+                )
+                f.write("\n")
+                _write_markdown_table(f, index_headers(lang), index_rows(table_spec))
+
+
+def _html_table_head(headers: list[str]) -> str:
+    cells = "".join(f"<th>{html.escape(header)}</th>" for header in headers)
+    return f"<table>\n<thead><tr>{cells}</tr></thead>\n<tbody>\n"
+
+
+def _write_html_table(f: TextIO, headers: list[str], rows: Iterable[Iterable]):
+    f.write(_html_table_head(headers))
+    for row in rows:
+        f.write("<tr>")
+        f.write("".join(f"<td>{html.escape(str(value))}</td>" for value in row))
+        f.write("</tr>\n")
+    f.write("</tbody>\n</table>\n")
+
+
+def write_html_spec(
+    table_spec_dict: dict[str, list[TableSpec]],
+    output_path: Path,
+    lang: str,
+    catalog: SchemaCatalog | None = None,
+):
+    """정적 HTML 한 파일: 목차(테이블 링크) + 입력 파일별 테이블 컬럼 표 / 인덱스 표"""
+    headers = column_headers(lang)
+    toc_headers = TOC_HEADERS_KO if lang == "ko" else TOC_HEADERS_EN
+    title = html.escape(_title(lang))
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write(
+            f'<!DOCTYPE html>\n<html lang="{lang}">\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{title}</title>\n<style>{HTML_STYLE}</style>\n</head>\n<body>\n"
+            f"<h1>{title}</h1>\n"
+            f"<h2>{html.escape(TOC_TITLE_KO if lang == 'ko' else TOC_TITLE_EN)}</h2>\n"
+        )
+        f.write(_html_table_head(toc_headers))
+        table_idx = 0
+        for table_list in table_spec_dict.values():
+            for table_spec in table_list:
+                table_idx += 1
+                f.write(
+                    f'<tr><td>{table_idx}</td><td><a href="#t{table_idx}">'
+                    f"{html.escape(table_spec.table_name)}</a></td>"
+                    f"<td>{html.escape(table_spec.table_comment)}</td></tr>\n"
+                )
+        f.write("</tbody>\n</table>\n")
+        table_idx = 0
+        for source, table_list in table_spec_dict.items():
+            f.write(f"<h2>{html.escape(source)}</h2>\n")
+            for table_spec in table_list:
+                table_idx += 1
+                f.write(
+                    f'<h3 id="t{table_idx}">{html.escape(table_spec.table_name)}</h3>\n'
+                )
+                if table_spec.table_comment:
+                    f.write(f"<p>{html.escape(table_spec.table_comment)}</p>\n")
+                _write_html_table(
+                    f,
+                    headers,
+                    (
+                        column_row(idx, col, lang, catalog)
+                        for idx, col in enumerate(table_spec.columns, 1)
+                    ),
+                )
+                _write_html_table(f, index_headers(lang), index_rows(table_spec))
+        f.write("</body>\n</html>\n")
+
+
+TEXT_WRITERS = {
+    "csv": write_csv_spec,
+    "md": write_markdown_spec,
+    "html": write_html_spec,
+}
+
+
+def write_text_spec(
+    table_spec_dict: dict[str, list[TableSpec]],
+    output_path: Path,
+    output_format: str,
+    lang: str,
+    catalog: SchemaCatalog | None = None,
+):
+    """
+    --format csv/md/html: 컬럼 표만 쓰는 가벼운 출력 (openpyxl / 워크북 없이 파일로 바로 기록).
+    헤더/값은 엑셀과 같은 app.const 상수와 app.spec_rows 사용 (메타 값은 엑셀에만 기록)
+    """
+    if output_format not in TEXT_WRITERS:
+        raise ValueError(f"Unknown text output format: {output_format}")
+    TEXT_WRITERS[output_format](table_spec_dict, output_path, lang, catalog)
@@ -1,4 +1,86 @@
-from copy import copy
+from itertools import islice
+from weakref import WeakKeyDictionary
+
+from openpyxl.cell.cell import MergedCell
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.merge import MergedCellRange
+from openpyxl.worksheet.worksheet import Worksheet
+
+
+class StyleRegistry:
+    """
+    워크북 단위 스타일 등록소.
+    (셀의 기존 스타일, font, fill, align, border) 조합마다 openpyxl 스타일 ID 배열
+    (StyleArray)을 한 번만 계산해 두고, 이후 같은 조합의 셀에는 ID 배열만 복사한다.
+    스타일 객체 복사/해시 비교 없이 app.const 의 상수 객체를 참조(id)로 구분.
+    """
+
+    def __init__(self):
+        self._styles: dict[tuple, StyleArray] = {}
+        # id() 키가 재사용되지 않도록 사용한 스타일 객체 참조 유지
+        self._style_objects: list[tuple] = []
+
+    def apply(self, cell, font=None, fill=None, align=None, border=None):
+        current = tuple(cell._style) if cell._style else ()
+        key = (current, id(font), id(fill), id(align), id(border))
+        style = self._styles.get(key)
+        if style is None:
+            if font:
+                cell.font = font
+            if fill:
+                cell.fill = fill
+            if align:
+                cell.alignment = align
+            if border:
+                cell.border = border
+            self._styles[key] = StyleArray(cell._style or StyleArray())
+            self._style_objects.append((font, fill, align, border))
+        else:
+            cell._style = StyleArray(style)
+        return cell
+
+    @property
+    def style_count(self) -> int:
+        """실제로 사용된 서로 다른 셀 스타일 수"""
+        return len({tuple(style) for style in self._styles.values()})
+
+
+_style_registries: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def get_style_registry(wb) -> StyleRegistry:
+    """워크북별 StyleRegistry (스타일 ID 는 워크북마다 다르므로 공유 불가)"""
+    registry = _style_registries.get(wb)
+    if registry is None:
+        registry = _style_registries[wb] = StyleRegistry()
+    return registry
+
+
+def merge_cells(ws, start_row, start_column, end_row, end_column):
+    """
+    ws.merge_cells 대체. openpyxl 은 병합할 때마다 기존 병합 범위 전체와 포함 여부를
+    비교하므로 (시트당 O(병합 수)) 한 시트에 테이블을 여러 개 쓰면 느려짐.
+    여기서 만드는 병합은 서로 겹치지 않으므로 비교 없이 바로 추가하고,
+    병합은 항상 스타일 적용 전에 하므로 테두리 재계산(format)도 생략.
+    """
+    if not isinstance(ws, Worksheet):
+        # 스트리밍/템플릿 기록용 시트는 자체 merge_cells 사용
+        ws.merge_cells(
+            start_row=start_row,
+            start_column=start_column,
+            end_row=end_row,
+            end_column=end_column,
+        )
+        return
+    merged_range = MergedCellRange(
+        ws,
+        f"{get_column_letter(start_column)}{start_row}"
+        f":{get_column_letter(end_column)}{end_row}",
+    )
+    ws.merged_cells.ranges.add(merged_range)
+    for row, col in islice(merged_range.cells, 1, None):
+        ws._cells[row, col] = MergedCell(ws, row, col)
 
 
 def merge_and_style(
@@ -12,17 +94,12 @@ def merge_and_style(
     align=None,
     border=None,
 ):
-    ws.merge_cells(start_row=row, start_column=col_from, end_row=row, end_column=col_to)
-    cell = ws.cell(row, col_from, value)
-    if font:
-        cell.font = copy(font)
-    if fill:
-        cell.fill = copy(fill)
-    if align:
-        cell.alignment = copy(align)
+    merge_cells(ws, row, col_from, row, col_to)
+    registry = get_style_registry(ws.parent)
+    cell = registry.apply(ws.cell(row, col_from, value), font, fill, align, border)
     if border:
-        for col in range(col_from, col_to + 1):
-            ws.cell(row, col).border = copy(border)
+        for col in range(col_from + 1, col_to + 1):
+            registry.apply(ws.cell(row, col), border=border)
     return cell
 
 
@@ -36,15 +113,6 @@ def set_row_style(
     col_from=1,
     col_to=12,
 ):
-    from copy import copy
-
+    registry = get_style_registry(ws.parent)
     for col in range(col_from, col_to + 1):
-        cell = ws.cell(row, col)
-        if font:
-            cell.font = copy(font)
-        if fill:
-            cell.fill = copy(fill)
-        if align:
-            cell.alignment = copy(align)
-        if border:
-            cell.border = copy(border)
+        registry.apply(ws.cell(row, col), font, fill, align, border)
@@ -0,0 +1,58 @@
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+# --watch 폴링 간격 / 기본 디바운스 (초)
+POLL_INTERVAL = 0.1
+DEFAULT_DEBOUNCE = 0.3
+
+FileState = dict[Path, tuple[int, int]]
+
+
+def file_state(paths: list[Path]) -> FileState:
+    """{경로: (mtime_ns, 크기)} (없어진 파일은 제외, 입력 순서 유지)"""
+    state = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def changed_paths(before: FileState, after: FileState) -> set[Path]:
+    """추가/수정/삭제된 경로"""
+    return {
+        path
+        for path in before.keys() | after.keys()
+        if before.get(path) != after.get(path)
+    }
+
+
+def iter_changes(
+    collect: Callable[[], list[Path]],
+    state: FileState,
+    debounce: float = DEFAULT_DEBOUNCE,
+    interval: float = POLL_INTERVAL,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> Iterator[set[Path]]:
+    """
+    collect() 가 돌려주는 파일 목록을 폴링해 변경된 경로 집합을 계속 yield.
+    연속 저장(에디터 임시 파일, 여러 파일 일괄 저장)은 debounce 초 동안 추가 변경이
+    없을 때까지 모아서 한 번에 전달. state: 시작 시점 file_state (그 이후 변경만 감지)
+    """
+    pending: set[Path] = set()
+    last_change = 0.0
+    while True:
+        sleep(interval)
+        current = file_state(collect())
+        changed = changed_paths(state, current)
+        state = current
+        if changed:
+            pending |= changed
+            last_change = clock()
+        elif pending and clock() - last_change >= debounce:
+            yield pending
+            pending = set()
@@ -0,0 +1,93 @@
+"""
+악의적/비정상 DDL(긴 DEFAULT 리터럴, 긴 CHECK 식, 닫히지 않은 따옴표/주석/괄호 등)로
+CREATE TABLE 파싱 시간이 입력 크기에 선형으로 증가하는지 측정 (정규식 백트래킹 폭주 방지)
+실행:
+  python -m benchmarks.bench_adversarial
+  python -m benchmarks.bench_adversarial --cases default_spaces,check_expression
+"""
+
+import argparse
+import sys
+import time
+
+from app.parser import DDLParser
+
+# 입력 크기 (문자 수, 대략)
+SIZES = [5_000, 10_000, 20_000, 40_000]
+# 가장 큰 입력의 문자당 시간이 가장 작은 입력 대비 이 배수를 넘으면 실패
+MAX_PER_CHAR_RATIO = 2.0
+REPEAT = 3
+
+CASES = {
+    # DEFAULT 값 안의 긴 공백 (이전 lookahead 정규식에서 제곱 시간)
+    "default_spaces": lambda n: f"CREATE TABLE t (a text DEFAULT 'x{' ' * n}y');",
+    "default_words": lambda n: f"CREATE TABLE t (a text DEFAULT {'x ' * (n // 2)});",
+    "default_keywords": lambda n: f"CREATE TABLE t (a int {'default ' * (n // 8)});",
+    "not_without_null": lambda n: f"CREATE TABLE t (a int {'not ' * (n // 4)});",
+    "check_expression": lambda n: (
+        "CREATE TABLE t (a int CHECK ("
+        + " OR ".join(f"a = {i}" for i in range(n // 8))
+        + "));"
+    ),
+    "nested_parens": lambda n: (
+        f"CREATE TABLE t (a int DEFAULT {'(' * (n // 2)}1{')' * (n // 2)});"
+    ),
+    "unclosed_parens": lambda n: f"CREATE TABLE t (a int DEFAULT {'(' * n});",
+    "quote_runs": lambda n: "CREATE TABLE t (a text DEFAULT " + "'a" * (n // 2) + ");",
+    "unclosed_comments": lambda n: f"CREATE TABLE t (a int {'/* ' * (n // 3)});",
+    "dollar_quotes": lambda n: f"CREATE TABLE t (a text DEFAULT {'$a$ ' * (n // 4)});",
+    "escape_strings": lambda n: (
+        "CREATE TABLE t (a text DEFAULT " + "E'\\" * (n // 4) + ");"
+    ),
+    "long_identifier": lambda n: f"CREATE TABLE {'a' * n} (a int);",
+    "trailing_spaces": lambda n: f"CREATE TABLE t (a int{' ' * n});",
+    "many_columns": lambda n: (
+        "CREATE TABLE t ("
+        + ", ".join(f"c{i} int DEFAULT {i} NOT NULL" for i in range(n // 25))
+        + ");"
+    ),
+}
+
+
+def measure(ddl_text: str) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        DDLParser(ddl_text).parse_tables()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_adversarial")
+    arg_parser.add_argument(
+        "--cases", help=f"comma separated ({', '.join(CASES)}; default: all)"
+    )
+    args = arg_parser.parse_args(sys.argv[1:] if argv is None else argv)
+    names = args.cases.split(",") if args.cases else list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        arg_parser.error(f"unknown case: {', '.join(unknown)}")
+
+    failed = []
+    for name in names:
+        per_char = []
+        timings = []
+        for size in SIZES:
+            ddl_text = CASES[name](size)
+            elapsed = measure(ddl_text)
+            per_char.append(elapsed / len(ddl_text))
+            timings.append(f"{elapsed * 1000:8.1f}")
+        ratio = per_char[-1] / per_char[0]
+        sys.stdout.write(f"{name:<18} {' '.join(timings)} ms  ratio {ratio:5.2f}\n")
+        if ratio > MAX_PER_CHAR_RATIO:
+            failed.append(name)
+    sys.stdout.write(f"sizes: {', '.join(map(str, SIZES))} chars\n")
+    if failed:
+        sys.stdout.write(f"[ERROR] not linear: {', '.join(failed)}\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
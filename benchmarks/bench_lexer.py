@@ -0,0 +1,43 @@
+"""
+문장 분리(lexer) 처리 시간이 입력 크기에 선형으로 증가하는지 측정
+실행: python -m benchmarks.bench_lexer
+"""
+
+import sys
+import time
+
+from app.lexer import iter_statement_spans
+from benchmarks.ddl_gen import generate_ddl
+
+SIZES = [1_000, 2_000, 4_000, 8_000]
+# 가장 큰 입력의 바이트당 시간이 가장 작은 입력 대비 이 배수를 넘으면 실패
+MAX_PER_BYTE_RATIO = 2.0
+
+
+def measure(text: str, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _span in iter_statement_spans(text):
+            pass
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    per_byte = []
+    for table_count in SIZES:
+        text = generate_ddl(table_count)
+        elapsed = measure(text)
+        per_byte.append(elapsed / len(text))
+        sys.stdout.write(
+            f"{table_count:>6} tables {len(text) / 1e6:8.2f} MB "
+            f"{elapsed * 1000:9.1f} ms {len(text) / elapsed / 1e6:8.1f} MB/s\n"
+        )
+    ratio = per_byte[-1] / per_byte[0]
+    sys.stdout.write(f"per-byte time ratio (largest/smallest): {ratio:.2f}\n")
+    return 0 if ratio <= MAX_PER_BYTE_RATIO else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
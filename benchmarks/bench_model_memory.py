@@ -0,0 +1,81 @@
+"""
+파싱 결과 보관 메모리 비교: 슬롯 dataclass(TableSpec/ColumnSpec) vs 기존 컬럼별 dict
+실행: python -m benchmarks.bench_model_memory
+"""
+
+import sys
+import tracemalloc
+
+from app.parser import DDLParser
+from benchmarks.ddl_gen import generate_ddl
+
+TABLE_COUNT = 25_000  # 컬럼 20만 개
+
+
+def _fresh(value):
+    """정규식 그룹처럼 컬럼마다 새 문자열 객체 (기존 dict 표현은 intern 하지 않음)"""
+    return value.encode("utf-8").decode("utf-8") if isinstance(value, str) else value
+
+
+def to_legacy(tables) -> list[dict]:
+    """기존 parse_tables 결과 형식 (컬럼별 dict + 원본 속성 문자열 attrs)"""
+    legacy = []
+    for table in tables:
+        columns = []
+        for column in table.columns:
+            attrs = " ".join(
+                part
+                for part in (
+                    f"DEFAULT {column.default}" if column.default else "",
+                    "NOT NULL" if column.nn else "",
+                )
+                if part
+            )
+            columns.append(
+                {
+                    "column_name": _fresh(column.column_name),
+                    "type": _fresh(column.type),
+                    "pk": column.pk,
+                    "nn": column.nn,
+                    "default": _fresh(column.default),
+                    "attrs": attrs,
+                    "ref_table": _fresh(column.ref_table),
+                    "ref_column": _fresh(column.ref_column),
+                    "comment": _fresh(column.comment),
+                }
+            )
+        legacy.append(
+            {
+                "table_name": _fresh(table.table_name),
+                "columns": columns,
+                "table_comment": _fresh(table.table_comment),
+            }
+        )
+    return legacy
+
+
+def retained_memory(func):
+    """func 반환값이 붙잡고 있는 메모리 (중간 객체 제외)와 반환값"""
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def main() -> int:
+    ddl_text = generate_ddl(TABLE_COUNT)
+    model_size, tables = retained_memory(lambda: DDLParser(ddl_text).parse_tables())
+    # 같은 파싱 결과를 기존 형식으로 변환 (새 문자열/ dict 만 측정됨)
+    legacy_size, _ = retained_memory(lambda: to_legacy(tables))
+    column_count = sum(len(table.columns) for table in tables)
+
+    sys.stdout.write(f"columns          {column_count:10,d}\n")
+    sys.stdout.write(f"dict (legacy)    {legacy_size / 1e6:8.2f} MB\n")
+    sys.stdout.write(f"slots dataclass  {model_size / 1e6:8.2f} MB\n")
+    sys.stdout.write(f"ratio            {model_size / legacy_size:8.2f}\n")
+    return 0 if model_size < legacy_size else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
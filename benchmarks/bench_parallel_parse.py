@@ -0,0 +1,38 @@
+"""
+단일 대용량 덤프(10k 테이블)의 순차 파싱 vs 파일 내부 병렬 파싱 비교
+실행: python -m benchmarks.bench_parallel_parse [jobs]
+"""
+
+import os
+import sys
+import time
+
+from app.parser import DDLParser
+from benchmarks.ddl_gen import generate_ddl
+
+TABLE_COUNT = 10_000
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main() -> int:
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    parser = DDLParser(generate_ddl(TABLE_COUNT))
+    serial, serial_time = timed(parser.parse_tables)
+    parallel, parallel_time = timed(lambda: parser.parse_tables(jobs=jobs))
+    sys.stdout.write(f"tables           {TABLE_COUNT}\n")
+    sys.stdout.write(f"serial           {serial_time * 1000:9.1f} ms\n")
+    sys.stdout.write(f"parallel (j={jobs:<2}) {parallel_time * 1000:9.1f} ms\n")
+    sys.stdout.write(f"speedup          {serial_time / parallel_time:9.2f}x\n")
+    if parallel != serial:
+        sys.stdout.write("[ERROR] parallel output differs from serial output\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""
+CLI 시작 비용 측정 (python -X importtime): --help / 입력 없음 경로의 import 시간과
+무거운 모듈(openpyxl 등)이 작성 단계 전에 import 되지 않는지 검사
+실행:
+  python -m benchmarks.bench_startup
+  python -m benchmarks.bench_startup --max-ms 150   # import 합계가 넘으면 실패
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+# 인자 검증 / --help 단계에서 import 되면 안 되는 모듈 (작성/병렬/프로파일 단계에서만)
+DEFERRED_MODULES = (
+    "openpyxl",
+    "concurrent.futures",
+    "multiprocessing",
+    "cProfile",
+    "tomllib",
+    "app.parser",
+)
+SCENARIOS = {
+    "--help": ["--help"],
+    "no input": ["out.xlsx", "--no-input"],
+}
+REPEAT = 5
+TOP_IMPORTS = 10
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """-X importtime 출력 → [(모듈, 누적 us, 들여쓰기 깊이)]"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(cumulative_us), depth))
+    return imports
+
+
+def run_cli(args: list[str]) -> tuple[float, list[tuple[str, int, int]]]:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "app.main", *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return time.perf_counter() - started, parse_importtime(completed.stderr)
+
+
+def measure(args: list[str]) -> tuple[float, int, list[tuple[str, int, int]]]:
+    """REPEAT 회 중 import 합계가 가장 작은 실행의 (wall 초, import 합계 us, import 목록)"""
+    best = None
+    for _ in range(REPEAT):
+        wall, imports = run_cli(args)
+        total_us = sum(cumulative for _name, cumulative, depth in imports if not depth)
+        if best is None or total_us < best[1]:
+            best = (wall, total_us, imports)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_startup")
+    arg_parser.add_argument(
+        "--max-ms", type=float, help="fail if total import time exceeds this"
+    )
+    args = arg_parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    failed = False
+    for scenario, cli_args in SCENARIOS.items():
+        wall, total_us, imports = measure(cli_args)
+        sys.stdout.write(
+            f"{scenario:<10} wall {wall * 1000:7.1f} ms  imports {total_us / 1000:7.1f} ms\n"
+        )
+        top_level = sorted(
+            ((name, cumulative) for name, cumulative, depth in imports if not depth),
+            key=lambda item: -item[1],
+        )
+        for name, cumulative in top_level[:TOP_IMPORTS]:
+            sys.stdout.write(f"    {name:<32} {cumulative / 1000:7.1f} ms\n")
+        names = {name for name, _cumulative, _depth in imports}
+        eager = sorted(
+            module
+            for module in DEFERRED_MODULES
+            if any(name == module or name.startswith(module + ".") for name in names)
+        )
+        if eager:
+            sys.stdout.write(f"[ERROR] imported at startup: {', '.join(eager)}\n")
+            failed = True
+        if args.max_ms is not None and total_us / 1000 > args.max_ms:
+            sys.stdout.write(
+                f"[ERROR] import time {total_us / 1000:.1f} ms > {args.max_ms:.1f} ms\n"
+            )
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
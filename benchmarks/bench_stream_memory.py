@@ -0,0 +1,46 @@
+"""
+parse_ddl_file(전체 읽기) vs iter_parse_ddl_file(스트리밍) 최대 메모리 비교
+실행: python -m benchmarks.bench_stream_memory
+"""
+
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from app.parser import iter_parse_ddl_file, parse_ddl_file
+from benchmarks.ddl_gen import generate_ddl
+
+TABLE_COUNT = 5_000
+CHUNK_SIZE = 1 << 16
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ddl_path = Path(tmp_dir) / "bench.sql"
+        ddl_path.write_text(generate_ddl(TABLE_COUNT), encoding="utf-8")
+        file_size = ddl_path.stat().st_size
+
+        def consume_stream():
+            for _table in iter_parse_ddl_file(ddl_path, chunk_size=CHUNK_SIZE):
+                pass
+
+        full_peak = peak_memory(lambda: parse_ddl_file(ddl_path))
+        stream_peak = peak_memory(consume_stream)
+
+    sys.stdout.write(f"file size        {file_size / 1e6:8.2f} MB\n")
+    sys.stdout.write(f"parse_ddl_file   {full_peak / 1e6:8.2f} MB peak\n")
+    sys.stdout.write(f"stream (64 KiB)  {stream_peak / 1e6:8.2f} MB peak\n")
+    return 0 if stream_peak < file_size else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
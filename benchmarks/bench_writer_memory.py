@@ -0,0 +1,49 @@
+"""
+엑셀 작성 엔진별(openpyxl / stream) 시트 수 증가에 따른 최대 메모리 비교
+실행: python -m benchmarks.bench_writer_memory
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from app.excel_writer import WRITER_ENGINES, write_excel_spec
+from app.parser import DDLParser
+from benchmarks.ddl_gen import generate_ddl
+
+TABLE_COUNTS = [25, 100]
+
+
+def measure(table_spec_dict, engine: str) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tracemalloc.start()
+        started = time.perf_counter()
+        write_excel_spec(
+            table_spec_dict,
+            Path(tmp_dir) / "bench.xlsx",
+            lang="ko",
+            meta_field_values=[""] * 7,
+            engine=engine,
+        )
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> int:
+    for table_count in TABLE_COUNTS:
+        table_spec_dict = {"bench": DDLParser(generate_ddl(table_count)).parse_tables()}
+        for engine in WRITER_ENGINES:
+            elapsed, peak = measure(table_spec_dict, engine)
+            sys.stdout.write(
+                f"{table_count:>5} tables {engine:<9} "
+                f"{elapsed * 1000:9.1f} ms {peak / 1e6:8.2f} MB peak\n"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
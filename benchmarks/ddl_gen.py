@@ -0,0 +1,100 @@
+import random
+
+# 실제 스키마에 가까운 컬럼 타입 / 기본값 (괄호 포함 기본값 포함)
+COLUMN_TYPES = [
+    ("bigint", "nextval('{seq}'::regclass)"),
+    ("integer", "0"),
+    ("character varying(100)", "''::character varying"),
+    ("numeric(12,2)", "(0)::numeric"),
+    ("timestamp without time zone", "(now() AT TIME ZONE 'utc'::text)"),
+    ("boolean", "false"),
+    ("text", None),
+]
+
+
+def generate_ddl(
+    table_count: int,
+    column_count: int = 8,
+    *,
+    composite_pk_ratio: float = 0.0,
+    fk_ratio: float = 0.0,
+    quoted_ratio: float = 0.0,
+    column_comment_ratio: float = 0.0,
+    realistic_columns: bool = False,
+    seed: int = 0,
+) -> str:
+    """
+    벤치마크용 PostgreSQL DDL (pg_dump --schema-only 형태) 생성
+    - 기본값만 쓰면 단순한 테이블 (id + col_N varchar DEFAULT, 코멘트 2개)
+    - composite_pk_ratio: 복합 PK (PRIMARY KEY (id, col_1)) 테이블 비율
+    - fk_ratio: 앞쪽 테이블을 참조하는 FOREIGN KEY 제약이 있는 테이블 비율
+    - quoted_ratio: "Public"."Table" 처럼 따옴표 식별자를 쓰는 테이블 비율
+    - column_comment_ratio: col_1 외 컬럼에도 COMMENT ON COLUMN 을 다는 비율
+    - realistic_columns: 컬럼 타입/기본값을 COLUMN_TYPES 에서 순환 (괄호 포함 기본값)
+    같은 인자면 항상 같은 텍스트 (seed 고정 난수)
+    """
+    rng = random.Random(seed)
+    parts = []
+    for t in range(table_count):
+        quoted = rng.random() < quoted_ratio
+        bare_name = f"table_{t:06d}"
+        table_name = f'"public"."{bare_name}"' if quoted else f"public.{bare_name}"
+        columns = [f"    id_{t} bigint NOT NULL"]
+        column_names = [f"id_{t}"]
+        for c in range(1, column_count):
+            column_name = f'"col_{c}"' if quoted else f"col_{c}"
+            column_names.append(column_name)
+            if realistic_columns:
+                column_type, default = COLUMN_TYPES[c % len(COLUMN_TYPES)]
+                if default:
+                    default = default.format(seq=f"public.{bare_name}_seq")
+                    columns.append(f"    {column_name} {column_type} DEFAULT {default}")
+                else:
+                    columns.append(f"    {column_name} {column_type}")
+            else:
+                columns.append(
+                    f"    {column_name} character varying({c * 10}) "
+                    f"DEFAULT 'v;{c}' NOT NULL"
+                )
+        if t and rng.random() < fk_ratio:
+            ref = rng.randrange(t)
+            columns.append(f"    ref_{ref} bigint")
+            columns.append(
+                f"    CONSTRAINT {bare_name}_ref_fkey FOREIGN KEY (ref_{ref}) "
+                f"REFERENCES table_{ref:06d}(id_{ref})"
+            )
+        if column_count > 1 and rng.random() < composite_pk_ratio:
+            columns.append(f"    PRIMARY KEY (id_{t}, {column_names[1]})")
+        else:
+            columns.append(f"    PRIMARY KEY (id_{t})")
+        parts.append(
+            f"--\n-- Name: {bare_name}; Type: TABLE; Schema: public\n--\n\n"
+            f"CREATE TABLE {table_name} (\n" + ",\n".join(columns) + "\n);\n\n"
+        )
+        parts.append(f"COMMENT ON TABLE {table_name} IS 'table {t}';\n")
+        parts.append(
+            f"COMMENT ON COLUMN {table_name}.{column_names[1] if column_count > 1 else 'col_1'} "
+            "IS 'it''s col 1';\n"
+        )
+        for column_name in column_names[2:]:
+            if rng.random() < column_comment_ratio:
+                parts.append(
+                    f"COMMENT ON COLUMN {table_name}.{column_name} "
+                    f"IS '{column_name.strip(chr(34))} of {bare_name}';\n"
+                )
+        parts.append("\n")
+    return "".join(parts)
+
+
+# benchmarks.suite 기본 입력: 실제 덤프와 비슷한 구성
+REALISTIC_OPTIONS = {
+    "composite_pk_ratio": 0.2,
+    "fk_ratio": 0.3,
+    "quoted_ratio": 0.1,
+    "column_comment_ratio": 0.5,
+    "realistic_columns": True,
+}
+
+
+def generate_realistic_ddl(table_count: int, column_count: int = 8) -> str:
+    return generate_ddl(table_count, column_count, **REALISTIC_OPTIONS)
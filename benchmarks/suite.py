@@ -0,0 +1,215 @@
+"""
+파서/엑셀 작성 속도 벤치마크 모음 (저장된 기준값 대비 회귀 검사)
+실행:
+  python -m benchmarks.suite                  # 기준값과 비교 (느려지면 exit 1)
+  python -m benchmarks.suite --save           # 현재 결과를 기준값으로 저장
+  python -m benchmarks.suite --sizes 10,1000 --threshold 1.5
+기준값은 측정한 머신 기준이므로 같은 머신에서 비교해야 의미가 있음.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from app.excel_writer import SheetTemplate, write_excel_spec, write_table_sheet
+from app.parser import DDLParser, parse_ddl_file
+from benchmarks.ddl_gen import generate_realistic_ddl
+
+DEFAULT_SIZES = [10, 1_000, 10_000]
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+# 기준값 대비 이 배수보다 느리면 회귀로 판단
+DEFAULT_THRESHOLD = 1.25
+BASELINE_VERSION = 1
+META_FIELD_VALUES = [""] * 7
+
+
+def bench_parser(ddl_text: str, ddl_path: Path, tmp_dir: Path) -> Callable[[], None]:
+    return lambda: DDLParser(ddl_text).parse_tables()
+
+
+def bench_parse_ddl_file(
+    ddl_text: str, ddl_path: Path, tmp_dir: Path
+) -> Callable[[], None]:
+    return lambda: parse_ddl_file(ddl_path)
+
+
+def bench_write_table_sheet(
+    ddl_text: str, ddl_path: Path, tmp_dir: Path
+) -> Callable[[], None]:
+    """저장 없이 시트 작성만 (워크북 생성 + 템플릿 포함)"""
+    tables = DDLParser(ddl_text).parse_tables()
+
+    def run():
+        wb = Workbook()
+        template = SheetTemplate(wb, "ko", META_FIELD_VALUES)
+        for idx, table_spec in enumerate(tables):
+            write_table_sheet(
+                wb.create_sheet(f"s{idx}"),
+                table_spec,
+                lang="ko",
+                meta_field_values=META_FIELD_VALUES,
+                template=template,
+            )
+
+    return run
+
+
+def bench_write_excel_spec(
+    ddl_text: str, ddl_path: Path, tmp_dir: Path
+) -> Callable[[], None]:
+    """파싱 + 엑셀 작성 + 저장 (CLI 기본 경로와 동일)"""
+
+    def run():
+        write_excel_spec(
+            {"bench": parse_ddl_file(ddl_path)},
+            tmp_dir / "bench.xlsx",
+            lang="ko",
+            meta_field_values=META_FIELD_VALUES,
+        )
+
+    return run
+
+
+CASES = {
+    "DDLParser": bench_parser,
+    "parse_ddl_file": bench_parse_ddl_file,
+    "write_table_sheet": bench_write_table_sheet,
+    "write_excel_spec": bench_write_excel_spec,
+}
+
+
+def repeat_count(table_count: int) -> int:
+    """작은 입력은 여러 번 재서 최솟값 사용 (측정 잡음 완화)"""
+    return max(1, min(7, 5_000 // table_count))
+
+
+def measure(func: Callable[[], None], repeat: int) -> float:
+    """GC 를 끄고 repeat 회 중 최솟값 (여러 번 재는 작은 입력은 워밍업 1회 추가)"""
+    if repeat > 1:
+        func()
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best
+
+
+def run_suite(sizes: list[int], cases: list[str]) -> dict[str, float]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for table_count in sizes:
+            ddl_text = generate_realistic_ddl(table_count)
+            ddl_path = tmp_dir / f"bench_{table_count}.sql"
+            ddl_path.write_text(ddl_text, encoding="utf-8")
+            for case in cases:
+                func = CASES[case](ddl_text, ddl_path, tmp_dir)
+                name = f"{case}[{table_count}]"
+                results[name] = measure(func, repeat_count(table_count))
+                sys.stdout.write(f"{name:<28} {results[name] * 1000:11.1f} ms\n")
+                sys.stdout.flush()
+    return results
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    if not path.is_file():
+        return {}
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    if baseline.get("version") != BASELINE_VERSION:
+        return {}
+    return baseline.get("results", {})
+
+
+def save_baseline(path: Path, results: dict[str, float]):
+    """기존 기준값에 이번에 측정한 케이스만 덮어씀"""
+    merged = {**load_baseline(path), **results}
+    path.write_text(
+        json.dumps(
+            {
+                "version": BASELINE_VERSION,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": dict(sorted(merged.items())),
+            },
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """기준값보다 threshold 배 넘게 느려진 케이스 이름 목록"""
+    regressions = []
+    for name, elapsed in results.items():
+        base = baseline.get(name)
+        if base is None:
+            sys.stdout.write(f"{name:<28} (no baseline)\n")
+            continue
+        ratio = elapsed / base
+        mark = "REGRESSION" if ratio > threshold else "ok"
+        sys.stdout.write(f"{name:<28} {ratio:6.2f}x baseline  {mark}\n")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    arg_parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="comma separated table counts",
+    )
+    arg_parser.add_argument(
+        "--cases", default=",".join(CASES), help="comma separated case names"
+    )
+    arg_parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    arg_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    arg_parser.add_argument(
+        "--save", action="store_true", help="store results as the new baseline"
+    )
+    args = arg_parser.parse_args(argv)
+    args.sizes = [int(size) for size in args.sizes.split(",") if size]
+    args.cases = [case for case in args.cases.split(",") if case]
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        arg_parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    results = run_suite(args.sizes, args.cases)
+    if args.save:
+        save_baseline(args.baseline, results)
+        sys.stdout.write(f"baseline saved: {args.baseline}\n")
+        return 0
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    if regressions:
+        sys.stdout.write(
+            f"[ERROR] {len(regressions)} case(s) slower than "
+            f"{args.threshold:.2f}x baseline: {', '.join(regressions)}\n"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+import os
+import pickle
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+import app.parser
+from app.cache import ParseCache
+from app.model import load_specs_pickle
+from app.parser import DDLParser
+
+DDL_TEXT = "CREATE TABLE public.users (id int PRIMARY KEY, email text NOT NULL);"
+
+
+def parse(ddl_text: str = DDL_TEXT) -> list:
+    return DDLParser(ddl_text).parse_tables()
+
+
+def test_hit_and_miss(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    key = cache.make_key(DDL_TEXT.encode(), prefilter=False)
+    assert cache.get(key) is None
+    cache.put(key, parse())
+    assert [table.to_dict() for table in cache.get(key)] == [
+        table.to_dict() for table in parse()
+    ]
+
+
+def test_file_key_matches_make_key(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("app.cache.HASH_CHUNK_SIZE", 7)
+    sql_path = tmp_path / "input.sql"
+    sql_path.write_text(DDL_TEXT, encoding="utf-8")
+    cache = ParseCache(tmp_path / "cache")
+    assert cache.file_key(sql_path, stream=True) == cache.make_key(
+        DDL_TEXT.encode(), stream=True
+    )
+
+
+@pytest.mark.parametrize(
+    ("content", "options"),
+    [
+        (DDL_TEXT + "\n", {"prefilter": False}),
+        (DDL_TEXT, {"prefilter": True}),
+        (DDL_TEXT, {"prefilter": False, "stream": True}),
+    ],
+    ids=["source changed", "option changed", "option added"],
+)
+def test_key_changes_with_source_and_options(content: str, options: dict):
+    cache = ParseCache()
+    assert cache.make_key(content.encode(), **options) != cache.make_key(
+        DDL_TEXT.encode(), prefilter=False
+    )
+
+
+def test_parser_version_invalidates(tmp_path: Path, monkeypatch):
+    cache = ParseCache(tmp_path)
+    key = cache.make_key(DDL_TEXT.encode())
+    cache.put(key, parse())
+    monkeypatch.setattr(app.parser, "PARSER_VERSION", f"{app.parser.PARSER_VERSION}x")
+    new_key = cache.make_key(DDL_TEXT.encode())
+    assert new_key != key
+    assert cache.get(new_key) is None
+
+
+def test_unpickler_rejects_foreign_class(tmp_path: Path):
+    data = pickle.dumps([OrderedDict(a=1)])
+    with pytest.raises(pickle.UnpicklingError, match="not allowed"):
+        load_specs_pickle(data)
+
+    cache = ParseCache(tmp_path)
+    key = cache.make_key(b"foreign")
+    entry_path = cache._entry_path(key)
+    entry_path.parent.mkdir(parents=True)
+    entry_path.write_bytes(zlib.compress(data))
+    assert cache.get(key) is None
+
+
+def test_non_list_entry_is_ignored(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    key = cache.make_key(b"table")
+    cache.put(key, parse()[0])
+    assert cache.get(key) is None
+
+
+def put_entries(cache: ParseCache, count: int) -> list[Path]:
+    """오래된 순서로 mtime 을 지정한 캐시 항목 count 개"""
+    entry_paths = []
+    for i in range(count):
+        key = cache.make_key(f"{DDL_TEXT} -- {i}".encode())
+        cache.put(key, parse())
+        entry_path = cache._entry_path(key)
+        os.utime(entry_path, (1_000_000 + i, 1_000_000 + i))
+        entry_paths.append(entry_path)
+    return entry_paths
+
+
+def test_evict_removes_oldest_until_under_max_bytes(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    entry_paths = put_entries(cache, 4)
+    entry_size = max(entry_path.stat().st_size for entry_path in entry_paths)
+    cache.max_bytes = entry_size * 2
+    cache.evict()
+    assert [entry_path.exists() for entry_path in entry_paths] == [
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_evict_skips_entries_it_cannot_delete(tmp_path: Path, monkeypatch):
+    cache = ParseCache(tmp_path)
+    entry_paths = put_entries(cache, 3)
+    locked = entry_paths[0]
+    unlink = Path.unlink
+
+    def fake_unlink(path: Path, missing_ok: bool = False):
+        if path == locked:
+            raise PermissionError(13, "Permission denied", str(path))
+        unlink(path, missing_ok=missing_ok)
+
+    monkeypatch.setattr(Path, "unlink", fake_unlink)
+    cache.max_bytes = max(entry_path.stat().st_size for entry_path in entry_paths)
+    cache.evict()
+    assert [entry_path.exists() for entry_path in entry_paths] == [True, False, False]
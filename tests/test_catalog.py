@@ -0,0 +1,200 @@
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from app.catalog import ReferenceIndex, SchemaCatalog
+from app.excel_writer import write_excel_shards, write_excel_spec
+from app.model import ColumnSpec, TableSpec
+
+META_FIELD_VALUES = [""] * 7
+
+
+def column(name: str, type_: str, pk: bool = False, ref=None) -> ColumnSpec:
+    ref_table, ref_column = ref or (None, None)
+    return ColumnSpec(
+        column_name=name,
+        type=type_,
+        pk=pk,
+        nn=pk,
+        ref_table=ref_table,
+        ref_column=ref_column,
+    )
+
+
+# 파일 세 개에 나뉜 스키마: FK 는 모두 다른 파일의 테이블을 참조
+TABLE_SPEC_DICT = {
+    "orgs": [
+        TableSpec(
+            table_name="orgs",
+            columns=[column("id", "integer", pk=True), column("name", "text")],
+        ),
+        TableSpec(
+            table_name="sales.pairs",
+            columns=[column("a", "int", pk=True), column("b", "int", pk=True)],
+        ),
+    ],
+    "users": [
+        TableSpec(
+            table_name="public.users",
+            columns=[
+                column("user_id", "bigserial", pk=True),
+                column("org_id", "integer", ref=("public.orgs", None)),
+            ],
+        )
+    ],
+    "orders": [
+        TableSpec(
+            table_name="sales.orders",
+            columns=[
+                column("owner_id", "bigint", ref=("users", "user_id")),
+                column("org_code", "varchar(10)", ref=("orgs", "id")),
+                column("pair_id", "int", ref=("sales.pairs", None)),
+                column("ghost_id", "int", ref=("missing", "id")),
+                column("bad_col", "int", ref=("users", "nope")),
+                column("other_pair", "int", ref=("pairs", None)),
+            ],
+        )
+    ],
+}
+
+
+@pytest.fixture
+def catalog() -> SchemaCatalog:
+    return SchemaCatalog(TABLE_SPEC_DICT)
+
+
+@pytest.mark.parametrize(
+    ("table_name", "column_name", "expected"),
+    [
+        ("users", "user_id", ("user_id", "bigserial")),
+        ("PUBLIC.USERS", "USER_ID", ("user_id", "bigserial")),
+        ('"public"."orgs"', "name", ("name", "text")),
+        ("sales.pairs", "b", ("b", "int")),
+        ("pairs", "b", None),
+        ("users", "missing", None),
+    ],
+)
+def test_column_lookup(catalog, table_name: str, column_name: str, expected):
+    found = catalog.column(table_name, column_name)
+    assert ((found.column_name, found.type) if found else None) == expected
+
+
+def test_dangling_references(catalog):
+    assert [str(reference) for reference in catalog.dangling_references()] == [
+        "orders: sales.orders.ghost_id → missing.id",
+        "orders: sales.orders.bad_col → users.nope",
+        "orders: sales.orders.other_pair → pairs",
+    ]
+
+
+def reference_cells(xlsx_path: Path) -> dict[str, list]:
+    """컬럼명 → [참조테이블, 비고] (모든 시트)"""
+    cells = {}
+    for ws in load_workbook(xlsx_path).worksheets:
+        for row in ws.iter_rows(values_only=True):
+            values = [value for value in row if value is not None]
+            if len(values) > 4 and isinstance(values[0], int):
+                cells[values[1]] = values[-2:]
+    return cells
+
+
+# 컬럼명 → [참조테이블 칸, 비고 칸] (lang en)
+EXPECTED_REFERENCE_CELLS = {
+    "org_id": ["public.orgs.id", "-"],
+    "owner_id": ["users.user_id", "-"],
+    "org_code": ["orgs.id", "Ref type: INTEGER"],
+    "pair_id": ["sales.pairs", "-"],
+    "ghost_id": ["missing.id", "Unresolved reference"],
+    "bad_col": ["users.nope", "Unresolved reference"],
+    "other_pair": ["pairs", "Unresolved reference"],
+}
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "stream"])
+def test_reference_remarks(tmp_path: Path, catalog, engine: str):
+    xlsx_path = tmp_path / "out.xlsx"
+    write_excel_spec(
+        TABLE_SPEC_DICT,
+        xlsx_path,
+        "en",
+        META_FIELD_VALUES,
+        engine=engine,
+        catalog=catalog,
+    )
+    cells = reference_cells(xlsx_path)
+    assert {name: cells[name] for name in EXPECTED_REFERENCE_CELLS} == (
+        EXPECTED_REFERENCE_CELLS
+    )
+    assert cells["user_id"][-1] == "-"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_reference_remarks_across_shards(tmp_path: Path, catalog, jobs: int):
+    """참조 대상이 다른 샤드 파일에 있어도 같은 결과"""
+    shard_paths = write_excel_shards(
+        TABLE_SPEC_DICT,
+        tmp_path / "out.xlsx",
+        "en",
+        META_FIELD_VALUES,
+        shard_size=1,
+        jobs=jobs,
+        catalog=catalog,
+    )
+    assert len(shard_paths) == 4
+    cells = {}
+    for shard_path in shard_paths:
+        cells.update(reference_cells(shard_path))
+    assert {name: cells[name] for name in EXPECTED_REFERENCE_CELLS} == (
+        EXPECTED_REFERENCE_CELLS
+    )
+
+
+def test_catalog_does_not_modify_specs(catalog):
+    before = {
+        source: [table_spec.to_dict() for table_spec in table_list]
+        for source, table_list in TABLE_SPEC_DICT.items()
+    }
+    catalog.dangling_references()
+    for table_list in TABLE_SPEC_DICT.values():
+        for table_spec in table_list:
+            for column_spec in table_spec.columns:
+                catalog.referenced_column(column_spec)
+    assert {
+        source: [table_spec.to_dict() for table_spec in table_list]
+        for source, table_list in TABLE_SPEC_DICT.items()
+    } == before
+
+
+@pytest.mark.parametrize("order", ["input", "reversed"])
+def test_reference_index_matches_catalog(catalog, order: str):
+    """--pipeline: 참조 대상 테이블이 나중에 도착해도 SchemaCatalog 와 같은 결과"""
+    sources = list(TABLE_SPEC_DICT)
+    if order == "reversed":
+        sources.reverse()
+    references = ReferenceIndex()
+    for source in sources:
+        for table_spec in TABLE_SPEC_DICT[source]:
+            references.add(source, table_spec)
+    assert sorted(map(str, references.dangling_references())) == sorted(
+        map(str, catalog.dangling_references())
+    )
+
+
+def test_reference_index_keeps_first_definition():
+    references = ReferenceIndex()
+    references.add(
+        "a", TableSpec(table_name="users", columns=[column("id", "int", pk=True)])
+    )
+    references.add(
+        "b",
+        TableSpec(
+            table_name="public.users",
+            columns=[column("ghost", "int", ref=("missing", None))],
+        ),
+    )
+    references.add(
+        "c",
+        TableSpec(table_name="t", columns=[column("x", "int", ref=("users", "id"))]),
+    )
+    assert references.dangling_references() == []
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from app.excel_writer import write_excel_spec
+from app.parser import DDLParser
+
+DDL_TEXT = """\
+CREATE TABLE public.users (id int PRIMARY KEY, email text);
+COMMENT ON TABLE public.users IS 'user table';
+"""
+
+
+def sheet_values(xlsx_path: Path) -> list:
+    ws = load_workbook(xlsx_path).worksheets[-1]
+    return [cell.value for row in ws.iter_rows() for cell in row]
+
+
+@pytest.mark.parametrize("layout", ["sheet", "single"])
+@pytest.mark.parametrize("engine", ["openpyxl", "stream"])
+def test_meta_values_that_look_like_template_slots(
+    tmp_path: Path, engine: str, layout: str
+):
+    """메타 값이 슬롯 문자열과 같아도 테이블명/코멘트로 바뀌지 않음"""
+    meta_field_values = ["{table_name}", "{table_comment}", "table_name"]
+    meta_field_values += ["a", "b", "c", "d"]
+    xlsx_path = tmp_path / "out.xlsx"
+    write_excel_spec(
+        {"schema": DDLParser(DDL_TEXT).parse_tables()},
+        xlsx_path,
+        "en",
+        meta_field_values,
+        engine=engine,
+        layout=layout,
+    )
+    values = [value for value in sheet_values(xlsx_path) if value is not None]
+    meta_start = values.index("{table_name}")
+    # 메타 영역은 (항목명, 값) 이 번갈아 나옴
+    assert values[meta_start : meta_start + 18 : 2] == [
+        *meta_field_values,
+        "public.users",
+        "user table",
+    ]
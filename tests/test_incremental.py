@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+from typer.testing import CliRunner
+
+from app.main import app
+
+MARKER = "kept"
+MARKER_CELL = "Z1"
+
+SQL_A = """\
+CREATE TABLE t1 (id integer NOT NULL, name text);
+CREATE TABLE t2 (id integer NOT NULL, amount integer);
+"""
+SQL_B = "CREATE TABLE t3 (id integer NOT NULL);\n"
+
+
+def convert(sql_paths: list[Path], output_path: Path, *options: str):
+    result = CliRunner().invoke(
+        app,
+        [*map(str, sql_paths), str(output_path), "--incremental", *options],
+        input="n\n",
+    )
+    assert result.exit_code == 0, result.output
+
+
+def mark_sheets(output_path: Path):
+    """모든 시트에 표시를 남김 (다시 작성된 시트는 표시가 사라짐)"""
+    wb = load_workbook(output_path)
+    for ws in wb.worksheets:
+        ws[MARKER_CELL] = MARKER
+    wb.save(output_path)
+
+
+def kept_sheets(output_path: Path) -> dict[str, bool]:
+    wb = load_workbook(output_path)
+    return {ws.title: ws[MARKER_CELL].value == MARKER for ws in wb.worksheets}
+
+
+def column_type(output_path: Path, sheet_title: str, column_name: str) -> str:
+    for row in load_workbook(output_path)[sheet_title].iter_rows(values_only=True):
+        values = [value for value in row if value is not None]
+        if len(values) > 2 and isinstance(values[0], int) and values[1] == column_name:
+            return values[2]
+    raise AssertionError(f"{column_name} not found in {sheet_title}")
+
+
+@pytest.fixture
+def sql_paths(tmp_path: Path) -> list[Path]:
+    sql_a, sql_b = tmp_path / "a.sql", tmp_path / "b.sql"
+    sql_a.write_text(SQL_A, encoding="utf-8")
+    sql_b.write_text(SQL_B, encoding="utf-8")
+    return [sql_a, sql_b]
+
+
+def test_rewrites_only_changed_and_new_sheets(tmp_path: Path, sql_paths):
+    output_path = tmp_path / "out.xlsx"
+    convert(sql_paths, output_path)
+    assert output_path.with_name("out.xlsx.manifest.json").is_file()
+    mark_sheets(output_path)
+
+    sql_a, sql_b = sql_paths
+    sql_a.write_text(SQL_A.replace("amount integer", "amount bigint"), encoding="utf-8")
+    sql_b.write_text(SQL_B + "CREATE TABLE t4 (id integer);\n", encoding="utf-8")
+    convert(sql_paths, output_path)
+
+    assert kept_sheets(output_path) == {
+        "a_t1": True,
+        "a_t2": False,
+        "b_t3": True,
+        "b_t4": False,
+    }
+    assert column_type(output_path, "a_t2", "amount") == "BIGINT"
+
+
+def test_removed_table_sheet_is_deleted(tmp_path: Path, sql_paths):
+    output_path = tmp_path / "out.xlsx"
+    convert(sql_paths, output_path)
+    mark_sheets(output_path)
+    sql_paths[0].write_text(SQL_A.split("\n", 1)[1], encoding="utf-8")
+    convert(sql_paths, output_path)
+    assert kept_sheets(output_path) == {"a_t2": True, "b_t3": True}
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["manifest removed", "language changed"],
+)
+def test_full_rebuild(tmp_path: Path, sql_paths, change: str):
+    output_path = tmp_path / "out.xlsx"
+    convert(sql_paths, output_path)
+    mark_sheets(output_path)
+    options = []
+    if change == "manifest removed":
+        output_path.with_name("out.xlsx.manifest.json").unlink()
+    else:
+        options = ["--lang", "en"]
+    convert(sql_paths, output_path, *options)
+    assert kept_sheets(output_path) == {"a_t1": False, "a_t2": False, "b_t3": False}
@@ -0,0 +1,186 @@
+from pathlib import Path
+
+import pytest
+
+from app.lexer import iter_statement_spans
+from app.parser import iter_ddl_file_statements, iter_parse_ddl_file, parse_ddl_file
+from benchmarks.ddl_gen import generate_ddl
+
+# (입력 SQL, 기대 문장 목록)
+SPAN_CASES = {
+    "two statements": (
+        "create table a (x int); create table b (y int);",
+        ["create table a (x int);", "create table b (y int);"],
+    ),
+    "leading comments": (
+        "-- c;\n/* b; */ create table a ();",
+        ["create table a ();"],
+    ),
+    "semicolon in string": (
+        "insert into t values ('a;b');",
+        ["insert into t values ('a;b');"],
+    ),
+    "doubled quote": (
+        "select 'it''s; ok'; select 2;",
+        ["select 'it''s; ok';", "select 2;"],
+    ),
+    "escape string": (
+        "select E'a\\';b'; select 2;",
+        ["select E'a\\';b';", "select 2;"],
+    ),
+    "escape string ending in backslash": (
+        "select e'a\\\\'; select 2;",
+        ["select e'a\\\\';", "select 2;"],
+    ),
+    "quoted identifier": (
+        'create table "a;b" (x int);',
+        ['create table "a;b" (x int);'],
+    ),
+    "dollar quote": (
+        "create function f() returns int as $$ select 1; $$ language sql;",
+        ["create function f() returns int as $$ select 1; $$ language sql;"],
+    ),
+    "tagged dollar quote": (
+        "create function f() returns text as $fn$ select '$$;'; $fn$ language sql;",
+        ["create function f() returns text as $fn$ select '$$;'; $fn$ language sql;"],
+    ),
+    "nested block comment": (
+        "/* a /* b; */ c; */ create table t ();",
+        ["create table t ();"],
+    ),
+    "line comment inside statement": (
+        "create table t (a int -- x; y\n);",
+        ["create table t (a int -- x; y\n);"],
+    ),
+    "copy data skipped": (
+        "copy t (a) from stdin;\n1;2\n\\.\ncreate table u ();",
+        ["copy t (a) from stdin;", "create table u ();"],
+    ),
+    "no trailing semicolon": ("create table t ()", ["create table t ()"]),
+    "empty statements": (";; ;", []),
+    "unterminated string": (
+        "select 'unterminated; x",
+        ["select 'unterminated; x"],
+    ),
+}
+
+DDL_ONLY_TEXT = (
+    "insert into t values (1); create table a (); copy t from stdin;\n"
+    "data;\n\\.\nselect 1; comment on table a is 'x;';"
+)
+
+# 청크 경계가 E'' 리터럴 안의 백슬래시 바로 뒤에 걸리는 입력 (모든 청크 크기로 확인)
+ESCAPE_BOUNDARY_TEXT = (
+    "CREATE TABLE a (x text DEFAULT E'it\\'s; C:\\\\dir');\nCREATE TABLE b (y int);"
+)
+
+# pg_dump 형식: 데이터(COPY), 테이블 뒤의 COMMENT, 끝에 모인 ALTER TABLE / CREATE INDEX
+PG_DUMP_TEXT = """\
+-- meta.author: tester
+SET client_encoding = 'UTF8';
+
+CREATE TABLE public.users (
+    id bigint NOT NULL,
+    email character varying(255) DEFAULT 'a;b'::character varying NOT NULL,
+    note text DEFAULT $$x; y$$
+);
+
+COMMENT ON TABLE public.users IS 'user; table';
+COMMENT ON COLUMN public.users.email IS 'it''s the email';
+
+CREATE TABLE public.orders (
+    id bigint NOT NULL,
+    user_id bigint /* owner; */ NOT NULL
+);
+
+COPY public.users (id, email, note) FROM stdin;
+1\ta@b.c\tx;y
+2\t'quoted\t\\N
+\\.
+
+INSERT INTO public.orders VALUES (1, 1);
+
+ALTER TABLE ONLY public.users
+    ADD CONSTRAINT users_pkey PRIMARY KEY (id);
+ALTER TABLE ONLY public.orders
+    ADD CONSTRAINT orders_user_id_fkey FOREIGN KEY (user_id) REFERENCES public.users(id);
+CREATE UNIQUE INDEX users_email_idx ON public.users USING btree (email);
+"""
+
+
+def statements(text: str, ddl_only: bool = False) -> list[str]:
+    return [
+        text[start:end] for start, end in iter_statement_spans(text, ddl_only=ddl_only)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"), SPAN_CASES.values(), ids=list(SPAN_CASES)
+)
+def test_statement_spans(text: str, expected: list[str]):
+    assert statements(text) == expected
+
+
+def test_ddl_only_skips_data_and_non_ddl():
+    assert statements(DDL_ONLY_TEXT, ddl_only=True) == [
+        "create table a ();",
+        "comment on table a is 'x;';",
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+@pytest.mark.parametrize(
+    ("text", "expected"), SPAN_CASES.values(), ids=list(SPAN_CASES)
+)
+def test_chunked_scan_matches_full_scan(
+    tmp_path: Path, text: str, expected: list[str], chunk_size: int
+):
+    """청크 경계가 문자열 / 주석 / COPY 데이터 중간에 걸려도 같은 문장"""
+    sql_path = tmp_path / "input.sql"
+    sql_path.write_text(text, encoding="utf-8")
+    assert list(iter_ddl_file_statements(sql_path, chunk_size=chunk_size)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_chunked_ddl_only_scan(tmp_path: Path, chunk_size: int):
+    sql_path = tmp_path / "input.sql"
+    sql_path.write_text(DDL_ONLY_TEXT, encoding="utf-8")
+    assert list(
+        iter_ddl_file_statements(sql_path, prefilter=True, chunk_size=chunk_size)
+    ) == statements(DDL_ONLY_TEXT, ddl_only=True)
+
+
+@pytest.mark.parametrize("prefilter", [False, True])
+def test_chunk_boundary_after_escape_backslash(tmp_path: Path, prefilter: bool):
+    sql_path = tmp_path / "input.sql"
+    sql_path.write_text(ESCAPE_BOUNDARY_TEXT, encoding="utf-8")
+    expected = statements(ESCAPE_BOUNDARY_TEXT)
+    assert len(expected) == 2
+    for chunk_size in range(1, len(ESCAPE_BOUNDARY_TEXT) + 1):
+        assert (
+            list(iter_ddl_file_statements(sql_path, prefilter, chunk_size)) == expected
+        ), chunk_size
+        assert [
+            table.table_name
+            for table in iter_parse_ddl_file(sql_path, prefilter, chunk_size)
+        ] == ["a", "b"], chunk_size
+
+
+@pytest.mark.parametrize("prefilter", [False, True])
+@pytest.mark.parametrize("chunk_size", [7, 64, 1000])
+@pytest.mark.parametrize("source", ["pg_dump", "generated"])
+def test_stream_parse_matches_full_parse(
+    tmp_path: Path, source: str, chunk_size: int, prefilter: bool
+):
+    sql_path = tmp_path / "input.sql"
+    text = PG_DUMP_TEXT if source == "pg_dump" else generate_ddl(20)
+    sql_path.write_text(text, encoding="utf-8")
+    expected = [table.to_dict() for table in parse_ddl_file(sql_path)]
+    streamed = list(
+        iter_parse_ddl_file(sql_path, prefilter=prefilter, chunk_size=chunk_size)
+    )
+    assert [table.to_dict() for table in streamed] == expected
+    if not prefilter:
+        assert [
+            table.to_dict() for table in parse_ddl_file(sql_path, prefilter=True)
+        ] == expected
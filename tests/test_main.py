@@ -0,0 +1,29 @@
+import os
+from pathlib import Path
+
+import app.main
+from app.main import parse_sql_file, parse_sql_files
+
+
+def _exit_worker(sql_file_path: Path, **kwargs):
+    """워커 프로세스 비정상 종료 (메모리 부족 강제 종료 등) 흉내"""
+    if sql_file_path.stem == "crash":
+        os._exit(1)
+    return parse_sql_file(sql_file_path, **kwargs)
+
+
+def test_broken_process_pool_is_reported_as_parse_error(tmp_path: Path, monkeypatch):
+    sql_paths = []
+    for name in ("a", "crash", "b"):
+        sql_path = tmp_path / f"{name}.sql"
+        sql_path.write_text(f"CREATE TABLE {name} (id int);", encoding="utf-8")
+        sql_paths.append(sql_path)
+    monkeypatch.setattr(app.main, "parse_sql_file", _exit_worker)
+    table_spec_dict, errors = parse_sql_files(sql_paths, jobs=2)
+    assert set(table_spec_dict) | {path.stem for path, _ in errors} == {
+        "a",
+        "crash",
+        "b",
+    }
+    assert "crash" in {path.stem for path, _ in errors}
+    assert all("terminated abruptly" in error for _, error in errors)
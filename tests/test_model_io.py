@@ -0,0 +1,153 @@
+import json
+import pickle
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+from typer.testing import CliRunner
+
+import app.parser
+from app.main import app as cli
+from app.model_io import MODEL_VERSION, ModelFileError, dump_model, load_model
+from app.parser import DDLParser
+
+DDL_TEXT = """\
+CREATE TABLE public.orgs (id integer PRIMARY KEY, name text DEFAULT 'x, y');
+CREATE TABLE public.users (
+    id bigint NOT NULL,
+    org_id integer REFERENCES public.orgs (id),
+    email character varying(255) NOT NULL
+);
+COMMENT ON TABLE public.users IS '사용자';
+COMMENT ON COLUMN public.users.email IS 'login';
+ALTER TABLE ONLY public.users ADD CONSTRAINT users_pkey PRIMARY KEY (id);
+CREATE UNIQUE INDEX users_email_idx ON public.users USING btree (email);
+"""
+FRONT_MATTERS = {"schema": {"author": "tester"}, "empty": {}}
+
+
+def table_spec_dict() -> dict:
+    return {"schema": DDLParser(DDL_TEXT).parse_tables(), "empty": []}
+
+
+def as_dicts(table_spec_dict: dict) -> dict:
+    return {
+        source: [table_spec.to_dict() for table_spec in table_list]
+        for source, table_list in table_spec_dict.items()
+    }
+
+
+@pytest.mark.parametrize("suffix", [".json", ".pickle", ".msgpack"])
+def test_round_trip(tmp_path: Path, suffix: str):
+    if suffix == ".msgpack":
+        pytest.importorskip("msgpack")
+    model_path = tmp_path / f"model{suffix}"
+    dump_model(table_spec_dict(), model_path, FRONT_MATTERS)
+    loaded, front_matters = load_model(model_path)
+    assert list(loaded) == ["schema", "empty"]
+    assert as_dicts(loaded) == as_dicts(table_spec_dict())
+    assert front_matters == FRONT_MATTERS
+
+
+def test_msgpack_without_msgpack_installed(tmp_path: Path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    with pytest.raises(ModelFileError, match="pip install msgpack"):
+        dump_model(table_spec_dict(), tmp_path / "model.msgpack")
+
+
+def json_model(tmp_path: Path, change) -> Path:
+    """정상 JSON 모델을 저장한 뒤 change(document) 로 고친 파일"""
+    model_path = tmp_path / "model.json"
+    dump_model(table_spec_dict(), model_path, FRONT_MATTERS)
+    document = json.loads(model_path.read_text(encoding="utf-8"))
+    change(document)
+    model_path.write_text(json.dumps(document), encoding="utf-8")
+    return model_path
+
+
+@pytest.mark.parametrize(
+    ("change", "message"),
+    [
+        (lambda document: document.update(format="other"), "not a ddl2excel"),
+        (
+            lambda document: document.update(version=MODEL_VERSION + 1),
+            "is not supported",
+        ),
+        (lambda document: document["files"][0].pop("tables"), "malformed"),
+        (
+            lambda document: document["files"][0]["tables"][0].pop("table_name"),
+            "malformed",
+        ),
+        (
+            lambda document: document["files"][0].update(meta={"unknown": "x"}),
+            "invalid meta",
+        ),
+    ],
+    ids=["format", "version", "missing tables", "missing table name", "meta"],
+)
+def test_invalid_json_model(tmp_path: Path, change, message: str):
+    with pytest.raises(ModelFileError, match=message):
+        load_model(json_model(tmp_path, change))
+
+
+@pytest.mark.parametrize(
+    ("file_name", "data", "message"),
+    [
+        ("model.txt", b"{}", "unknown model file type"),
+        ("model.json", b"{not json", "not a valid json"),
+        ("model.pickle", b"not a pickle", "not a valid pickle"),
+        ("model.pickle", pickle.dumps(OrderedDict(a=1)), "not a valid pickle"),
+    ],
+    ids=["suffix", "json syntax", "pickle data", "pickle class"],
+)
+def test_unreadable_model(tmp_path: Path, file_name: str, data: bytes, message: str):
+    model_path = tmp_path / file_name
+    model_path.write_bytes(data)
+    with pytest.raises(ModelFileError, match=message):
+        load_model(model_path)
+
+
+def test_pickle_from_other_parser_version(tmp_path: Path, monkeypatch):
+    model_path = tmp_path / "model.pickle"
+    dump_model(table_spec_dict(), model_path)
+    monkeypatch.setattr(app.parser, "PARSER_VERSION", "other")
+    with pytest.raises(ModelFileError, match="parser version"):
+        load_model(model_path)
+
+
+def workbook_values(xlsx_path: Path) -> dict[str, list]:
+    return {
+        ws.title: list(ws.iter_rows(values_only=True))
+        for ws in load_workbook(xlsx_path).worksheets
+    }
+
+
+@pytest.mark.parametrize("suffix", [".json", ".pickle"])
+def test_cli_model_gives_same_workbook(tmp_path: Path, suffix: str):
+    sql_path = tmp_path / "schema.sql"
+    sql_path.write_text(f"-- meta.author: tester\n{DDL_TEXT}", encoding="utf-8")
+    model_path = tmp_path / f"model{suffix}"
+    runner = CliRunner()
+    parsed = runner.invoke(
+        cli,
+        [
+            str(sql_path),
+            str(tmp_path / "parsed.xlsx"),
+            "--no-input",
+            "--no-cache",
+            "--dump-model",
+            str(model_path),
+        ],
+    )
+    assert parsed.exit_code == 0, parsed.output
+    loaded = runner.invoke(
+        cli,
+        [str(tmp_path / "loaded.xlsx"), "--no-input", "--model", str(model_path)],
+    )
+    assert loaded.exit_code == 0, loaded.output
+    expected = workbook_values(tmp_path / "parsed.xlsx")
+    assert workbook_values(tmp_path / "loaded.xlsx") == expected
+    # front-matter 메타 값도 모델 파일에서 옴
+    assert any("tester" in row for rows in expected.values() for row in rows)
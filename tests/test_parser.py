@@ -0,0 +1,220 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from app.model import ColumnSpec, TableSpec
+from app.parser import (
+    DDLParser,
+    TableConstraintMap,
+    iter_parse_ddl_file,
+    parse_ddl_file,
+)
+
+
+def parse_columns(body: str) -> dict[str, ColumnSpec]:
+    (table,) = DDLParser(f"CREATE TABLE public.t (\n{body}\n);").parse_tables()
+    return {column.column_name: column for column in table.columns}
+
+
+@pytest.mark.parametrize(
+    ("definition", "expected_type"),
+    [
+        ("a character varying(100) NOT NULL", "character varying(100)"),
+        ("a timestamp(3) with time zone", "timestamp(3) with time zone"),
+        ("a double precision DEFAULT 0", "double precision"),
+        ("a numeric(10, 2)", "numeric(10, 2)"),
+        ('a varchar(8) COLLATE "C"', "varchar(8)"),
+        ("a integer[]", "integer[]"),
+    ],
+)
+def test_multi_word_types(definition: str, expected_type: str):
+    assert parse_columns(definition)["a"].type == expected_type
+
+
+def test_trailing_default():
+    """마지막 컬럼의 DEFAULT 값도 잘리지 않음"""
+    columns = parse_columns(
+        "created timestamp(3) with time zone DEFAULT now() NOT NULL,\n"
+        "col_1 integer DEFAULT 0"
+    )
+    assert columns["created"].default == "now()"
+    assert columns["created"].nn
+    assert columns["col_1"].default == "0"
+    assert not columns["col_1"].nn
+
+
+@pytest.mark.parametrize(
+    ("definition", "expected_default"),
+    [
+        ("a text DEFAULT NULL", None),
+        ("a character varying(10) DEFAULT NULL::character varying", None),
+        ("a int default null not null", None),
+        ("a numeric(10, 2) DEFAULT NULL :: numeric(10, 2)", None),
+        ("a text DEFAULT 'NULL'", "'NULL'"),
+        ("a text DEFAULT nullif('', '')", "nullif('', '')"),
+    ],
+)
+def test_default_null_means_no_default(definition: str, expected_default):
+    """DEFAULT NULL 은 기본값 없음과 같으므로 빈 칸 (None)"""
+    assert parse_columns(definition)["a"].default == expected_default
+
+
+def test_commas_and_parens_inside_literals():
+    columns = parse_columns(
+        "label text DEFAULT 'a, b (c' NOT NULL, -- comma, paren ( in comment\n"
+        "note text DEFAULT 'it''s, (x' /* ), y */,\n"
+        "next_col integer NOT NULL"
+    )
+    assert list(columns) == ["label", "note", "next_col"]
+    assert columns["label"].default == "'a, b (c'"
+    assert columns["label"].nn
+    assert columns["note"].default == "'it''s, (x'"
+    assert columns["next_col"].type == "integer"
+    assert columns["next_col"].nn
+
+
+def test_not_null_inside_check_is_not_a_column_constraint():
+    columns = parse_columns(
+        "price numeric(10, 2) CHECK (price IS NOT NULL AND price > 0),\n"
+        "qty integer NOT NULL CHECK (qty > 0)"
+    )
+    assert columns["price"].type == "numeric(10, 2)"
+    assert not columns["price"].nn
+    assert columns["qty"].nn
+
+
+def test_inline_references_and_unique():
+    (table,) = DDLParser(
+        "CREATE TABLE public.t (\n"
+        "user_id integer CONSTRAINT fk_user REFERENCES public.users (id),\n"
+        'code varchar(8) COLLATE "C" UNIQUE\n'
+        ");"
+    ).parse_tables()
+    user_id, code = table.columns
+    assert (user_id.ref_table, user_id.ref_column) == ("public.users", "id")
+    assert code.type == "varchar(8)"
+    assert [
+        (index.index_name, index.columns, index.unique) for index in table.indexes
+    ] == [("t_code_key", ["code"], True)]
+
+
+@pytest.mark.parametrize(
+    "ddl_text",
+    [
+        f"CREATE TABLE t (a text DEFAULT 'x{' ' * 40_000}y');",
+        f"CREATE TABLE t (a int {'not ' * 10_000});",
+        f"CREATE TABLE t (a int DEFAULT {'(' * 40_000});",
+        f"CREATE TABLE t (a int {'/* ' * 13_000});",
+    ],
+    ids=["default_spaces", "not_without_null", "unclosed_parens", "unclosed_comments"],
+)
+def test_adversarial_input_parses_in_linear_time(ddl_text: str):
+    """정규식 백트래킹 폭주 방지 (이전 파서는 40k 공백 DEFAULT에 수십 초)"""
+    started = time.perf_counter()
+    DDLParser(ddl_text).parse_tables()
+    assert time.perf_counter() - started < 1.0
+
+
+def index_rows(table: TableSpec) -> list[tuple]:
+    return [
+        (index.index_name, index.columns, index.method, index.unique, index.primary)
+        for index in table.indexes
+    ]
+
+
+def test_constraints_from_alter_table_only():
+    constraints = TableConstraintMap()
+    for statement in [
+        "ALTER TABLE ONLY public.users ADD CONSTRAINT users_pkey PRIMARY KEY (id);",
+        "ALTER TABLE ONLY public.users\n"
+        "    ADD CONSTRAINT users_email_key UNIQUE (email);",
+        "ALTER TABLE ONLY public.users ADD CONSTRAINT users_org_id_fkey "
+        "FOREIGN KEY (org_id) REFERENCES public.orgs(id);",
+    ]:
+        assert constraints.add_statement(statement) == "public.users"
+    (table,) = DDLParser(
+        "CREATE TABLE public.users (id int, email text, org_id int);"
+    ).parse_tables()
+    constraints.attach(table)
+    id_column, email, org_id = table.columns
+    assert (id_column.pk, id_column.nn) == (True, True)
+    assert not email.pk
+    assert (org_id.ref_table, org_id.ref_column) == ("public.orgs", "id")
+    assert index_rows(table) == [
+        ("users_pkey", ["id"], "btree", True, True),
+        ("users_email_key", ["email"], "btree", True, False),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        (
+            "CREATE UNIQUE INDEX users_email_idx ON public.users USING btree (email);",
+            ("users_email_idx", ["email"], "btree", True, False),
+        ),
+        (
+            "CREATE INDEX users_org_idx ON ONLY public.users USING hash (org_id);",
+            ("users_org_idx", ["org_id"], "hash", False, False),
+        ),
+        (
+            "CREATE INDEX ON users (org_id, email);",
+            ("users_org_id_email_idx", ["org_id", "email"], "btree", False, False),
+        ),
+    ],
+)
+def test_create_index(statement: str, expected: tuple):
+    constraints = TableConstraintMap()
+    assert constraints.add_statement(statement) == "public.users"
+    (table,) = DDLParser(
+        "CREATE TABLE users (id int, email text, org_id int);"
+    ).parse_tables()
+    constraints.attach(table)
+    assert index_rows(table) == [expected]
+
+
+@pytest.mark.parametrize(
+    ("create_name", "alter_name", "attached"),
+    [
+        ("users", "public.users", True),
+        ("public.users", "users", True),
+        ('"public"."Users"', "public.users", True),
+        ("sales.users", "sales.users", True),
+        ("sales.users", "users", False),
+        ("users", "sales.users", False),
+    ],
+)
+def test_schema_qualified_and_bare_names(
+    create_name: str, alter_name: str, attached: bool
+):
+    (table,) = DDLParser(
+        f"CREATE TABLE {create_name} (id int);\n"
+        f"ALTER TABLE ONLY {alter_name} ADD CONSTRAINT pk PRIMARY KEY (id);"
+    ).parse_tables()
+    assert table.columns[0].pk is attached
+    assert [index.index_name for index in table.indexes] == (["pk"] if attached else [])
+
+
+def test_stream_yields_tables_with_trailing_constraints(tmp_path: Path):
+    """ALTER TABLE 이 모든 테이블 뒤에 와도 반환 시점에 이미 결합돼 있고 이후 바뀌지 않음"""
+    sql_path = tmp_path / "input.sql"
+    sql_path.write_text(
+        "CREATE TABLE public.orgs (id int);\n"
+        "CREATE TABLE public.users (id int, org_id int);\n"
+        "ALTER TABLE ONLY public.orgs ADD CONSTRAINT orgs_pkey PRIMARY KEY (id);\n"
+        "ALTER TABLE ONLY users ADD CONSTRAINT users_org_id_fkey "
+        "FOREIGN KEY (org_id) REFERENCES public.orgs(id);\n"
+        "CREATE INDEX users_org_idx ON public.users USING btree (org_id);\n",
+        encoding="utf-8",
+    )
+    streamed = iter_parse_ddl_file(sql_path, chunk_size=16)
+    at_yield = [(table, table.to_dict()) for table in streamed]
+    assert [snapshot for _, snapshot in at_yield] == [
+        table.to_dict() for table in parse_ddl_file(sql_path)
+    ]
+    assert [table.to_dict() for table, _ in at_yield] == [
+        snapshot for _, snapshot in at_yield
+    ]
+    assert at_yield[0][1]["indexes"][0]["index_name"] == "orgs_pkey"
+    assert at_yield[1][1]["columns"][1]["ref_table"] == "public.orgs"
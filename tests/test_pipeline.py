@@ -0,0 +1,47 @@
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from app.main import iter_parse_sql_file, parse_sql_files
+from app.pipeline import PipelineParseError, iter_pipeline_tables
+
+PG_DUMP_TEXT = """\
+CREATE TABLE public.orgs (id int);
+CREATE TABLE public.users (id int, org_id int);
+ALTER TABLE ONLY public.orgs ADD CONSTRAINT orgs_pkey PRIMARY KEY (id);
+ALTER TABLE ONLY public.users ADD CONSTRAINT users_org_id_fkey
+    FOREIGN KEY (org_id) REFERENCES public.orgs(id);
+"""
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_pipeline_tables_match_parse(tmp_path: Path, stream: bool):
+    sql_path = tmp_path / "dump.sql"
+    sql_path.write_text(PG_DUMP_TEXT, encoding="utf-8")
+    expected, errors = parse_sql_files([sql_path])
+    assert not errors
+    tables = list(
+        iter_pipeline_tables(
+            parse_sql_files,
+            [sql_path],
+            stream_parse=iter_parse_sql_file if stream else None,
+        )
+    )
+    assert [(source, table.to_dict()) for source, table in tables] == [
+        ("dump", table.to_dict()) for table in expected["dump"]
+    ]
+
+
+def test_pipeline_stream_reports_parse_errors(tmp_path: Path):
+    good_path, bad_path = tmp_path / "good.sql", tmp_path / "bad.sql"
+    good_path.write_text(PG_DUMP_TEXT, encoding="utf-8")
+    bad_path.write_bytes(b"CREATE TABLE a (x int);\n\xff;\n")
+    tables = iter_pipeline_tables(
+        parse_sql_files,
+        [good_path, bad_path],
+        stream_parse=partial(iter_parse_sql_file, prefilter=True),
+    )
+    with pytest.raises(PipelineParseError) as raised:
+        list(tables)
+    assert [path for path, _ in raised.value.errors] == [bad_path]
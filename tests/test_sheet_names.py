@@ -0,0 +1,106 @@
+import re
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.workbook.child import _WorkbookChild
+
+from app.sheet_names import (
+    HASH_SEPARATOR,
+    HASH_SUFFIX_LENGTH,
+    MAX_SHEET_TITLE_LENGTH,
+    SheetNameAllocator,
+    add_sheet,
+)
+
+HASHED_TITLE_REGEX = re.compile(
+    rf"(?P<prefix>.*){re.escape(HASH_SEPARATOR)}[0-9a-f]{{{HASH_SUFFIX_LENGTH}}}"
+)
+
+
+def test_short_unique_keys_are_kept():
+    allocator = SheetNameAllocator()
+    assert allocator.allocate("schema_users") == "schema_users"
+    assert allocator.allocate("schema_users") == "schema_users"
+    assert allocator.names == {"schema_users": "schema_users"}
+
+
+def test_long_keys_sharing_a_prefix_get_distinct_hashed_titles():
+    prefix = "schema_" + "a" * 30
+    keys = [f"{prefix}_orders", f"{prefix}_order_items", f"{prefix}_orders_"]
+    allocator = SheetNameAllocator()
+    titles = [allocator.allocate(key) for key in keys]
+    assert len({title.casefold() for title in titles}) == len(keys)
+    for title in titles:
+        assert len(title) == MAX_SHEET_TITLE_LENGTH
+        m = HASHED_TITLE_REGEX.fullmatch(title)
+        assert m and prefix.startswith(m.group("prefix"))
+
+
+def test_hashed_title_does_not_depend_on_allocation_order():
+    keys = [f"{'x' * 40}_{i}" for i in range(5)]
+    forward, backward = SheetNameAllocator(), SheetNameAllocator()
+    for key in keys:
+        forward.allocate(key)
+    for key in reversed(keys):
+        backward.allocate(key)
+    assert forward.names == backward.names
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("a[b]:c", "a_b__c"),
+        ("x*y?z", "x_y_z"),
+        ("dir/name\\x", "dir_name_x"),
+        ("'quoted'", "quoted"),
+        ("''", "_"),
+    ],
+)
+def test_invalid_characters_are_replaced(key: str, expected: str):
+    assert SheetNameAllocator().allocate(key) == expected
+
+
+def test_case_insensitive_duplicates_and_reserved_names():
+    allocator = SheetNameAllocator(reserved=["Index"])
+    assert allocator.allocate("Users") == "Users"
+    for key in ("users", "INDEX"):
+        title = allocator.allocate(key)
+        assert HASHED_TITLE_REGEX.fullmatch(title).group("prefix") == key
+    assert len({title.casefold() for title in allocator.names.values()}) == 3
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+def test_add_sheet_keeps_allocated_titles(tmp_path: Path, write_only: bool):
+    wb = Workbook(write_only=write_only)
+    if not write_only:
+        wb.remove(wb.active)
+    allocator = SheetNameAllocator()
+    keys = ["users", "Users", "a" * 40, "a" * 40 + "_2", "x[1]"]
+    titles = [allocator.allocate(key) for key in keys]
+    for title in titles:
+        ws = add_sheet(wb, title)
+        assert ws.parent is wb
+        ws.append([title])
+    assert wb.sheetnames == titles
+    xlsx_path = tmp_path / "out.xlsx"
+    wb.save(xlsx_path)
+    assert load_workbook(xlsx_path).sheetnames == titles
+
+
+def test_add_sheet_falls_back_to_create_sheet(monkeypatch):
+    """openpyxl 내부 제목 속성이 바뀌어도 (다른 버전) create_sheet 로 같은 결과"""
+
+    def set_title(ws, value):
+        if ws.parent is not None:
+            ws._renamed_title = value
+
+    monkeypatch.setattr(
+        _WorkbookChild,
+        "title",
+        property(lambda ws: getattr(ws, "_renamed_title", ""), set_title),
+    )
+    wb = Workbook()
+    ws = add_sheet(wb, "users")
+    assert ws.title == "users"
+    assert wb.sheetnames == ["Sheet", "users"]